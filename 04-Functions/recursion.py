@@ -14,11 +14,13 @@ Recursion is often used for:
 Important:
 - Every recursion must have a BASE CASE (stopping condition).
 - Without a base case, recursion will cause infinite calls → leads to RecursionError.
+- Python also raises RecursionError for deep but finite recursion (about 1000 calls).
+  Every function below takes iterative=True to do the same work with a loop.
 
 """
 
 # Example 1: Factorial using recursion
-def factorial(n):
+def factorial(n, iterative=False):
     """
     Calculates factorial of a number using recursion.
     Factorial formula:
@@ -26,13 +28,18 @@ def factorial(n):
     Base case:
         factorial(0) = 1
     """
+    if iterative:
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
     if n == 0:
         return 1  # base case
     return n * factorial(n - 1)  # recursive call
 
 
 # Example 2: Fibonacci sequence using recursion
-def fibonacci(n):
+def fibonacci(n, iterative=False):
     """
     Returns nth Fibonacci number using recursion.
     Fibonacci sequence:
@@ -41,6 +48,11 @@ def fibonacci(n):
         fibonacci(0) = 0
         fibonacci(1) = 1
     """
+    if iterative:
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
     if n == 0:
         return 0
     elif n == 1:
@@ -49,21 +61,30 @@ def fibonacci(n):
 
 
 # Example 3: Sum of list elements using recursion
-def sum_list(lst):
+def sum_list(lst, iterative=False):
     """
     Recursively calculates the sum of a list of numbers.
     Base case: If list has 1 element, return it.
     """
+    if iterative:
+        total = lst[0]
+        for value in lst[1:]:
+            total += value
+        return total
     if len(lst) == 1:
         return lst[0]
     return lst[0] + sum_list(lst[1:])  # recursive call
 
 
 # Example 4: Countdown using recursion
-def countdown(n):
+def countdown(n, iterative=False):
     """
     Recursively counts down from n to 0.
     """
+    if iterative:
+        for i in range(n, -1, -1):
+            print(i)
+        return
     if n < 0:
         return  # base case
     print(n)
@@ -75,3 +96,20 @@ print("Fibonacci of 6:", fibonacci(6))         # 8
 print("Sum of list [1,2,3,4]:", sum_list([1, 2, 3, 4]))  # 10
 print("Countdown from 5:")
 countdown(5)
+
+
+# Example 5: Recursive vs iterative mode
+# Deep inputs crash the recursive version but not the loop.
+big_list = list(range(5000))
+try:
+    sum_list(big_list)
+except RecursionError:
+    print("sum_list(big_list) -> RecursionError")
+print("sum_list(big_list, iterative=True):", sum_list(big_list, iterative=True))
+
+# The loop also skips one function call per step.
+import timeit
+recursive_time = timeit.timeit(lambda: factorial(500), number=1000)
+iterative_time = timeit.timeit(lambda: factorial(500, iterative=True), number=1000)
+print(f"factorial(500): recursive {recursive_time / 1000 * 1e6:.1f} µs/call, "
+      f"iterative {iterative_time / 1000 * 1e6:.1f} µs/call")
@@ -0,0 +1,281 @@
+"""
+array_tree.py
+
+Array-Backed Binary Tree in Python
+----------------------------------
+
+Every TreeNode in trees.py is a separate Python object. For a tree with
+millions of nodes that means millions of objects, each with its own header.
+
+ArrayBinaryTree stores the same tree as three parallel columns, where a node
+is just an integer id (its position in the columns):
+
+    id      0    1    2    3    4    5
+    data   [1,   2,   3,   4,   5,   6]
+    left   [1,   3,   5,  -1,  -1,  -1]      -1 means "no child"
+    right  [2,   4,  -1,  -1,  -1,  -1]
+
+left/right are array.array('q') (8 bytes per entry). With a numeric typecode
+(for example "q" or "d") the data column is an array.array too, and NumPy can
+wrap any column without copying: numpy.frombuffer(tree.data, dtype=tree.typecode).
+
+It has the same traversal API as BinaryTree (printing preorder/inorder/
+postorder/level_order and lazy traverse()) and converts to and from it.
+"""
+
+from array import array
+from collections import deque
+
+from trees import BinaryTree, TreeNode
+
+NO_CHILD = -1
+
+
+class ArrayBinaryTree:
+    def __init__(self, root_data=None, typecode=None):
+        """
+        root_data - value of the root node (None starts an empty tree)
+        typecode  - array.array typecode for numeric data, None for any objects
+        """
+        self.typecode = typecode
+        self.data = array(typecode) if typecode else []
+        self.left = array("q")
+        self.right = array("q")
+        self.root = NO_CHILD
+        if root_data is not None:
+            self.root = self.add_node(root_data)
+
+    def __len__(self):
+        return len(self.data)
+
+    # -----------------------
+    # Building
+    # -----------------------
+    def add_node(self, data):
+        """Append an unlinked node and return its id."""
+        self.data.append(data)
+        self.left.append(NO_CHILD)
+        self.right.append(NO_CHILD)
+        return len(self.data) - 1
+
+    def add_left(self, parent, data):
+        """Create a node as the left child of parent and return its id."""
+        child = self.add_node(data)
+        self.left[parent] = child
+        return child
+
+    def add_right(self, parent, data):
+        """Create a node as the right child of parent and return its id."""
+        child = self.add_node(data)
+        self.right[parent] = child
+        return child
+
+    # -----------------------
+    # Traversals over node ids
+    # -----------------------
+    def _iter_preorder(self, node):
+        left, right = self.left, self.right
+        stack = [node] if node != NO_CHILD else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if right[node] != NO_CHILD:
+                stack.append(right[node])
+            if left[node] != NO_CHILD:
+                stack.append(left[node])
+
+    def _iter_inorder(self, node):
+        left, right = self.left, self.right
+        stack = []
+        while stack or node != NO_CHILD:
+            while node != NO_CHILD:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield node
+            node = right[node]
+
+    def _iter_postorder(self, node):
+        left, right = self.left, self.right
+        stack = []
+        last_visited = NO_CHILD
+        while stack or node != NO_CHILD:
+            while node != NO_CHILD:
+                stack.append(node)
+                node = left[node]
+            top = stack[-1]
+            if right[top] != NO_CHILD and right[top] != last_visited:
+                node = right[top]
+            else:
+                yield top
+                last_visited = stack.pop()
+
+    def _iter_level_order(self, node):
+        left, right = self.left, self.right
+        queue = deque([node]) if node != NO_CHILD else deque()
+        while queue:
+            node = queue.popleft()
+            yield node
+            if left[node] != NO_CHILD:
+                queue.append(left[node])
+            if right[node] != NO_CHILD:
+                queue.append(right[node])
+
+    # -----------------------
+    # Same API as BinaryTree
+    # -----------------------
+    def preorder(self, node):
+        for i in self._iter_preorder(node):
+            print(self.data[i], end=" ")
+
+    def inorder(self, node):
+        for i in self._iter_inorder(node):
+            print(self.data[i], end=" ")
+
+    def postorder(self, node):
+        for i in self._iter_postorder(node):
+            print(self.data[i], end=" ")
+
+    def level_order(self):
+        for i in self._iter_level_order(self.root):
+            print(self.data[i], end=" ")
+
+    def traverse(self, order="inorder"):
+        """
+        Yield node values in the given order:
+        "preorder", "inorder", "postorder" or "level_order".
+        """
+        walkers = {
+            "preorder": self._iter_preorder,
+            "inorder": self._iter_inorder,
+            "postorder": self._iter_postorder,
+            "level_order": self._iter_level_order,
+        }
+        if order not in walkers:
+            raise ValueError(f"unsupported traversal: {order!r}")
+        data = self.data
+        for i in walkers[order](self.root):
+            yield data[i]
+
+    def __iter__(self):
+        return self.traverse()
+
+    # -----------------------
+    # Conversion
+    # -----------------------
+    @classmethod
+    def from_binary_tree(cls, tree, typecode=None):
+        """
+        Copy a pointer-based BinaryTree. Nodes get ids in level order,
+        so parents and children end up close together in the columns.
+        """
+        result = cls(typecode=typecode)
+        if tree.root is None:
+            return result
+        result.root = result.add_node(tree.root.data)
+        queue = deque([(tree.root, result.root)])
+        while queue:
+            node, node_id = queue.popleft()
+            if node.left:
+                queue.append((node.left, result.add_left(node_id, node.left.data)))
+            if node.right:
+                queue.append((node.right, result.add_right(node_id, node.right.data)))
+        return result
+
+    def to_binary_tree(self):
+        """Build the equivalent pointer-based BinaryTree."""
+        nodes = [TreeNode(value) for value in self.data]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NO_CHILD:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NO_CHILD:
+                node.right = nodes[self.right[i]]
+        tree = BinaryTree(None)
+        tree.root = nodes[self.root] if self.root != NO_CHILD else None
+        return tree
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_array_tree(n=10**6):
+    """
+    Memory per node and traversal time of a complete tree with n integer nodes,
+    as TreeNode objects and as ArrayBinaryTree columns.
+    """
+    import time
+    import tracemalloc
+
+    def build_objects():
+        nodes = [TreeNode(i) for i in range(n)]
+        for i in range(n):
+            if 2 * i + 1 < n:
+                nodes[i].left = nodes[2 * i + 1]
+            if 2 * i + 2 < n:
+                nodes[i].right = nodes[2 * i + 2]
+        tree = BinaryTree(None)
+        tree.root = nodes[0]
+        return tree
+
+    def build_arrays():
+        tree = ArrayBinaryTree(typecode="q")
+        tree.data = array("q", range(n))
+        tree.left = array("q", (2 * i + 1 if 2 * i + 1 < n else NO_CHILD for i in range(n)))
+        tree.right = array("q", (2 * i + 2 if 2 * i + 2 < n else NO_CHILD for i in range(n)))
+        tree.root = 0
+        return tree
+
+    print(f"Complete tree with {n:,} nodes:")
+    print(f"{'':<16}{'bytes/node':>12}{'inorder':>10}{'level_order':>13}")
+    for name, build in (("BinaryTree", build_objects), ("ArrayBinaryTree", build_arrays)):
+        tracemalloc.start()
+        tree = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        row = f"{name:<16}{size / n:>12.1f}"
+        for order, width in (("inorder", 10), ("level_order", 13)):
+            start = time.perf_counter()
+            total = sum(tree.traverse(order))
+            elapsed = time.perf_counter() - start
+            assert total == n * (n - 1) // 2
+            row += f"{elapsed:>{width - 1}.3f}s"
+        print(row)
+        del tree
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    # Same tree as in trees.py
+    #          1
+    #        /   \
+    #       2     3
+    #      / \   /
+    #     4   5 6
+    at = ArrayBinaryTree(1, typecode="q")
+    two = at.add_left(at.root, 2)
+    three = at.add_right(at.root, 3)
+    at.add_left(two, 4)
+    at.add_right(two, 5)
+    at.add_left(three, 6)
+
+    print("Pre-order Traversal:")
+    at.preorder(at.root)
+    print("\nIn-order Traversal:")
+    at.inorder(at.root)
+    print("\nPost-order Traversal:")
+    at.postorder(at.root)
+    print("\nLevel-order Traversal:")
+    at.level_order()
+    print("\nColumns: data", at.data.tolist(), "left", at.left.tolist(), "right", at.right.tolist())
+
+    bt = at.to_binary_tree()
+    print("Back to BinaryTree, in-order:", list(bt.traverse("inorder")))
+    print("Round trip equal?", list(ArrayBinaryTree.from_binary_tree(bt).traverse("preorder"))
+          == list(at.traverse("preorder")))
+
+    if "--bench" in sys.argv:
+        benchmark_array_tree()
@@ -4,6 +4,12 @@ arrays_basics.py
 Basic operations on arrays (lists in Python).
 
 In Python, we use lists to simulate arrays.
+
+list.insert / list.pop(i) in the middle shift every later element (O(n)).
+chunked_array.py has a ChunkedArray with the same operations that only
+shifts one small chunk, for arrays that are edited in the middle a lot.
+typed_array.py has a TypedArray that stores plain numbers in an array.array
+(8 bytes each instead of a pointer plus an int object), with NumPy interop.
 """
 
 # Creating an array (list in Python)
@@ -0,0 +1,289 @@
+"""
+chunked_array.py
+
+Chunked Dynamic Array in Python
+-------------------------------
+
+arrays.py uses a plain list. Inserting or deleting in the middle of a list
+shifts every element after that position, which is O(n).
+
+ChunkedArray keeps the elements in a list of small lists ("chunks") of about
+`load` elements each, like the blocked lists used by sortedcontainers:
+
+    chunks:   [10, 20, 30] [40, 50, 60] [70, 80]
+    offsets:   0            3            6       <- index of each chunk's first element
+
+- Indexing: bisect the offsets to find the chunk, then index inside it
+- Insert/delete: only one small chunk shifts; chunks split when they grow past
+  2 * load and merge with a neighbour when they shrink below load / 2
+- Offsets after a change are rebuilt lazily, with itertools.accumulate (in C)
+
+Time Complexity (n elements, load ~ sqrt(n) or a constant like 1000):
+    a[i], a[i] = x       O(log(n / load))
+    insert / pop(i)      O(load + n / load)
+    append / extend      O(1) amortized per element
+"""
+
+from bisect import bisect_right
+from itertools import accumulate, chain, islice
+
+DEFAULT_LOAD = 1000
+
+
+class ChunkedArray:
+    def __init__(self, iterable=(), load=DEFAULT_LOAD):
+        if load < 2:
+            raise ValueError("load must be at least 2")
+        self._load = load
+        self._chunks = []
+        self._offsets = []  # Only the leading offsets that are still valid
+        self._len = 0
+        self.extend(iterable)
+
+    # -----------------------
+    # Locating positions
+    # -----------------------
+    def _refresh(self):
+        """Compute the missing offsets, from the first stale chunk to the end."""
+        chunks, offsets = self._chunks, self._offsets
+        done = len(offsets)
+        start = offsets[-1] + len(chunks[done - 1]) if done else 0
+        offsets.extend(accumulate(map(len, chunks[done:-1]), initial=start))
+
+    def _locate(self, index):
+        """(chunk number, position inside the chunk) for a list-style index."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ChunkedArray index out of range")
+        if len(self._offsets) < len(self._chunks):
+            self._refresh()
+        k = bisect_right(self._offsets, index) - 1
+        return k, index - self._offsets[k]
+
+    def _mark(self, k):
+        """Forget the offsets of chunk k and everything after it."""
+        del self._offsets[k:]
+
+    def _split(self, k):
+        """Split chunk k in two if it has grown past 2 * load."""
+        chunk = self._chunks[k]
+        if len(chunk) > 2 * self._load:
+            half = len(chunk) // 2
+            self._chunks[k:k + 1] = [chunk[:half], chunk[half:]]
+            self._mark(k + 1)
+
+    def _shrink(self, k):
+        """After a delete in chunk k: drop it if empty, merge it if small."""
+        chunks = self._chunks
+        chunk = chunks[k]
+        if not chunk:
+            del chunks[k]
+        elif len(chunk) < self._load // 2 and len(chunks) > 1:
+            if k + 1 < len(chunks):
+                chunk.extend(chunks.pop(k + 1))
+            else:
+                chunks[k - 1].extend(chunks.pop(k))
+                k -= 1
+            self._split(k)
+        self._mark(k)
+
+    # -----------------------
+    # The operations from arrays.py
+    # -----------------------
+    def append(self, value):
+        if not self._chunks:
+            self._chunks.append([value])
+        else:
+            self._chunks[-1].append(value)
+            self._split(len(self._chunks) - 1)
+        self._len += 1
+
+    def extend(self, iterable):
+        """Add many values: top up the last chunk, then add whole new chunks."""
+        values = list(iterable)
+        if not values:
+            return
+        load, chunks = self._load, self._chunks
+        start = 0
+        if chunks and len(chunks[-1]) < load:
+            start = load - len(chunks[-1])
+            chunks[-1].extend(values[:start])
+        self._mark(len(chunks))
+        chunks.extend(values[i:i + load] for i in range(start, len(values), load))
+        self._len += len(values)
+
+    def insert(self, index, value):
+        """Insert before index (clamped like list.insert)."""
+        if index < 0:
+            index = max(0, index + self._len)
+        if index >= self._len:
+            self.append(value)
+            return
+        k, j = self._locate(index)
+        self._chunks[k].insert(j, value)
+        self._len += 1
+        self._mark(k + 1)
+        self._split(k)
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty ChunkedArray")
+        k, j = self._locate(index)
+        value = self._chunks[k].pop(j)
+        self._len -= 1
+        self._mark(k + 1)
+        self._shrink(k)
+        return value
+
+    def remove(self, value):
+        """Remove the first occurrence of value (ValueError if missing)."""
+        for k, chunk in enumerate(self._chunks):
+            if value in chunk:
+                chunk.remove(value)
+                self._len -= 1
+                self._mark(k + 1)
+                self._shrink(k)
+                return
+        raise ValueError("ChunkedArray.remove(x): x not in array")
+
+    def index(self, value):
+        if len(self._offsets) < len(self._chunks):
+            self._refresh()
+        for k, chunk in enumerate(self._chunks):
+            if value in chunk:
+                return self._offsets[k] + chunk.index(value)
+        raise ValueError(f"{value!r} is not in ChunkedArray")
+
+    def __contains__(self, value):
+        return any(value in chunk for chunk in self._chunks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step < 0:
+                return ChunkedArray(list(self)[index], self._load)
+            if start >= stop:
+                return ChunkedArray((), self._load)
+            k, j = self._locate(start)
+            values = islice(chain(self._chunks[k][j:], chain.from_iterable(self._chunks[k + 1:])),
+                            0, stop - start, step)
+            return ChunkedArray(values, self._load)
+        k, j = self._locate(index)
+        return self._chunks[k][j]
+
+    def __setitem__(self, index, value):
+        k, j = self._locate(index)
+        self._chunks[k][j] = value
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    def sort(self, key=None, reverse=False):
+        values = list(self)
+        values.sort(key=key, reverse=reverse)
+        self._chunks = []
+        self._offsets = []
+        self._len = 0
+        self.extend(values)
+
+    def reverse(self):
+        self._chunks.reverse()
+        for chunk in self._chunks:
+            chunk.reverse()
+        self._mark(1)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._chunks)
+
+    def __eq__(self, other):
+        if isinstance(other, (ChunkedArray, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ChunkedArray({list(self)})"
+
+    def tolist(self):
+        return list(self)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_chunked_array(n=10**6, ops=20_000):
+    """
+    Mixed workload on n elements: random inserts, pops, reads and writes
+    (one quarter each), for a list and a ChunkedArray.
+    """
+    import random
+    import time
+
+    plan = []
+    size = n
+    for _ in range(ops):
+        kind = random.randrange(4)
+        if kind == 1:
+            size -= 1
+        plan.append((kind, random.randrange(size)))
+        if kind == 0:
+            size += 1
+
+    def run(container):
+        start = time.perf_counter()
+        for kind, i in plan:
+            if kind == 0:
+                container.insert(i, i)
+            elif kind == 1:
+                container.pop(i)
+            elif kind == 2:
+                container[i]
+            else:
+                container[i] = -i
+        return time.perf_counter() - start
+
+    plain = list(range(n))
+    chunked = ChunkedArray(range(n))
+    print(f"{ops:,} mixed operations on {n:,} elements:")
+    list_time = run(plain)
+    chunked_time = run(chunked)
+    print(f"  list          {list_time:>8.3f}s")
+    print(f"  ChunkedArray  {chunked_time:>8.3f}s")
+    assert chunked == plain
+
+    start = time.perf_counter()
+    ChunkedArray(range(n)).extend(range(n))
+    print(f"  ChunkedArray bulk build + extend of {n:,}: {time.perf_counter() - start:.3f}s")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    # The same steps as arrays.py (small load so the chunks are visible)
+    arr = ChunkedArray([10, 20, 30, 40, 50], load=2)
+    print("Initial array:", arr)
+    print("First element:", arr[0])
+    print("Last element:", arr[-1])
+    arr.append(60)
+    arr.insert(2, 25)
+    print("After append and insert:", arr)
+    arr.remove(40)
+    print("Deleted value at index 3:", arr.pop(3))
+    arr[1] = 22
+    print("After updates:", arr)
+    print("Chunks:", arr._chunks)
+    print("30 in array?", 30 in arr)
+    print("Slice [1:4]:", arr[1:4])
+    arr.sort()
+    print("Sorted array:", arr)
+    arr.reverse()
+    print("Reversed array:", arr)
+
+    if "--bench" in sys.argv:
+        benchmark_chunked_array()
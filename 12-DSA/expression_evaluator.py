@@ -0,0 +1,348 @@
+"""
+expression_evaluator.py
+
+Expression Evaluator on a Stack
+-------------------------------
+
+Evaluates formulas like "price * qty * (1 - discount) + max(shipping, 5)"
+in two steps, both built on StackDeque from stacks.py:
+
+1. Compile (shunting-yard algorithm):
+    - Read the infix tokens left to right
+    - Numbers and variables go straight to the output
+    - Operators wait on a stack until an operator with lower precedence
+      (or a closing parenthesis) arrives
+    - The output is Reverse Polish Notation (RPN):
+          price * (1 - discount)   ->   price 1 discount - *
+
+2. Evaluate RPN:
+    - Numbers and variables are pushed on a value stack
+    - An operator pops its operands and pushes the result
+
+Compiling is the expensive part, so compile_expression caches compiled
+formulas: evaluating the same formula for many bindings parses it once.
+evaluate_batch runs a compiled formula over whole NumPy columns, one
+vectorized operation per RPN step instead of one Python loop per row.
+
+Operators: + - * / % ^ (or **), unary -, parentheses
+Functions: abs, min, max, sqrt, exp, log
+
+Time Complexity: compile O(t), evaluate O(t) for t tokens
+"""
+
+import math
+import operator
+import re
+from functools import lru_cache
+
+from stacks import StackDeque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# symbol: (precedence, right associative, function)
+OPERATORS = {
+    "+": (1, False, operator.add),
+    "-": (1, False, operator.sub),
+    "*": (2, False, operator.mul),
+    "/": (2, False, operator.truediv),
+    "%": (2, False, operator.mod),
+    "neg": (3, True, operator.neg),  # Unary minus: -x^2 is -(x^2)
+    "^": (4, True, operator.pow),
+}
+
+# name: (number of arguments, function for numbers, function for NumPy arrays)
+FUNCTIONS = {
+    "abs": (1, abs, abs),
+    "min": (2, min, np.minimum if np else None),
+    "max": (2, max, np.maximum if np else None),
+    "sqrt": (1, math.sqrt, np.sqrt if np else None),
+    "exp": (1, math.exp, np.exp if np else None),
+    "log": (1, math.log, np.log if np else None),
+}
+
+TOKEN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|([A-Za-z_]\w*)|(\*\*|[-+*/%^(),]))")
+
+
+# -----------------------
+# 1. Tokenizer
+# -----------------------
+def tokenize(text):
+    """Split text into ("num", value), ("name", name) and ("sym", symbol) tokens."""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN.match(text, pos)
+        if not match:
+            raise ValueError(f"unexpected character {text[pos:].lstrip()[0]!r} in {text!r}")
+        number, name, symbol = match.groups()
+        if number:
+            tokens.append(("num", float(number) if any(c in number for c in ".eE") else int(number)))
+        elif name:
+            tokens.append(("name", name))
+        else:
+            tokens.append(("sym", "^" if symbol == "**" else symbol))
+        pos = match.end()
+    return tokens
+
+
+# -----------------------
+# 2. Shunting-yard: infix -> RPN
+# -----------------------
+def to_rpn(text):
+    """
+    Compile an infix formula to a tuple of RPN steps:
+        ("num", value), ("var", name), ("op", symbol) or ("fn", name)
+    Raises ValueError for malformed formulas.
+    """
+    output = []
+    ops = StackDeque()
+    args = StackDeque()  # Per open "(": argument count of a function call, None for grouping
+    arg_counts = []  # Argument count of every ("fn", name) step, in output order
+    previous = None  # Last token, to spot "f()"
+    expect_operand = True  # False right after a number, a variable or ")"
+    tokens = tokenize(text)
+    for i, (kind, value) in enumerate(tokens):
+        if kind in ("num", "name") or value == "(":
+            if not expect_operand:
+                raise ValueError(f"missing operator before {value!r} in {text!r}")
+        elif value in (")", ",") and expect_operand:
+            if not (value == ")" and previous == ("sym", "(") and args.peek() is not None):
+                raise ValueError(f"missing operand before {value!r} in {text!r}")
+        if kind == "num":
+            output.append(("num", value))
+            expect_operand = False
+        elif kind == "name":
+            if i + 1 < len(tokens) and tokens[i + 1] == ("sym", "("):
+                if value not in FUNCTIONS:
+                    raise ValueError(f"unknown function {value!r}")
+                ops.push(("fn", value))
+            else:
+                output.append(("var", value))
+                expect_operand = False
+        elif value == "(":
+            call = previous is not None and previous[0] == "name" and ops.peek() == ("fn", previous[1])
+            args.push(1 if call else None)
+            ops.push(("sym", "("))
+        elif value in (")", ","):
+            while not ops.is_empty() and ops.peek() != ("sym", "("):
+                output.append(ops.pop())
+            if ops.is_empty():
+                raise ValueError(f"mismatched {value!r} in {text!r}")
+            if value == ",":
+                count = args.pop()
+                if count is None:
+                    raise ValueError(f"',' outside a function call in {text!r}")
+                args.push(count + 1)
+                expect_operand = True
+            else:
+                ops.pop()
+                count = args.pop()
+                if not ops.is_empty() and ops.peek()[0] == "fn":
+                    output.append(ops.pop())
+                    arg_counts.append(0 if previous == ("sym", "(") else count)
+                expect_operand = False
+        elif expect_operand:
+            # A prefix operator has no left operand yet, so it never pops anything
+            if value == "-":
+                ops.push(("op", "neg"))
+            elif value != "+":
+                raise ValueError(f"operator {value!r} is missing its left operand")
+        else:
+            precedence, right_assoc, _ = OPERATORS[value]
+            while not ops.is_empty() and ops.peek()[0] == "op":
+                top_precedence = OPERATORS[ops.peek()[1]][0]
+                if top_precedence > precedence or (top_precedence == precedence and not right_assoc):
+                    output.append(ops.pop())
+                else:
+                    break
+            ops.push(("op", value))
+            expect_operand = True
+        previous = (kind, value)
+    if expect_operand and tokens:
+        raise ValueError(f"missing operand at the end of {text!r}")
+
+    while not ops.is_empty():
+        step = ops.pop()
+        if step == ("sym", "("):
+            raise ValueError(f"mismatched '(' in {text!r}")
+        output.append(step)
+    _check(output, text, arg_counts)
+    return tuple(output)
+
+
+def _arity(step):
+    kind, value = step
+    if kind == "op":
+        return 1 if value == "neg" else 2
+    if kind == "fn":
+        return FUNCTIONS[value][0]
+    return 0
+
+
+def _check(rpn, text, arg_counts):
+    """
+    Make sure every function got as many arguments as it takes, every step
+    has enough operands and exactly one value is left.
+    """
+    counts = iter(arg_counts)
+    depth = 0
+    for step in rpn:
+        arity = _arity(step)
+        if step[0] == "fn":
+            given = next(counts)
+            if given != arity:
+                raise ValueError(f"{step[1]}() takes {arity} argument(s), got {given} in {text!r}")
+        if depth < arity:
+            raise ValueError(f"missing operand in {text!r}")
+        depth += 1 - arity
+    if depth != 1:
+        raise ValueError(f"malformed expression {text!r}")
+
+
+# -----------------------
+# 3. Compiled expressions
+# -----------------------
+class CompiledExpression:
+    __slots__ = ("source", "rpn", "variables")
+
+    def __init__(self, source):
+        self.source = source
+        self.rpn = to_rpn(source)
+        self.variables = tuple(dict.fromkeys(value for kind, value in self.rpn if kind == "var"))
+
+    def evaluate(self, bindings=None, **kwargs):
+        """Evaluate with variables from a dict and/or keyword arguments."""
+        if bindings is None:
+            bindings = kwargs
+        elif kwargs:
+            bindings = {**bindings, **kwargs}
+        return self._run(bindings, vectorized=False)
+
+    __call__ = evaluate
+
+    def evaluate_batch(self, columns):
+        """
+        Evaluate once per row of equal-length columns (dict of name -> column).
+        With NumPy every step works on whole columns and a NumPy array is
+        returned; without it the rows are evaluated one by one into a list.
+        """
+        if np is None:
+            names = self.variables
+            if not names:  # A formula without variables: one value per row
+                length = len(next(iter(columns.values()))) if columns else 1
+                return [self._run({}, vectorized=False)] * length
+            rows = zip(*(columns[name] for name in names))
+            return [self._run(dict(zip(names, row)), vectorized=False) for row in rows]
+        arrays = {name: np.asarray(columns[name], dtype=float) for name in self.variables}
+        result = self._run(arrays, vectorized=True)
+        if np.ndim(result) == 0:  # A formula without variables
+            length = len(next(iter(columns.values()))) if columns else 1
+            return np.full(length, result, dtype=float)
+        return result
+
+    def _run(self, bindings, vectorized):
+        stack = StackDeque()
+        push, pop = stack.push, stack.pop
+        for kind, value in self.rpn:
+            if kind == "num":
+                push(value)
+            elif kind == "var":
+                push(bindings[value])
+            elif kind == "op":
+                if value == "neg":
+                    push(-pop())
+                else:
+                    right = pop()
+                    push(OPERATORS[value][2](pop(), right))
+            else:
+                arity, scalar, vector = FUNCTIONS[value]
+                args = [pop() for _ in range(arity)][::-1]
+                push((vector if vectorized else scalar)(*args))
+        return pop()
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(text):
+    """Compile text once; later calls with the same text return the cached result."""
+    return CompiledExpression(text)
+
+
+def evaluate(text, bindings=None, **kwargs):
+    """Compile (cached) and evaluate text in one call."""
+    return compile_expression(text).evaluate(bindings, **kwargs)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_expressions(rows=10**5, formula="price * qty * (1 - discount) + max(shipping, 5)"):
+    """
+    Evaluate one pricing formula for `rows` bindings:
+    parsing every time, reusing the cached compiled formula, and one
+    evaluate_batch call over NumPy columns.
+    """
+    import random
+    import time
+
+    columns = {
+        "price": [random.uniform(1, 100) for _ in range(rows)],
+        "qty": [random.randrange(1, 10) for _ in range(rows)],
+        "discount": [random.random() / 2 for _ in range(rows)],
+        "shipping": [random.uniform(0, 10) for _ in range(rows)],
+    }
+    bindings = [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def timed(run):
+        start = time.perf_counter()
+        result = run()
+        return time.perf_counter() - start, result
+
+    print(f"{formula!r} over {rows:,} rows:")
+    parse_time, slow = timed(lambda: [CompiledExpression(formula).evaluate(b) for b in bindings])
+    print(f"  {'parse every row':<24}{parse_time:>8.3f}s")
+    compiled = compile_expression(formula)
+    cached_time, fast = timed(lambda: [compiled.evaluate(b) for b in bindings])
+    print(f"  {'cached compile':<24}{cached_time:>8.3f}s")
+    assert slow == fast
+    if np is not None:
+        arrays = {name: np.array(values) for name, values in columns.items()}
+        batch_time, batch = timed(lambda: compiled.evaluate_batch(arrays))
+        print(f"  {'evaluate_batch (NumPy)':<24}{batch_time:>8.3f}s")
+        assert np.allclose(batch, fast)
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    formula = "price * qty * (1 - discount) + max(shipping, 5)"
+    print("RPN:", " ".join(str(value) for _, value in to_rpn(formula)))
+    price = compile_expression(formula)
+    print("Variables:", price.variables)
+    print("Price:", price(price=20, qty=3, discount=0.25, shipping=2))
+    print("Same object from the cache?", compile_expression(formula) is price)
+    print("2 ^ 3 ^ 2 =", evaluate("2 ^ 3 ^ 2"))
+    print("-x ** 2 with x = 3:", evaluate("-x ** 2", x=3))
+
+    if np is not None:
+        columns = {"price": np.array([10.0, 20.0]), "qty": np.array([1, 2]),
+                   "discount": np.array([0.0, 0.5]), "shipping": np.array([9.0, 1.0])}
+        print("Batch:", price.evaluate_batch(columns).tolist())
+
+    for bad in ("(1 + 2", "(1, 2) + min(3)", "min(1, 2, 3) * max(4)", "1 2 +", "price qty * +", "2 * -"):
+        try:
+            to_rpn(bad)
+        except ValueError as error:
+            print("Error:", error)
+
+    if "--bench" in sys.argv:
+        benchmark_expressions()
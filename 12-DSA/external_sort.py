@@ -0,0 +1,242 @@
+"""
+external_sort.py
+
+External Merge Sort in Python
+-----------------------------
+
+The sorts in sorting_algorithms.py need the whole list in memory. When the data
+is bigger than RAM we sort it in two phases:
+
+1. Split phase:
+    - Read the input in memory-bounded runs
+    - Sort each run in a worker process (ProcessPoolExecutor)
+    - Spill every sorted run to a temporary file
+
+2. Merge phase:
+    - Open at most fan_in run files at once (each holds one block in memory)
+    - k-way merge them with a heap (heapq.merge) into a new, longer run
+    - Repeat until at most fan_in runs are left, then merge those while
+      yielding one record at a time
+
+fan_in is chosen so the open blocks fit in memory_limit and the open files
+stay well below the process's file descriptor limit (at most MAX_FAN_IN).
+Memory use is bounded by memory_limit, not by the size of the input.
+Time Complexity: O(n log n) comparisons, O(n) disk reads and writes per
+phase (plus one more per extra merge pass: log_fan_in(runs) - 1 of them)
+"""
+
+import heapq
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024  # 64 MB
+BLOCK_SIZE = 1000  # Records pickled together when spilling a run
+MAX_FAN_IN = 128  # Most run files merged at once
+
+
+# -----------------------
+# 1. Run files
+# -----------------------
+def _write_run(records, run_dir):
+    """
+    Pickle sorted records (any iterable) to a new file in run_dir and return its path.
+    """
+    records = iter(records)
+    fd, path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+    with os.fdopen(fd, "wb") as f:
+        while True:
+            block = list(islice(records, BLOCK_SIZE))
+            if not block:
+                break
+            pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _sort_run(records, key, reverse, run_dir):
+    """
+    Worker job: sort one run and spill it to disk.
+    """
+    records.sort(key=key, reverse=reverse)
+    return _write_run(records, run_dir)
+
+
+def _read_run(path):
+    """
+    Stream the records of a run file back, one block in memory at a time.
+    """
+    with open(path, "rb") as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def _split_runs(records, run_bytes):
+    """
+    Group records into lists whose (approximate) size stays under run_bytes.
+    Sizes come from sys.getsizeof, so nested objects are under-counted.
+    """
+    run = []
+    size = 0
+    for record in records:
+        run.append(record)
+        size += sys.getsizeof(record)
+        if size >= run_bytes:
+            yield run
+            run = []
+            size = 0
+    if run:
+        yield run
+
+
+def _fan_in(memory_limit, record_bytes):
+    """
+    How many run files to merge at once: one block of BLOCK_SIZE records per
+    open run must fit in memory_limit, and the open files must stay below
+    half the file descriptor limit. Never less than 2.
+    """
+    by_memory = memory_limit // max(1, record_bytes * BLOCK_SIZE)
+    by_files = MAX_FAN_IN
+    if resource is not None:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY:
+            by_files = soft // 2
+    return max(2, min(MAX_FAN_IN, by_memory, by_files))
+
+
+def _merge_runs(paths, key, reverse):
+    """Records of the sorted run files, merged into one sorted stream."""
+    # Runs are merged in input order, so heapq.merge keeps the sort stable
+    return heapq.merge(*(_read_run(path) for path in paths), key=key, reverse=reverse)
+
+
+def _merge_passes(paths, fan_in, key, reverse, run_dir):
+    """
+    Merge neighbouring groups of fan_in runs into longer runs until at most
+    fan_in are left. Neighbours keep their input order, so stability holds.
+    """
+    while len(paths) > fan_in:
+        merged = []
+        for start in range(0, len(paths), fan_in):
+            group = paths[start:start + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            merged.append(_write_run(_merge_runs(group, key, reverse), run_dir))
+            for path in group:
+                os.remove(path)
+        paths = merged
+    return paths
+
+
+# -----------------------
+# 2. External Sort
+# -----------------------
+def external_sort(records, key=None, reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  max_workers=None, temp_dir=None, fan_in=None):
+    """
+    Sort an iterable that may not fit in memory and yield the records in order.
+
+    records      - any iterable of picklable records (e.g. lines of a file)
+    key/reverse  - same meaning as in sorted(); key must be picklable
+                   (a module-level function, not a lambda) when max_workers > 1
+    memory_limit - rough budget in bytes for records held in memory at once
+    max_workers  - worker processes for the split phase (default: CPU count);
+                   1 sorts the runs in this process
+    temp_dir     - where run files are spilled (default: system temp dir)
+    fan_in       - most run files open at once while merging (default:
+                   from memory_limit and the file descriptor limit, see _fan_in)
+
+    The sort is stable, like sorted().
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    # Each in-flight run is held by this process and by one worker
+    run_bytes = max(1, memory_limit // (max_workers + 1))
+    runs = _split_runs(iter(records), run_bytes)
+
+    first = next(runs, None)
+    if first is None:
+        return
+    second = next(runs, None)
+    if second is None:
+        # Everything fits in one run, no need to touch the disk
+        first.sort(key=key, reverse=reverse)
+        yield from first
+        return
+
+    if fan_in is None:
+        # Average record size, from a run that just reached run_bytes
+        fan_in = _fan_in(memory_limit, run_bytes // len(first) + 1)
+    elif fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    run_dir = tempfile.mkdtemp(prefix="external_sort_", dir=temp_dir)
+    try:
+        paths = []
+        pending_runs = chain((first, second), runs)
+        if max_workers == 1:
+            for run in pending_runs:
+                paths.append(_sort_run(run, key, reverse, run_dir))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = []
+                for run in pending_runs:
+                    futures.append(pool.submit(_sort_run, run, key, reverse, run_dir))
+                    # Backpressure: wait for the oldest job before reading more input
+                    if len(futures) - len(paths) >= max_workers:
+                        paths.append(futures[len(paths)].result())
+                for future in futures[len(paths):]:
+                    paths.append(future.result())
+
+        paths = _merge_passes(paths, fan_in, key, reverse, run_dir)
+        yield from _merge_runs(paths, key, reverse)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def sort_file(input_path, output_path, key=None, reverse=False, memory_limit=DEFAULT_MEMORY_LIMIT,
+              max_workers=None, temp_dir=None, encoding="utf-8", fan_in=None):
+    """
+    Sort the lines of a text file into output_path using external_sort.
+    """
+    with open(input_path, "r", encoding=encoding) as src:
+        lines = (line if line.endswith("\n") else line + "\n" for line in src)
+        with open(output_path, "w", encoding=encoding) as dst:
+            dst.writelines(external_sort(lines, key=key, reverse=reverse, memory_limit=memory_limit,
+                                         max_workers=max_workers, temp_dir=temp_dir, fan_in=fan_in))
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import random
+    import time
+
+    # A tiny memory limit forces many runs even for a small demo
+    data = [random.randint(0, 10**6) for _ in range(200_000)]
+    start = time.perf_counter()
+    result = list(external_sort(data, memory_limit=1024 * 1024, max_workers=4))
+    print(f"External sort of {len(data)} numbers: {time.perf_counter() - start:.3f}s")
+    print("Matches sorted()?", result == sorted(data))
+
+    # Sorting a text file line by line
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "records.txt")
+        dst = os.path.join(tmp, "records_sorted.txt")
+        with open(src, "w") as f:
+            f.writelines(f"user{random.randint(0, 9999):04d}\n" for _ in range(50_000))
+        sort_file(src, dst, memory_limit=256 * 1024)
+        with open(dst) as f:
+            print("First sorted lines:", [next(f).strip() for _ in range(3)])
@@ -0,0 +1,577 @@
+"""
+graphs.py
+
+Graphs in Python: CSR Adjacency, BFS, DFS, Dijkstra & A*
+--------------------------------------------------------
+
+A graph has n nodes (numbered 0 .. n-1) and m edges. The usual Python
+adjacency list, {node: [neighbours]}, keeps a list object per node and an int
+object per edge. CSR (Compressed Sparse Row) keeps every edge in flat arrays:
+
+    edges    0->1  0->2  1->2  2->0  2->3
+
+    indptr   [0, 2, 3, 5, 5]      neighbours of u: indices[indptr[u]:indptr[u + 1]]
+    indices  [1, 2, 2, 0, 3]
+    weights  [...]                 optional, same positions as indices
+
+That is 8 bytes per edge (16 with weights), and the neighbours of a node sit
+next to each other in memory. CSRGraph is built once from an edge list with a
+counting sort on the source node, O(n + m), and is read-only afterwards.
+
+Algorithms (reusing the containers from this folder):
+    bfs      - QueueDeque (queues.py): hop distances and parents     O(n + m)
+    dfs      - StackDeque (stacks.py): visit order, no recursion     O(n + m)
+    dijkstra - BinaryHeapQueue (priority_queues.py): shortest paths  O((n + m) log n)
+    astar    - the same heap, ordered by distance so far + heuristic
+
+load_csv reads "source,target[,weight]" edge lists in bulk (np.loadtxt when
+NumPy is installed, the csv module otherwise).
+"""
+
+import csv
+import math
+from array import array
+from itertools import accumulate, islice, repeat
+
+from priority_queues import BinaryHeapQueue
+from queues import QueueDeque
+from stacks import StackDeque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+NO_PARENT = -1
+
+
+def _to_array(typecode, values):
+    """array.array copy of a list, array.array or NumPy array."""
+    if np is not None and isinstance(values, np.ndarray):
+        result = array(typecode)
+        result.frombytes(memoryview(np.ascontiguousarray(values, dtype=typecode)).cast("B"))
+        return result
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+# -----------------------
+# 1. CSR Graph
+# -----------------------
+class CSRGraph:
+    """
+    Read-only graph in CSR form. Build it with from_edges, from_arrays or
+    load_csv. An undirected graph stores every edge in both directions, so
+    num_edges counts each of them twice.
+    """
+
+    def __init__(self, indptr, indices, weights=None, directed=True):
+        self.indptr = indptr  # array("q"), num_nodes + 1 entries
+        self.indices = indices  # array("q"), one target per edge
+        self.weights = weights  # array("d") or None
+        self.directed = directed
+        self._min_weight = None  # Computed on first use by dijkstra / astar
+
+    @classmethod
+    def from_edges(cls, edges, num_nodes=None, directed=True):
+        """Build from (u, v) or (u, v, weight) tuples."""
+        sources, targets, weights = array("q"), array("q"), array("d")
+        for edge in edges:
+            sources.append(edge[0])
+            targets.append(edge[1])
+            if len(edge) > 2:
+                weights.append(edge[2])
+        if weights and len(weights) != len(sources):
+            raise ValueError("either every edge or no edge needs a weight")
+        return cls.from_arrays(sources, targets, weights or None, num_nodes, directed)
+
+    @classmethod
+    def from_arrays(cls, sources, targets, weights=None, num_nodes=None, directed=True):
+        """
+        Build from parallel columns: edge i goes from sources[i] to targets[i].
+        Columns can be lists, array.array or NumPy arrays. num_nodes defaults
+        to the largest node id + 1.
+        """
+        m = len(sources)
+        if len(targets) != m or (weights is not None and len(weights) != m):
+            raise ValueError("sources, targets and weights must have the same length")
+        if np is not None:
+            return cls._from_numpy(sources, targets, weights, num_nodes, directed)
+
+        sources, targets = _to_array("q", sources), _to_array("q", targets)
+        if weights is not None:
+            weights = _to_array("d", weights)
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+            if weights is not None:
+                weights = weights + weights
+        lo = min(min(sources, default=0), min(targets, default=0))
+        hi = max(max(sources, default=-1), max(targets, default=-1))
+        n = _check_ids(num_nodes, lo, hi)
+
+        # Counting sort by source: degrees -> start offsets -> place every edge
+        degree = [0] * n
+        for u in sources:
+            degree[u] += 1
+        indptr = array("q", accumulate(degree, initial=0))
+        slot = indptr.tolist()
+        indices = array("q", bytes(8 * len(sources)))
+        if weights is None:
+            for u, v in zip(sources, targets):
+                indices[slot[u]] = v
+                slot[u] += 1
+            return cls(indptr, indices, None, directed)
+        ordered = array("d", bytes(8 * len(sources)))
+        for u, v, w in zip(sources, targets, weights):
+            pos = slot[u]
+            indices[pos] = v
+            ordered[pos] = w
+            slot[u] = pos + 1
+        return cls(indptr, indices, ordered, directed)
+
+    @classmethod
+    def _from_numpy(cls, sources, targets, weights, num_nodes, directed):
+        src = np.asarray(sources, dtype=np.int64)
+        dst = np.asarray(targets, dtype=np.int64)
+        w = None if weights is None else np.asarray(weights, dtype=np.float64)
+        if not directed:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            if w is not None:
+                w = np.concatenate((w, w))
+        if len(src):
+            n = _check_ids(num_nodes, int(min(src.min(), dst.min())), int(max(src.max(), dst.max())))
+        else:
+            n = _check_ids(num_nodes, 0, -1)
+        order = np.argsort(src, kind="stable")  # Keeps the input order within a node
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return cls(_to_array("q", indptr), _to_array("q", dst[order]),
+                   None if w is None else _to_array("d", w[order]), directed)
+
+    @property
+    def num_nodes(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.indices)
+
+    @property
+    def nbytes(self):
+        """Memory used by the CSR arrays."""
+        total = self.indptr.itemsize * len(self.indptr) + self.indices.itemsize * len(self.indices)
+        if self.weights is not None:
+            total += self.weights.itemsize * len(self.weights)
+        return total
+
+    def __len__(self):
+        return self.num_nodes
+
+    def _check_node(self, u):
+        if not 0 <= u < self.num_nodes:
+            raise IndexError(f"node {u} is not in the graph")
+
+    def neighbors(self, u):
+        """Targets of the edges leaving u (an array.array slice)."""
+        self._check_node(u)
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def degree(self, u):
+        self._check_node(u)
+        return self.indptr[u + 1] - self.indptr[u]
+
+    def edges_from(self, u):
+        """(v, weight) for every edge u -> v; weight 1.0 when unweighted."""
+        self._check_node(u)
+        start, stop = self.indptr[u], self.indptr[u + 1]
+        weights = repeat(1.0) if self.weights is None else self.weights[start:stop]
+        return zip(self.indices[start:stop], weights)
+
+    def edges(self):
+        """Every edge as (u, v, weight), in CSR order."""
+        for u in range(self.num_nodes):
+            for v, w in self.edges_from(u):
+                yield u, v, w
+
+    def min_weight(self):
+        """Smallest edge weight (1.0 when unweighted), cached after the first call."""
+        if self._min_weight is None:
+            if self.weights is None or not self.weights:
+                self._min_weight = 1.0
+            elif np is not None:
+                self._min_weight = float(np.frombuffer(self.weights, dtype="d").min())
+            else:
+                self._min_weight = min(self.weights)
+        return self._min_weight
+
+    def __repr__(self):
+        return (f"CSRGraph(nodes={self.num_nodes}, edges={self.num_edges}, "
+                f"directed={self.directed}, weighted={self.weights is not None})")
+
+
+def _check_ids(num_nodes, lo, hi):
+    """Number of nodes, checking that every id in [lo, hi] fits."""
+    n = hi + 1 if num_nodes is None else num_nodes
+    if lo < 0:
+        raise ValueError(f"node ids must be >= 0, got {lo}")
+    if hi >= n:
+        raise ValueError(f"node id {hi} does not fit num_nodes={n}")
+    return n
+
+
+# -----------------------
+# 2. Bulk loading from CSV
+# -----------------------
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def load_csv(path, directed=True, num_nodes=None, delimiter=","):
+    """
+    Build a CSRGraph from a CSV edge list, one edge per line:
+        source,target          or      source,target,weight
+    Node ids must be integers. A header line is skipped if it has one.
+    """
+    with open(path, newline="") as f:
+        rows = [row for row in islice(csv.reader(f, delimiter=delimiter), 2) if row]
+    header = bool(rows) and not _is_number(rows[0][0])
+    if len(rows) <= header:  # Empty, or only a header
+        return CSRGraph.from_arrays([], [], None, num_nodes, directed)
+    weighted = len(rows[header]) > 2
+
+    if np is not None:
+        columns = [("source", "i8"), ("target", "i8")] + ([("weight", "f8")] if weighted else [])
+        table = np.loadtxt(path, delimiter=delimiter, skiprows=int(header),
+                           usecols=range(len(columns)), dtype=columns, ndmin=1)
+        weights = table["weight"] if weighted else None
+        return CSRGraph.from_arrays(table["source"], table["target"], weights, num_nodes, directed)
+
+    sources, targets = array("q"), array("q")
+    weights = array("d") if weighted else None
+    with open(path, newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        if header:
+            next(reader)
+        add_source, add_target = sources.append, targets.append
+        add_weight = weights.append if weighted else None
+        for row in reader:
+            if not row:
+                continue
+            add_source(int(row[0]))
+            add_target(int(row[1]))
+            if weighted:
+                add_weight(float(row[2]))
+    return CSRGraph.from_arrays(sources, targets, weights, num_nodes, directed)
+
+
+# -----------------------
+# 3. Traversals
+# -----------------------
+def bfs(graph, source):
+    """
+    Breadth-first search from source using QueueDeque.
+    Returns (dist, parent): hop count and BFS-tree parent of every node,
+    both array("q"), -1 for nodes that cannot be reached.
+    """
+    graph._check_node(source)
+    indptr, indices = graph.indptr, graph.indices
+    dist = array("q", [-1]) * graph.num_nodes
+    parent = array("q", [NO_PARENT]) * graph.num_nodes
+    dist[source] = 0
+    queue = QueueDeque()
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    enqueue(source)
+    while not queue.is_empty():
+        u = dequeue()
+        hops = dist[u] + 1
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            if dist[v] < 0:
+                dist[v] = hops
+                parent[v] = u
+                enqueue(v)
+    return dist, parent
+
+
+def dfs(graph, source):
+    """
+    Depth-first search from source using StackDeque instead of recursion, so
+    long paths never hit the recursion limit. Returns the nodes in the order
+    they are first visited (the same order as the recursive version).
+    """
+    graph._check_node(source)
+    indptr, indices = graph.indptr, graph.indices
+    visited = bytearray(graph.num_nodes)
+    order = []
+    stack = StackDeque()
+    push, pop = stack.push, stack.pop
+    push(source)
+    while not stack.is_empty():
+        u = pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        order.append(u)
+        # Push in reverse so the first neighbour is visited first
+        for v in reversed(indices[indptr[u]:indptr[u + 1]]):
+            if not visited[v]:
+                push(v)
+    return order
+
+
+def path_to(parent, target):
+    """Follow parents back from target: the path [source, ..., target]."""
+    path = [target]
+    while parent[path[-1]] != NO_PARENT:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+# -----------------------
+# 4. Shortest Paths
+# -----------------------
+def _check_weights(graph):
+    if graph.min_weight() < 0:
+        raise ValueError("dijkstra / astar need non-negative edge weights")
+
+
+def dijkstra(graph, source, target=None, queue=BinaryHeapQueue):
+    """
+    Shortest distances from source (edge weights, 1.0 each when unweighted).
+    Returns (dist, parent): array("d") with inf for unreachable nodes and
+    array("q") of parents. With target, stops as soon as target is settled,
+    so only dist[target] and its path are final.
+
+    A node can be queued several times with shrinking distances; stale
+    entries are skipped when dequeued (lazy deletion), which is cheaper than
+    decrease_key. queue is any class from priority_queues.py.
+    """
+    graph._check_node(source)
+    _check_weights(graph)
+    n = graph.num_nodes
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = array("d", [math.inf]) * n
+    parent = array("q", [NO_PARENT]) * n
+    settled = bytearray(n)
+    dist[source] = 0.0
+    heap = queue()
+    enqueue, dequeue = heap.enqueue, heap.dequeue
+    enqueue(source, 0.0)
+    while not heap.is_empty():
+        u = dequeue()
+        if settled[u]:
+            continue  # Stale entry: u was settled with a shorter distance
+        settled[u] = 1
+        if u == target:
+            break
+        start, stop = indptr[u], indptr[u + 1]
+        du = dist[u]
+        edge_weights = repeat(1.0) if weights is None else weights[start:stop]
+        for v, w in zip(indices[start:stop], edge_weights):
+            candidate = du + w
+            if candidate < dist[v]:
+                dist[v] = candidate
+                parent[v] = u
+                enqueue(v, candidate)
+    return dist, parent
+
+
+def astar(graph, source, target, heuristic, queue=BinaryHeapQueue):
+    """
+    Shortest path from source to target, guided by heuristic(node): an
+    estimate of the remaining distance to target that never overestimates
+    it and never drops by more than an edge weight along an edge
+    (e.g. straight-line or grid distance for routing).
+    Dequeues nodes by distance so far + heuristic, so nodes in the direction
+    of target are settled first and most of the graph is never touched.
+    Ties go to the node with the smaller estimate left (the one closer to
+    target); on grids many nodes tie, and FIFO order would explore them all.
+    Returns (distance, path); (inf, []) if target cannot be reached.
+    """
+    graph._check_node(source)
+    graph._check_node(target)
+    _check_weights(graph)
+    n = graph.num_nodes
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = array("d", [math.inf]) * n
+    parent = array("q", [NO_PARENT]) * n
+    settled = bytearray(n)
+    dist[source] = 0.0
+    heap = queue()
+    enqueue, dequeue = heap.enqueue, heap.dequeue
+    estimate = heuristic(source)
+    enqueue(source, (estimate, estimate))
+    while not heap.is_empty():
+        u = dequeue()
+        if settled[u]:
+            continue
+        if u == target:
+            return dist[u], path_to(parent, target)
+        settled[u] = 1
+        start, stop = indptr[u], indptr[u + 1]
+        du = dist[u]
+        edge_weights = repeat(1.0) if weights is None else weights[start:stop]
+        for v, w in zip(indices[start:stop], edge_weights):
+            candidate = du + w
+            if candidate < dist[v]:
+                dist[v] = candidate
+                parent[v] = u
+                estimate = heuristic(v)
+                enqueue(v, (candidate + estimate, estimate))
+    return math.inf, []
+
+
+def shortest_path(graph, source, target):
+    """(distance, path) from source to target with dijkstra; (inf, []) if unreachable."""
+    graph._check_node(target)
+    dist, parent = dijkstra(graph, source, target)
+    if dist[target] == math.inf:
+        return math.inf, []
+    return dist[target], path_to(parent, target)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def _random_edges(num_nodes, num_edges, seed=1):
+    """Random weighted edges as (sources, targets, weights) columns."""
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        return (rng.integers(0, num_nodes, num_edges), rng.integers(0, num_nodes, num_edges),
+                rng.random(num_edges))
+    import random
+    rng = random.Random(seed)
+    nodes = range(num_nodes)
+    return (array("q", rng.choices(nodes, k=num_edges)), array("q", rng.choices(nodes, k=num_edges)),
+            array("d", (rng.random() for _ in range(num_edges))))
+
+
+def _grid_edges(width, height):
+    """Edges of a width x height grid graph (node = y * width + x), both directions."""
+    sources, targets = array("q"), array("q")
+    for y in range(height):
+        for x in range(width):
+            u = y * width + x
+            if x + 1 < width:
+                sources.append(u)
+                targets.append(u + 1)
+            if y + 1 < height:
+                sources.append(u)
+                targets.append(u + width)
+    return sources, targets
+
+
+def _write_csv(path, sources, targets, weights, block=1 << 16):
+    with open(path, "w", newline="") as f:
+        f.write("source,target,weight\n")
+        for i in range(0, len(sources), block):
+            rows = zip(sources[i:i + block].tolist(), targets[i:i + block].tolist(),
+                       weights[i:i + block].tolist())
+            f.write("".join(f"{u},{v},{w:.6g}\n" for u, v, w in rows))
+
+
+def benchmark_graphs(num_nodes=10**6, num_edges=10**7, grid=1000, sample=10**5):
+    """
+    On a random directed graph with num_edges weighted edges: CSR build time
+    and memory (against a dict of lists, measured on `sample` edges and
+    scaled), bulk CSV loading, and one BFS, DFS and Dijkstra from node 0.
+    Then Dijkstra vs A* (Manhattan distance) corner to corner on a
+    grid x grid undirected grid.
+    """
+    import os
+    import tempfile
+    import time
+    import tracemalloc
+
+    def timed(run):
+        start = time.perf_counter()
+        result = run()
+        return time.perf_counter() - start, result
+
+    sources, targets, weights = _random_edges(num_nodes, num_edges)
+    print(f"Random graph, {num_nodes:,} nodes, {num_edges:,} edges:")
+    build_time, graph = timed(lambda: CSRGraph.from_arrays(sources, targets, weights, num_nodes))
+    print(f"  {'CSR build':<28}{build_time:>8.3f}s   {graph.nbytes / 2**20:>8.1f} MB")
+
+    tracemalloc.start()
+    adjacency = {}
+    for u, v, w in zip(list(sources[:sample]), list(targets[:sample]), list(weights[:sample])):
+        adjacency.setdefault(u, []).append((v, w))
+    dict_bytes = tracemalloc.get_traced_memory()[0] * num_edges / sample
+    tracemalloc.stop()
+    del adjacency
+    print(f"  {'dict of lists (estimated)':<28}{'':>9}   {dict_bytes / 2**20:>8.1f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "edges.csv")
+        _write_csv(path, sources, targets, weights)
+        size = os.path.getsize(path)
+        load_time, loaded = timed(lambda: load_csv(path, num_nodes=num_nodes))
+        print(f"  {'load_csv':<28}{load_time:>8.3f}s   ({size / 2**20:.0f} MB file)")
+        assert loaded.num_edges == graph.num_edges
+        del loaded
+
+    bfs_time, (hops, _) = timed(lambda: bfs(graph, 0))
+    reached = sum(1 for h in hops if h >= 0)
+    print(f"  {'bfs':<28}{bfs_time:>8.3f}s   {reached:,} nodes reached")
+    dfs_time, order = timed(lambda: dfs(graph, 0))
+    print(f"  {'dfs':<28}{dfs_time:>8.3f}s   {len(order):,} nodes visited")
+    del order
+    dijkstra_time, _ = timed(lambda: dijkstra(graph, 0))
+    print(f"  {'dijkstra (all nodes)':<28}{dijkstra_time:>8.3f}s")
+    del graph
+
+    sources, targets = _grid_edges(grid, grid)
+    road = CSRGraph.from_arrays(sources, targets, num_nodes=grid * grid, directed=False)
+    goal = grid * grid - 1
+
+    def manhattan(u):
+        return (grid - 1 - u % grid) + (grid - 1 - u // grid)
+
+    print(f"\nGrid {grid} x {grid}, corner to corner ({road.num_edges:,} directed edges):")
+    plain_time, (plain, _) = timed(lambda: shortest_path(road, 0, goal))
+    print(f"  {'dijkstra with target':<28}{plain_time:>8.3f}s   distance {plain:.0f}")
+    guided_time, (guided, _) = timed(lambda: astar(road, 0, goal, manhattan))
+    print(f"  {'astar (Manhattan)':<28}{guided_time:>8.3f}s   distance {guided:.0f}")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    cities = ["Amsterdam", "Berlin", "Cologne", "Dresden", "Essen"]
+    roads = [(0, 2, 260), (0, 4, 210), (2, 4, 70), (2, 1, 570), (4, 1, 530), (1, 3, 190)]
+    graph = CSRGraph.from_edges(roads, num_nodes=len(cities), directed=False)
+    print(graph)
+    print("Neighbours of Cologne:", [cities[v] for v in graph.neighbors(2)])
+
+    hops, parent = bfs(graph, 0)
+    print("Hops from Amsterdam:", dict(zip(cities, hops)))
+    print("DFS order from Amsterdam:", [cities[u] for u in dfs(graph, 0)])
+
+    distance, path = shortest_path(graph, 0, 3)
+    print(f"Shortest Amsterdam -> Dresden: {distance:.0f} km via", " -> ".join(cities[u] for u in path))
+
+    width = 5
+    grid_graph = CSRGraph.from_arrays(*_grid_edges(width, width), num_nodes=width * width, directed=False)
+    distance, path = astar(grid_graph, 0, 24, lambda u: (4 - u % width) + (4 - u // width))
+    print(f"A* on a 5 x 5 grid, corner to corner: {distance:.0f} steps, path {path}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "roads.csv")
+        with open(path, "w") as f:
+            f.write("source,target,weight\n")
+            f.writelines(f"{u},{v},{w}\n" for u, v, w in roads)
+        print("Loaded from CSV:", load_csv(path, directed=False))
+
+    if "--bench" in sys.argv:
+        benchmark_graphs()
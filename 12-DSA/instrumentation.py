@@ -0,0 +1,392 @@
+"""
+instrumentation.py
+
+Counting Comparisons, Probes and Moves
+--------------------------------------
+
+The docstrings in sorting_algorithms.py say "O(n^2)", searching_algorithms.py
+says "O(log n)". measure() runs one of those functions and counts what it
+actually does:
+
+    report = measure(bubble_sort, data)
+    report.comparisons   # <, <=, ==, ... between elements
+    report.probes        # elements read from the sequence
+    report.moves         # elements written into the sequence
+    report.phases        # time and counts per helper (e.g. _merge in hybrid_sort)
+
+How it works: the algorithms are not changed at all. measure() copies the data
+into a CountingList (a list that counts every read and write) and wraps each
+element in a _Counted object (which counts every comparison), then calls the
+function on that. Phases are timed by swapping the function's helpers (the
+names in PHASES) for timed versions while it runs and putting the originals
+back afterwards. So when you do not call measure() there is nothing to switch
+off: the algorithms run exactly as before, with zero overhead.
+
+Limits:
+    - Counting makes a run several times slower. Use the counts, and the time
+      shares between phases; use a plain run for absolute time.
+    - Algorithms that do arithmetic on the keys (counting_sort, radix_sort,
+      bucket_sort, interpolation_search, auto_*) get plain elements, so only
+      probes and moves are counted (comparisons is None). See NO_COMPARE.
+    - Numeric array.array / NumPy inputs are measured as a list, so the
+      pure-Python algorithm runs, not the numeric_backend kernel.
+    - Phase timing replaces module globals for the length of the call: do not
+      measure the same module from two threads at once.
+"""
+
+import math
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Functions that need the real keys (int checks, arithmetic): no element wrapping
+NO_COMPARE = {
+    "counting_sort", "radix_sort", "bucket_sort", "auto_sort",
+    "interpolation_search", "auto_search",
+}
+
+# Function name -> helpers (looked up in the function's module) timed as phases
+PHASES = {
+    "hybrid_sort": ("_next_run", "_insertion_sort_range", "_merge"),
+    "auto_sort": ("counting_sort", "radix_sort", "hybrid_sort"),
+    "radix_sort": ("_msd_pass",),
+    "nth_element": ("_median_of_three", "_partition3"),
+    "quickselect": ("_median_of_three", "_partition3"),
+    "partial_sort": ("nth_element", "_sorted_like"),
+    "auto_search": ("plan_search",),
+}
+
+COUNTERS = ("comparisons", "probes", "moves")
+
+
+# -----------------------
+# 1. Counters
+# -----------------------
+class Stats:
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        self.comparisons = 0
+        self.probes = 0
+        self.moves = 0
+
+    def snapshot(self):
+        return (self.comparisons, self.probes, self.moves)
+
+
+class _Counted:
+    """An element that counts every comparison it takes part in."""
+
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < (other.value if type(other) is _Counted else other)
+
+    def __le__(self, other):
+        self.stats.comparisons += 1
+        return self.value <= (other.value if type(other) is _Counted else other)
+
+    def __gt__(self, other):
+        self.stats.comparisons += 1
+        return self.value > (other.value if type(other) is _Counted else other)
+
+    def __ge__(self, other):
+        self.stats.comparisons += 1
+        return self.value >= (other.value if type(other) is _Counted else other)
+
+    def __eq__(self, other):
+        self.stats.comparisons += 1
+        return self.value == (other.value if type(other) is _Counted else other)
+
+    def __ne__(self, other):
+        self.stats.comparisons += 1
+        return self.value != (other.value if type(other) is _Counted else other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+    """
+    A list that counts element reads (probes) and writes (moves).
+    Slices count one probe/move per element copied.
+    """
+
+    __slots__ = ("stats",)
+
+    def __init__(self, items=(), stats=None):
+        super().__init__(items)
+        self.stats = stats or Stats()
+
+    def __getitem__(self, index):
+        item = list.__getitem__(self, index)
+        self.stats.probes += len(item) if type(index) is slice else 1
+        return item
+
+    def __setitem__(self, index, item):
+        if type(index) is slice:
+            item = list(item)
+            self.stats.moves += len(item)
+        else:
+            self.stats.moves += 1
+        list.__setitem__(self, index, item)
+
+    def __iter__(self):
+        stats = self.stats
+        for item in list.__iter__(self):
+            stats.probes += 1
+            yield item
+
+    def reverse(self):
+        self.stats.moves += len(self)
+        list.reverse(self)
+
+
+# -----------------------
+# 2. Reports
+# -----------------------
+class Report:
+    """
+    Result of one measure() call. as_dict() gives the same data as plain
+    dicts/numbers (ready for json.dumps).
+    """
+
+    def __init__(self, name, n, result, seconds, stats, compared, phases):
+        self.name = name
+        self.n = n
+        self.result = result
+        self.seconds = seconds
+        self.comparisons = stats.comparisons if compared else None
+        self.probes = stats.probes
+        self.moves = stats.moves
+        self.phases = phases  # name -> {"calls", "seconds", "comparisons", "probes", "moves"}
+
+    def as_dict(self):
+        return {
+            "name": self.name, "n": self.n, "seconds": self.seconds,
+            "comparisons": self.comparisons, "probes": self.probes, "moves": self.moves,
+            "phases": {name: dict(phase) for name, phase in self.phases.items()},
+        }
+
+    def __str__(self):
+        comparisons = "-" if self.comparisons is None else f"{self.comparisons:,}"
+        lines = [f"{self.name} (n={self.n:,}): {comparisons} comparisons, "
+                 f"{self.probes:,} probes, {self.moves:,} moves, {self.seconds:.4f}s"]
+        for name, phase in self.phases.items():
+            lines.append(f"    {name:<24}{phase['calls']:>8,} calls {phase['seconds']:>9.4f}s  "
+                         f"{phase['comparisons']:>12,} cmp {phase['probes']:>12,} probes "
+                         f"{phase['moves']:>12,} moves")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"<Report {self.name} n={self.n}>"
+
+
+def print_reports(reports):
+    """One table row per report, with comparisons per n, n log2 n and n^2."""
+    print(f"{'algorithm':<26}{'n':>9}{'comparisons':>14}{'probes':>14}{'moves':>14}"
+          f"{'cmp/n':>9}{'cmp/nlogn':>11}{'cmp/n^2':>9}")
+    for report in reports:
+        n = max(report.n, 2)
+        if report.comparisons is None:
+            counts = f"{'-':>14}"
+            ratios = f"{'-':>9}{'-':>11}{'-':>9}"
+        else:
+            c = report.comparisons
+            counts = f"{c:>14,}"
+            ratios = f"{c / n:>9.2f}{c / (n * math.log2(n)):>11.3f}{c / n ** 2:>9.3f}"
+        print(f"{report.name:<26}{report.n:>9,}{counts}{report.probes:>14,}"
+              f"{report.moves:>14,}{ratios}")
+
+
+# -----------------------
+# 3. measure()
+# -----------------------
+def _timed_phase(helper, name, stats, phases, depth):
+    """helper wrapped to add its time and counts to phases[name] (outermost calls only)."""
+    phase = phases.setdefault(name, {"calls": 0, "seconds": 0.0,
+                                     "comparisons": 0, "probes": 0, "moves": 0})
+
+    def timed(*args, **kwargs):
+        phase["calls"] += 1
+        if depth[name]:  # A recursive call: already inside the timed outer call
+            return helper(*args, **kwargs)
+        depth[name] += 1
+        before = stats.snapshot()
+        start = time.perf_counter()
+        try:
+            return helper(*args, **kwargs)
+        finally:
+            phase["seconds"] += time.perf_counter() - start
+            for counter, old, new in zip(COUNTERS, before, stats.snapshot()):
+                phase[counter] += new - old
+            depth[name] -= 1
+
+    return timed
+
+
+def _unwrap(value, proxy):
+    if type(value) is _Counted:
+        return value.value
+    if value is proxy:
+        return value
+    if isinstance(value, list):
+        return [_unwrap(item, proxy) for item in value]
+    return value
+
+
+def _store(data, items):
+    """Write the (possibly reordered) items back into the caller's sequence."""
+    if isinstance(data, array):
+        data[:] = array(data.typecode, items)
+    else:
+        data[:] = items
+
+
+def measure(func, data, *args, **kwargs):
+    """
+    Call func(data, *args, **kwargs) with counting on and return a Report.
+
+    data is copied into a CountingList first; when func is done the
+    (sorted / partitioned) items are written back into data, so measuring a
+    sort leaves data sorted like the real call would. report.result is the
+    return value, with the data itself for sorts that return arr.
+    For searches, pass the target in args: measure(binary_search_iterative, arr, 42)
+    """
+    name = getattr(func, "__name__", repr(func))
+    stats = Stats()
+    compared = name not in NO_COMPARE
+    key = kwargs.get("key")
+    if compared and key is not None:
+        # Count comparisons between keys; the elements themselves stay plain
+        kwargs["key"] = lambda item: _Counted(key(item), stats)
+        items = list(data)
+    elif compared:
+        items = [_Counted(item, stats) for item in data]
+    else:
+        items = data.tolist() if hasattr(data, "tolist") else list(data)
+    proxy = CountingList(items, stats)
+
+    phases = {}
+    module = getattr(func, "__globals__", {})
+    originals = {helper: module[helper] for helper in PHASES.get(name, ()) if helper in module}
+    depth = dict.fromkeys(originals, 0)
+    for helper, original in originals.items():
+        module[helper] = _timed_phase(original, helper, stats, phases, depth)
+    start = time.perf_counter()
+    try:
+        result = func(proxy, *args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        module.update(originals)
+
+    if isinstance(data, (list, array)) or (np is not None and isinstance(data, np.ndarray)):
+        _store(data, _unwrap(list.__getitem__(proxy, slice(None)), proxy))
+    result = data if result is proxy else _unwrap(result, proxy)
+    return Report(name, len(proxy), result, seconds, stats, compared, phases)
+
+
+def measure_many(func, inputs, *args, **kwargs):
+    """measure() every input in turn, e.g. one per size. Returns the reports."""
+    return [measure(func, data, *args, **kwargs) for data in inputs]
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_instrumentation(sizes=(250, 500, 1000, 2000), cutoffs=(8, 16, 32, 64, 128)):
+    """
+    Check the complexity claims: comparisons per n, n log2 n and n^2 for every
+    sort and search as n doubles. The column that stays flat is the real growth.
+    Then use the phase report to compare MIN_RUN cutoffs for hybrid_sort.
+    """
+    import contextlib
+    import io
+    import random
+
+    with contextlib.redirect_stdout(io.StringIO()):  # These modules print demos on import
+        import searching_algorithms as searching
+        import selection
+        import sorting_algorithms as sorting
+
+    sorts = [sorting.bubble_sort, sorting.selection_sort, sorting.insertion_sort,
+             sorting.hybrid_sort, sorting.counting_sort, sorting.radix_sort,
+             sorting.bucket_sort, sorting.auto_sort, selection.partial_sort]
+    reports = []
+    for sort in sorts:
+        for n in sizes:
+            data = [random.randrange(10 * n) for _ in range(n)]
+            args = (10,) if sort is selection.partial_sort else ()
+            reports.append(measure(sort, data, *args))
+            assert data[:10] == sorted(data)[:10]
+    for n in sizes:
+        reports.append(measure(selection.nth_element, [random.random() for _ in range(n)], n // 2))
+    print_reports(reports)
+
+    print()
+    searches = [searching.linear_search, searching.binary_search_iterative,
+                searching.interpolation_search, searching.exponential_search,
+                searching.galloping_search]
+    print(f"{'search':<26}{'n':>9}{'probes/query':>14}{'cmp/query':>11}")
+    for search in searches:
+        for n in sizes:
+            keys = sorted(random.sample(range(10 * n), n))
+            queries = random.sample(keys, 100)
+            found = [measure(search, keys, q) for q in queries]
+            probes = sum(r.probes for r in found) / len(found)
+            compared = found[0].comparisons is not None
+            cmp = f"{sum(r.comparisons for r in found) / len(found):>11.1f}" if compared else f"{'-':>11}"
+            print(f"{search.__name__:<26}{n:>9,}{probes:>14.1f}{cmp}")
+
+    print(f"\nhybrid_sort MIN_RUN cutoffs, n={sizes[-1] * 10:,} random ints:")
+    data = [random.randrange(sizes[-1] * 100) for _ in range(sizes[-1] * 10)]
+    default = sorting.MIN_RUN
+    try:
+        for cutoff in cutoffs:
+            sorting.MIN_RUN = cutoff
+            report = measure(sorting.hybrid_sort, data.copy())
+            print(f"  MIN_RUN={cutoff:<5}{report.comparisons:>12,} cmp {report.moves:>12,} moves")
+            for phase_name, phase in report.phases.items():
+                print(f"      {phase_name:<24}{phase['seconds']:>8.4f}s {phase['comparisons']:>12,} cmp")
+    finally:
+        sorting.MIN_RUN = default
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import json
+    import sys
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from searching_algorithms import binary_search_iterative, linear_search
+        from sorting_algorithms import bubble_sort, hybrid_sort, radix_sort
+
+    data = [64, 34, 25, 12, 22, 11, 90]
+    report = measure(bubble_sort, data)
+    print(report)
+    print("data is sorted too:", data)
+    print(measure(hybrid_sort, list(range(1000, 0, -7)) + list(range(500))))
+    print(measure(radix_sort, [170, 45, 75, 90, 802, 24, 2, 66] * 100, msd=True))
+    print(measure(linear_search, data, 90))
+    print(json.dumps(measure(binary_search_iterative, list(range(1000)), 777).as_dict()))
+    print()
+    print_reports(measure_many(bubble_sort, (list(range(n, 0, -1)) for n in (100, 200, 400))))
+
+    if "--bench" in sys.argv:
+        benchmark_instrumentation()
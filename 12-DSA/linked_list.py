@@ -1,53 +1,432 @@
 """
-arrays_basics.py
-----------------
-Basic operations on arrays (lists in Python).
+linked_list.py
 
-In Python, we use lists to simulate arrays.
+Linked List Implementation in Python
+------------------------------------
+
+A linked list stores each element in its own node, and every node points to
+the next one (and, in a doubly linked list, to the previous one too):
+
+    Singly:  head -> [10] -> [20] -> [30] -> None
+    Doubly:  None <- [10] <-> [20] <-> [30] -> None
+
+Unlike a Python list, adding or removing at the front never shifts the other
+elements, and two whole lists can be joined by relinking a couple of pointers.
+
+Operations:
+-----------
+                        Singly      Doubly
+push_front / pop_front  O(1)        O(1)
+push_back               O(1)        O(1)
+pop_back                O(n)        O(1)
+concat(other)           O(1)        O(1)
+splice_after(node, ...)   -         O(1)
+find / index access     O(n)        O(n)
+
+Popping from an empty list returns None.
+
+Nodes use __slots__ (no per-node __dict__). An optional NodePool keeps popped
+nodes and hands them out again, so push/pop heavy code creates fewer objects.
+CPython already recycles small objects quickly, so check the churn benchmark
+before turning the pool on: it trades allocations for a method call per node.
 """
 
-# Creating an array (list in Python)
-arr = [10, 20, 30, 40, 50]
-print("Initial array:", arr)
+# -----------------------
+# 1. Nodes and the node pool
+# -----------------------
+class Node:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data=None):
+        self.data = data
+        self.next = None
+
+
+class DNode:
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, data=None):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class NodePool:
+    """
+    Free list of nodes. release() keeps a popped node (up to max_size of them)
+    and acquire() reuses it instead of creating a new object.
+    Do not keep using a node after its list has popped or removed it.
+    """
+
+    def __init__(self, node_class, max_size=10_000):
+        self.node_class = node_class
+        self.max_size = max_size
+        self.free = []
+
+    def acquire(self, data):
+        if self.free:
+            node = self.free.pop()
+            node.data = data
+            return node
+        return self.node_class(data)
+
+    def release(self, node):
+        if len(self.free) < self.max_size:
+            node.data = None  # Do not keep the value alive
+            node.next = None
+            if self.node_class is DNode:
+                node.prev = None
+            self.free.append(node)
+
+
+# -----------------------
+# 2. Singly Linked List
+# -----------------------
+class SinglyLinkedList:
+    def __init__(self, items=(), pool=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.pool = pool
+        for item in items:
+            self.push_back(item)
+
+    def _new_node(self, data):
+        return self.pool.acquire(data) if self.pool else Node(data)
+
+    def push_front(self, data):
+        node = self._new_node(data)
+        node.next = self.head
+        self.head = node
+        if self.tail is None:
+            self.tail = node
+        self.length += 1
+
+    def push_back(self, data):
+        node = self._new_node(data)
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.length += 1
+
+    def pop_front(self):
+        if self.head is None:
+            return None
+        node = self.head
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        self.length -= 1
+        data = node.data
+        if self.pool:
+            self.pool.release(node)
+        return data
+
+    def pop_back(self):
+        """O(n): a singly linked node does not know its predecessor."""
+        if self.head is None:
+            return None
+        if self.head is self.tail:
+            return self.pop_front()
+        prev = self.head
+        while prev.next is not self.tail:
+            prev = prev.next
+        node = self.tail
+        prev.next = None
+        self.tail = prev
+        self.length -= 1
+        data = node.data
+        if self.pool:
+            self.pool.release(node)
+        return data
+
+    def concat(self, other):
+        """Move all nodes of other to the end of this list in O(1). other becomes empty."""
+        if other.head is None:
+            return
+        if self.tail:
+            self.tail.next = other.head
+        else:
+            self.head = other.head
+        self.tail = other.tail
+        self.length += other.length
+        other.head = other.tail = None
+        other.length = 0
+
+    def find(self, data):
+        """Return the first node holding data, or None."""
+        node = self.head
+        while node:
+            if node.data == data:
+                return node
+            node = node.next
+        return None
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield node.data
+            node = node.next
+
+    def __len__(self):
+        return self.length
+
+    def display(self):
+        print(" -> ".join(str(item) for item in self) + " -> None")
+
+
+# -----------------------
+# 3. Doubly Linked List
+# -----------------------
+class DoublyLinkedList:
+    def __init__(self, items=(), pool=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.pool = pool
+        for item in items:
+            self.push_back(item)
+
+    def _new_node(self, data):
+        return self.pool.acquire(data) if self.pool else DNode(data)
+
+    def push_front(self, data):
+        """Add data at the front and return its node (usable with splice_after/remove)."""
+        node = self._new_node(data)
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
+        self.length += 1
+        return node
+
+    def push_back(self, data):
+        """Add data at the back and return its node (usable with splice_after/remove)."""
+        node = self._new_node(data)
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self.length += 1
+        return node
+
+    def insert_after(self, node, data):
+        """Add data right after node in O(1) and return the new node."""
+        if node is self.tail:
+            return self.push_back(data)
+        new = self._new_node(data)
+        new.prev = node
+        new.next = node.next
+        node.next.prev = new
+        node.next = new
+        self.length += 1
+        return new
+
+    def remove(self, node):
+        """Unlink node from this list in O(1) and return its data."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        self.length -= 1
+        data = node.data
+        if self.pool:
+            self.pool.release(node)
+        return data
+
+    def pop_front(self):
+        if self.head is None:
+            return None
+        return self.remove(self.head)
+
+    def pop_back(self):
+        if self.tail is None:
+            return None
+        return self.remove(self.tail)
+
+    def splice_after(self, node, other):
+        """
+        Move every node of other in between node and node.next in O(1).
+        node=None splices at the front. other becomes empty.
+        """
+        if other.head is None:
+            return
+        first, last = other.head, other.tail
+        after = node.next if node else self.head
+        first.prev = node
+        last.next = after
+        if node:
+            node.next = first
+        else:
+            self.head = first
+        if after:
+            after.prev = last
+        else:
+            self.tail = last
+        self.length += other.length
+        other.head = other.tail = None
+        other.length = 0
+
+    def concat(self, other):
+        """Move all nodes of other to the end of this list in O(1)."""
+        self.splice_after(self.tail, other)
+
+    def find(self, data):
+        """Return the first node holding data, or None."""
+        node = self.head
+        while node:
+            if node.data == data:
+                return node
+            node = node.next
+        return None
+
+    def __iter__(self):
+        node = self.head
+        while node:
+            yield node.data
+            node = node.next
+
+    def __reversed__(self):
+        node = self.tail
+        while node:
+            yield node.data
+            node = node.prev
+
+    def __len__(self):
+        return self.length
+
+    def display(self):
+        print("None <- " + " <-> ".join(str(item) for item in self) + " -> None")
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_linked_lists(n=10**5, splices=10**4, chunk=10):
+    """
+    Front inserts: n items pushed at the front.
+    Middle splices: `splices` times, insert `chunk` items in the middle.
+    """
+    import time
+    from collections import deque
+
+    def timed(run):
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+
+    def list_front():
+        lst = []
+        for i in range(n):
+            lst.insert(0, i)
+
+    def deque_front():
+        dq = deque()
+        for i in range(n):
+            dq.appendleft(i)
+
+    def linked_front(cls, pool=None):
+        def run():
+            ll = cls(pool=pool)
+            for i in range(n):
+                ll.push_front(i)
+        return run
+
+    print(f"Front insert of {n:,} items:")
+    for name, run in (("list.insert(0, x)", list_front),
+                      ("deque.appendleft", deque_front),
+                      ("SinglyLinkedList", linked_front(SinglyLinkedList)),
+                      ("DoublyLinkedList", linked_front(DoublyLinkedList))):
+        print(f"  {name:<22}{timed(run):>8.3f}s")
+
+    base = list(range(n))
+    middle = n // 2
+
+    def list_splice():
+        lst = base.copy()
+        for _ in range(splices):
+            lst[middle:middle] = range(chunk)
+
+    def deque_splice():
+        dq = deque(base)
+        for _ in range(splices):
+            dq.rotate(-middle)
+            dq.extendleft(reversed(range(chunk)))
+            dq.rotate(middle)
 
-# Accessing elements
-print("First element:", arr[0])
-print("Last element:", arr[-1])
+    def linked_splice():
+        ll = DoublyLinkedList(base)
+        anchor = ll.head
+        for _ in range(middle):  # Find the middle node once, keep the handle
+            anchor = anchor.next
+        for _ in range(splices):
+            ll.splice_after(anchor, DoublyLinkedList(range(chunk)))
 
-# Insertion
-arr.append(60)  # Add at the end
-print("After append:", arr)
+    print(f"\nSplice {chunk} items into the middle of {n:,}, {splices:,} times:")
+    for name, run in (("list slice assignment", list_splice),
+                      ("deque rotate + extend", deque_splice),
+                      ("DoublyLinkedList", linked_splice)):
+        print(f"  {name:<22}{timed(run):>8.3f}s")
 
-arr.insert(2, 25)  # Insert at index 2
-print("After inserting 25 at index 2:", arr)
+    def churn(pool):
+        def run():
+            ll = DoublyLinkedList(pool=pool)
+            for i in range(n):
+                ll.push_back(i)
+                ll.push_back(i)
+                ll.pop_front()
+                ll.pop_front()
+        return run
 
-# Deletion
-arr.remove(40)  # Remove by value
-print("After removing 40:", arr)
+    print(f"\nPush/pop churn, {4 * n:,} operations:")
+    print(f"  {'without pool':<22}{timed(churn(None)):>8.3f}s")
+    print(f"  {'with NodePool':<22}{timed(churn(NodePool(DNode))):>8.3f}s")
 
-deleted_value = arr.pop(3)  # Remove by index
-print(f"Deleted value at index 3: {deleted_value}")
-print("Array after pop:", arr)
 
-# Updating elements
-arr[1] = 22
-print("After updating index 1 to 22:", arr)
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
 
-# Traversal
-print("Traversing array:")
-for element in arr:
-    print(element)
+    print("Singly linked list:")
+    sll = SinglyLinkedList([20, 30])
+    sll.push_front(10)
+    sll.push_back(40)
+    sll.display()
+    print("Popped front:", sll.pop_front())
+    print("Popped back:", sll.pop_back())
+    sll.concat(SinglyLinkedList([50, 60]))
+    sll.display()
+    print("Length:", len(sll))
 
-# Searching
-if 30 in arr:
-    print("30 found in array")
-else:
-    print("30 not found in array")
+    print("\nDoubly linked list:")
+    dll = DoublyLinkedList([1, 2, 5, 6])
+    two = dll.find(2)
+    dll.splice_after(two, DoublyLinkedList([3, 4]))  # O(1), no shifting
+    dll.display()
+    print("Backwards:", list(reversed(dll)))
+    print("Popped back:", dll.pop_back())
+    dll.remove(two)
+    dll.display()
 
-# Sorting
-arr.sort()
-print("Sorted array:", arr)
+    print("\nWith a node pool:")
+    pool = NodePool(DNode)
+    pooled = DoublyLinkedList([1, 2, 3], pool=pool)
+    pooled.pop_front()
+    print("Nodes waiting for reuse:", len(pool.free))
+    pooled.push_back(4)
+    print("Nodes waiting for reuse:", len(pool.free))
 
-# Reversing
-arr.reverse()
-print("Reversed array:", arr)
+    if "--bench" in sys.argv:
+        benchmark_linked_lists()
@@ -0,0 +1,209 @@
+"""
+membership_index.py
+
+Membership Index in Python
+--------------------------
+
+`if 30 in arr` and linear_search look at every element, O(n) per question.
+When the same collection is asked millions of times and changes only now and
+then, it pays to keep a hash index next to it:
+
+    items    [10, 20, 30, 20]          the array itself (a list)
+    counts   {10: 1, 20: 2, 30: 1}     answers "is x in it?"       O(1)
+    first    {10: 0, 20: 1, 30: 2}     answers "where is x first?" O(1)
+
+MembershipIndex owns the list and updates the index on every change:
+    - append / pop from the end keep both dicts up to date in O(1)
+    - insert / remove / pop(i) in the middle shift positions, so they only
+      update counts and drop `first`; it is rebuilt (once, O(n)) on the next
+      index_of call
+    - contains_many / index_of_many answer a whole batch in one call
+
+Items must be hashable. For a sorted, numeric collection, sorted_index.py
+answers the same questions without the extra dicts.
+"""
+
+
+class MembershipIndex:
+    def __init__(self, items=()):
+        self.items = list(items)
+        self.counts = {}
+        for item in self.items:
+            self.counts[item] = self.counts.get(item, 0) + 1
+        self._first = None  # Built on first use
+
+    # -----------------------
+    # Keeping the index in sync
+    # -----------------------
+    def _add(self, item):
+        self.counts[item] = self.counts.get(item, 0) + 1
+
+    def _discard(self, item):
+        left = self.counts[item] - 1
+        if left:
+            self.counts[item] = left
+        else:
+            del self.counts[item]
+
+    def _first_positions(self):
+        if self._first is None:
+            n = len(self.items)
+            # Walk backwards so the smallest position of each value wins
+            self._first = dict(zip(reversed(self.items), range(n - 1, -1, -1)))
+        return self._first
+
+    # -----------------------
+    # The operations from arrays.py
+    # -----------------------
+    def append(self, item):
+        self.items.append(item)
+        self._add(item)
+        if self._first is not None and item not in self._first:
+            self._first[item] = len(self.items) - 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def insert(self, index, item):
+        self.items.insert(index, item)
+        self._add(item)
+        self._first = None
+
+    def remove(self, item):
+        """Remove the first occurrence of item (ValueError if missing)."""
+        if item not in self.counts:
+            raise ValueError("MembershipIndex.remove(x): x not in list")
+        self.items.remove(item)
+        self._discard(item)
+        self._first = None
+
+    def pop(self, index=-1):
+        n = len(self.items)
+        item = self.items.pop(index)
+        self._discard(item)
+        if index in (-1, n - 1):
+            if self._first is not None and item not in self.counts:
+                del self._first[item]
+        else:
+            self._first = None
+        return item
+
+    def __setitem__(self, index, item):
+        self._discard(self.items[index])
+        self.items[index] = item
+        self._add(item)
+        self._first = None
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self):
+        return f"MembershipIndex({self.items})"
+
+    # -----------------------
+    # Lookups
+    # -----------------------
+    def contains(self, item):
+        """O(1)"""
+        return item in self.counts
+
+    __contains__ = contains
+
+    def count(self, item):
+        """O(1)"""
+        return self.counts.get(item, 0)
+
+    def index_of(self, item):
+        """
+        Returns index of the first occurrence of item, else -1
+        (O(1), or O(n) once after a change in the middle).
+        """
+        return self._first_positions().get(item, -1)
+
+    def contains_many(self, items):
+        """One bool per item."""
+        return list(map(self.counts.__contains__, items))
+
+    def index_of_many(self, items):
+        """One index (or -1) per item."""
+        get = self._first_positions().get
+        return [get(item, -1) for item in items]
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_membership(n=10**5, queries=10**6, changes=100):
+    """
+    `queries` membership checks against n items, with `changes` middle
+    inserts spread over the run. The plain list (the arrays.py way) is timed
+    on 1,000 checks and scaled up; the full run would take far too long.
+    """
+    import random
+    import time
+
+    values = random.sample(range(4 * n), n)
+    wanted = [random.randrange(4 * n) for _ in range(queries)]
+    every = queries // changes
+
+    sample = wanted[:1000]
+    start = time.perf_counter()
+    for x in sample:
+        x in values
+    list_time = (time.perf_counter() - start) * queries / len(sample)
+
+    index = MembershipIndex(values)
+    start = time.perf_counter()
+    for i, x in enumerate(wanted):
+        if i % every == 0:
+            index.insert(len(index) // 2, -i)
+        x in index
+    single_time = time.perf_counter() - start
+
+    index = MembershipIndex(values)
+    start = time.perf_counter()
+    for i in range(0, queries, every):
+        index.insert(len(index) // 2, -i)
+        index.contains_many(wanted[i:i + every])
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, queries, every):
+        index.insert(len(index) // 2, -i)
+        index.index_of_many(wanted[i:i + every])
+    positions_time = time.perf_counter() - start
+
+    print(f"{queries:,} lookups in {n:,} items, {changes} inserts in between:")
+    print(f"  {'x in list (estimated)':<28}{list_time:>8.3f}s")
+    print(f"  {'x in MembershipIndex':<28}{single_time:>8.3f}s")
+    print(f"  {'contains_many':<28}{batch_time:>8.3f}s")
+    print(f"  {'index_of_many':<28}{positions_time:>8.3f}s")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    arr = MembershipIndex([10, 20, 30, 40, 50])
+    arr.append(60)
+    arr.insert(2, 25)
+    arr.remove(40)
+    print("Array:", arr)
+    print("30 in array?", 30 in arr)
+    print("Index of 50:", arr.index_of(50))
+    print("Popped:", arr.pop(1))
+    print("Index of 50 after pop:", arr.index_of(50))
+    print("Batch contains [10, 20, 99]:", arr.contains_many([10, 20, 99]))
+    print("Batch index_of [10, 60, 99]:", arr.index_of_many([10, 60, 99]))
+
+    if "--bench" in sys.argv:
+        benchmark_membership()
@@ -0,0 +1,161 @@
+"""
+numeric_backend.py
+
+Vectorized Sort & Search Backend
+--------------------------------
+
+The algorithms in sorting_algorithms.py and searching_algorithms.py loop over
+one element at a time in Python. When the input is a homogeneous numeric array
+(array.array or a 1-D NumPy array) we can hand the whole job to C code instead:
+
+    - sort           -> ndarray.sort() (in place)
+    - linear search  -> boolean mask (arr == target) + argmax
+    - binary search  -> np.searchsorted
+
+NumPy is optional. Without it, array.array inputs still use C-level helpers
+(array.index, bisect, sorted), and plain lists keep the pure-Python code.
+"""
+
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+NUMERIC_TYPECODES = "bBhHiIlLqQfd"  # array.array typecodes that hold numbers
+
+
+# -----------------------
+# 1. Detecting numeric inputs
+# -----------------------
+def is_numeric_array(arr):
+    """
+    True for array.array of numbers and 1-D NumPy arrays of ints/floats.
+    Plain lists return False, even if they only hold numbers.
+    """
+    if isinstance(arr, array):
+        return arr.typecode in NUMERIC_TYPECODES
+    if np is not None and isinstance(arr, np.ndarray):
+        return arr.ndim == 1 and arr.dtype.kind in "iuf"
+    return False
+
+
+def _as_numpy(arr):
+    """
+    Zero-copy NumPy view of a numeric array (None if NumPy is missing).
+    Writing into the view writes into the original array.array.
+    """
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr
+    return np.frombuffer(arr, dtype=arr.typecode)
+
+
+# -----------------------
+# 2. Kernels
+# -----------------------
+def sort(arr, reverse=False):
+    """
+    Sort a numeric array in place and return it.
+    """
+    view = _as_numpy(arr)
+    if view is not None:
+        view.sort()
+        if reverse:
+            view[:] = view[::-1].copy()
+    else:
+        arr[:] = array(arr.typecode, sorted(arr, reverse=reverse))
+    return arr
+
+
+def linear_search(arr, target):
+    """
+    Returns index of the first element equal to target, else -1
+    """
+    view = _as_numpy(arr)
+    if view is not None:
+        if len(view) == 0:
+            return -1
+        mask = view == target
+        index = int(mask.argmax())  # argmax stops at the first True
+        return index if mask[index] else -1
+    try:
+        return arr.index(target)
+    except ValueError:
+        return -1
+
+
+def binary_search(arr, target):
+    """
+    Returns index of target in a sorted numeric array, else -1
+    (the leftmost match when the value repeats).
+    """
+    view = _as_numpy(arr)
+    if view is not None:
+        index = int(np.searchsorted(view, target))
+    else:
+        index = bisect_left(arr, target)
+    if index < len(arr) and arr[index] == target:
+        return index
+    return -1
+
+
+def binary_search_many(sorted_arr, targets):
+    """
+    Look up many targets in one call.
+    Returns one index per target (-1 where it is missing): a NumPy array when
+    NumPy is installed, otherwise a list.
+
+    Time Complexity: O(m log n) for m targets, done in C with NumPy
+    """
+    if np is not None and (is_numeric_array(sorted_arr) or isinstance(sorted_arr, list)):
+        haystack = np.asarray(sorted_arr)
+        needles = np.asarray(targets)
+        if haystack.dtype.kind in "iuf" and needles.dtype.kind in "iuf":
+            if len(haystack) == 0:
+                return np.full(len(needles), -1, dtype=np.intp)
+            indices = np.searchsorted(haystack, needles)
+            clipped = np.minimum(indices, len(haystack) - 1)
+            return np.where(haystack[clipped] == needles, indices, -1)
+
+    # Fallback: one bisect per target (still C-level per probe)
+    n = len(sorted_arr)
+    results = []
+    for target in targets:
+        index = bisect_left(sorted_arr, target)
+        results.append(index if index < n and sorted_arr[index] == target else -1)
+    return results
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import random
+    import time
+
+    print("NumPy available?", np is not None)
+
+    data = array("i", [70, 11, 45, 23, 15, 10])
+    print("Is numeric array?", is_numeric_array(data))
+    print("Linear search 45:", linear_search(data, 45))
+    print("Sorted:", sort(data).tolist())
+    print("Binary search 23:", binary_search(data, 23))
+    print("Batched lookups:", [int(i) for i in binary_search_many(data, [10, 12, 70])])
+
+    # Million lookups in one call vs one call per lookup
+    n, m = 10**6, 10**6
+    keys = array("q", sorted(random.sample(range(n * 4), n)))
+    queries = [random.randrange(n * 4) for _ in range(m)]
+
+    start = time.perf_counter()
+    binary_search_many(keys, queries)
+    print(f"binary_search_many, {m} targets: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for q in queries:
+        binary_search(keys, q)
+    print(f"binary_search in a loop, {m} targets: {time.perf_counter() - start:.3f}s")
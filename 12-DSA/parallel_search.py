@@ -0,0 +1,243 @@
+"""
+parallel_search.py
+
+Parallel Linear Search in Python
+--------------------------------
+
+linear_search in searching_algorithms.py walks the array on one core.
+parallel_linear_search splits a numeric array into chunks and scans them in a
+process pool:
+
+    shared memory  [ chunk 0 | chunk 1 | chunk 2 | chunk 3 | ... ]
+                      worker A  worker B  worker A  worker B
+
+- The array is copied once into multiprocessing.shared_memory; every job
+  attaches to it by name (and detaches when done), so no chunk is ever
+  pickled and sent to a worker
+- Each worker scans its chunk in blocks (NumPy compare when available)
+
+Modes:
+    "first" - index of the first match, else -1
+    "all"   - list of every matching index
+    "count" - number of matches
+
+Early cancellation in "first" mode: as soon as some chunk finds a match, the
+best index so far goes into a shared value. Chunks that start after it are
+cancelled before they run, or stop at their next block if already running.
+Chunks before it keep going, because they may still hold an earlier match.
+
+Only numeric array.array / NumPy inputs can be shared like this. Other
+sequences are scanned in this process.
+
+Every call pays for copying the array into shared memory and starting the
+pool. With NumPy a single core already scans memory quickly, so the pool wins
+only with several real cores and large arrays (see benchmark_parallel_search).
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Value
+from multiprocessing.shared_memory import SharedMemory
+
+from numeric_backend import is_numeric_array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+MODES = ("first", "all", "count")
+BLOCK = 1 << 20  # Elements scanned between two cancellation checks
+NOT_FOUND = -1
+
+
+# -----------------------
+# 1. Worker side
+# -----------------------
+_best = None  # Shared best "first" match, set in every worker by _init_worker
+
+
+def _init_worker(best):
+    global _best
+    _best = best
+
+
+def _view(shm, typecode, length):
+    """The shared array as a NumPy array, or as a typed memoryview."""
+    buf = shm.buf
+    if np is not None:
+        return np.frombuffer(buf, dtype=typecode, count=length)
+    return buf[:length * array(typecode).itemsize].cast(typecode)
+
+
+def _cancelled(position):
+    """True once a match was found before position (nothing left to win)."""
+    best = _best.value
+    return best != NOT_FOUND and best < position
+
+
+def _record_first(index):
+    with _best.get_lock():
+        if _best.value == NOT_FOUND or index < _best.value:
+            _best.value = index
+
+
+def _scan_block(block, target, mode, offset):
+    if np is not None:
+        if mode == "count":
+            return int(np.count_nonzero(block == target))
+        hits = np.flatnonzero(block == target)
+        if mode == "first":
+            return int(hits[0]) + offset if len(hits) else NOT_FOUND
+        return (hits + offset).tolist()
+    values = block.tolist()
+    if mode == "count":
+        return values.count(target)
+    if mode == "first":
+        try:
+            return values.index(target) + offset
+        except ValueError:
+            return NOT_FOUND
+    return [offset + i for i, value in enumerate(values) if value == target]
+
+
+def _scan_chunk(name, typecode, length, start, stop, target, mode):
+    """Worker job: attach to the shared array, scan arr[start:stop], detach."""
+    shm = SharedMemory(name=name)
+    view = _view(shm, typecode, length)
+    found = [] if mode == "all" else 0 if mode == "count" else NOT_FOUND
+    try:
+        for lo in range(start, stop, BLOCK):
+            if mode == "first" and _cancelled(lo):
+                break
+            hi = min(lo + BLOCK, stop)
+            result = _scan_block(view[lo:hi], target, mode, lo)
+            if mode == "first":
+                if result != NOT_FOUND:
+                    _record_first(result)
+                    found = result
+                    break
+            else:
+                found += result
+    finally:
+        del view  # close() fails while a view of the buffer is still alive
+        shm.close()
+    return found
+
+
+# -----------------------
+# 2. Parallel Linear Search
+# -----------------------
+def _scan_locally(arr, target, mode):
+    if mode == "count":
+        return sum(1 for value in arr if value == target)
+    matches = (index for index, value in enumerate(arr) if value == target)
+    if mode == "first":
+        return next(matches, NOT_FOUND)
+    return list(matches)
+
+
+def parallel_linear_search(arr, target, mode="first", max_workers=None, chunk_size=None):
+    """
+    Scan arr for target on several cores.
+
+    arr         - array.array of numbers or 1-D NumPy array (anything else is
+                  scanned in this process)
+    mode        - "first" (index or -1), "all" (list of indices) or "count"
+    max_workers - worker processes (default: CPU count)
+    chunk_size  - elements per job (default: about 4 jobs per worker)
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    n = len(arr)
+    if not is_numeric_array(arr) or n == 0:
+        return _scan_locally(arr, target, mode)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(BLOCK, -(-n // (4 * max_workers)))
+    if np is not None and isinstance(arr, np.ndarray):
+        data = np.ascontiguousarray(arr)
+        typecode = data.dtype.str
+    else:
+        data, typecode = arr, arr.typecode
+
+    source = memoryview(data).cast("B")
+    shm = SharedMemory(create=True, size=max(1, source.nbytes))
+    try:
+        shm.buf[:source.nbytes] = source
+        source.release()
+        best = Value("q", NOT_FOUND)
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(best,)) as pool:
+            futures = [pool.submit(_scan_chunk, shm.name, typecode, n, start,
+                                   min(start + chunk_size, n), target, mode)
+                       for start in range(0, n, chunk_size)]
+            if mode == "first":
+                # Chunks finish in any order, but the answer is the first chunk with a match
+                for future in futures:
+                    index = future.result()
+                    if index != NOT_FOUND:
+                        for later in futures:
+                            later.cancel()
+                        return index
+                return NOT_FOUND
+            if mode == "count":
+                return sum(future.result() for future in futures)
+            matches = []
+            for future in futures:
+                matches.extend(future.result())
+            return matches
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_parallel_search(n=10**8, worker_counts=None):
+    """
+    Scan n int64 values for a value near the middle, one near the end and a
+    missing one, with numeric_backend.linear_search (one core) and with
+    parallel_linear_search at different worker counts.
+    """
+    import time
+
+    import numeric_backend
+
+    data = array("q", range(n))
+    targets = (("middle", n // 2), ("end", n - 1), ("missing", -1))
+    worker_counts = worker_counts or sorted({1, 2, os.cpu_count() or 1})
+
+    def timed(run):
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+
+    print(f"Linear search over {n:,} int64 values (CPU count {os.cpu_count()}):")
+    print(f"{'':<24}" + "".join(f"{name:>10}" for name, _ in targets) + f"{'count':>10}")
+    row = [timed(lambda: numeric_backend.linear_search(data, t)) for _, t in targets]
+    row.append(timed(lambda: data.count(-1)))
+    print(f"{'one core':<24}" + "".join(f"{t:>9.3f}s" for t in row))
+    for workers in worker_counts:
+        row = [timed(lambda: parallel_linear_search(data, t, max_workers=workers))
+               for _, t in targets]
+        row.append(timed(lambda: parallel_linear_search(data, -1, "count", max_workers=workers)))
+        print(f"{f'{workers} workers':<24}" + "".join(f"{t:>9.3f}s" for t in row))
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    data = array("q", [7, 3, 9, 3, 5] * 1_000_000)
+    print("First 9:", parallel_linear_search(data, 9, max_workers=2))
+    print("Count of 3:", parallel_linear_search(data, 3, "count", max_workers=2))
+    print("First five positions of 5:", parallel_linear_search(data, 5, "all", max_workers=2)[:5])
+    print("Missing value:", parallel_linear_search(data, 42, max_workers=2))
+    print("Plain list (scanned locally):", parallel_linear_search([10, 20, 30], 30))
+
+    if "--bench" in sys.argv:
+        benchmark_parallel_search()
@@ -0,0 +1,391 @@
+"""
+priority_queues.py
+
+Priority Queues in Python
+-------------------------
+A Priority Queue always removes the item with the smallest priority first,
+no matter when it was added. Items with equal priority leave in FIFO order
+(a running counter breaks ties), so the queues are stable.
+
+Same interface as the FIFO queues in queues.py, plus a priority:
+-----------
+1. enqueue(item, priority) - Add an item
+2. dequeue()               - Remove and return the item with the smallest priority
+3. peek()                  - Get that item without removing it
+4. is_empty()              - Check if the queue is empty
+5. size()                  - Get the number of items
+6. push_many(pairs)        - Add many (item, priority) pairs with one O(n) heapify
+
+Approaches:
+-----------
+1. BinaryHeapQueue  - binary heap on top of heapq (C implementation)
+2. DaryHeapQueue    - d children per node: shallower tree, cheaper enqueue
+3. IndexedHeapQueue - enqueue returns a handle for decrease_key / remove
+
+Time Complexity:
+    enqueue / dequeue  O(log n)     (d-ary: O(log_d n) up, O(d log_d n) down)
+    peek / size        O(1)
+    push_many          O(n + k)
+"""
+
+import heapq
+from itertools import count
+
+
+# -----------------------
+# Approach 1: Binary heap (heapq)
+# -----------------------
+class BinaryHeapQueue:
+    """
+    Heap entries are (priority, sequence, item) tuples, so heapq never
+    compares two items directly.
+    """
+
+    kind = "PriorityQueue"
+
+    def __init__(self, trace=None):
+        self.heap = []
+        self.counter = count()
+        self.trace = trace
+
+    def enqueue(self, item, priority):
+        heapq.heappush(self.heap, (priority, next(self.counter), item))
+        if self.trace:
+            self.trace(self, "enqueue", item)
+
+    def push_many(self, pairs):
+        """Add (item, priority) pairs, then restore the heap once in O(n)."""
+        counter = self.counter
+        self.heap.extend((priority, next(counter), item) for item, priority in pairs)
+        heapq.heapify(self.heap)
+
+    def dequeue(self):
+        if not self.heap:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
+            return None
+        item = heapq.heappop(self.heap)[2]
+        if self.trace:
+            self.trace(self, "dequeue", item)
+        return item
+
+    def peek(self):
+        if not self.heap:
+            if self.trace:
+                self.trace(self, "empty", "peek")
+            return None
+        return self.heap[0][2]
+
+    def is_empty(self):
+        return len(self.heap) == 0
+
+    def size(self):
+        return len(self.heap)
+
+
+# -----------------------
+# Approach 2: d-ary heap
+# -----------------------
+class DaryHeapQueue(BinaryHeapQueue):
+    """
+    Heap where node i has children d*i + 1 ... d*i + d.
+    With d = 4 the tree is half as deep as a binary heap, which helps
+    workloads with many more enqueues than dequeues.
+    """
+
+    def __init__(self, d=4, trace=None):
+        if d < 2:
+            raise ValueError("d must be at least 2")
+        super().__init__(trace)
+        self.d = d
+
+    def _sift_up(self, i):
+        heap, d = self.heap, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if entry < heap[parent]:
+                heap[i] = heap[parent]
+                i = parent
+            else:
+                break
+        heap[i] = entry
+
+    def _sift_down(self, i):
+        heap, d = self.heap, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            smallest = first
+            for child in range(first + 1, min(first + d, n)):
+                if heap[child] < heap[smallest]:
+                    smallest = child
+            if heap[smallest] < entry:
+                heap[i] = heap[smallest]
+                i = smallest
+            else:
+                break
+        heap[i] = entry
+
+    def enqueue(self, item, priority):
+        self.heap.append((priority, next(self.counter), item))
+        self._sift_up(len(self.heap) - 1)
+        if self.trace:
+            self.trace(self, "enqueue", item)
+
+    def push_many(self, pairs):
+        counter = self.counter
+        self.heap.extend((priority, next(counter), item) for item, priority in pairs)
+        # Bottom-up heapify: sift down every internal node, last one first
+        for i in range((len(self.heap) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def dequeue(self):
+        if not self.heap:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
+            return None
+        last = self.heap.pop()
+        if self.heap:
+            top = self.heap[0]
+            self.heap[0] = last
+            self._sift_down(0)
+        else:
+            top = last
+        if self.trace:
+            self.trace(self, "dequeue", top[2])
+        return top[2]
+
+
+# -----------------------
+# Approach 3: Indexed heap (handles)
+# -----------------------
+class HeapHandle:
+    """
+    Returned by IndexedHeapQueue.enqueue. It remembers where its entry sits
+    in the heap (pos), so decrease_key and remove do not have to search.
+    pos is -1 once the entry has left the queue.
+    """
+
+    __slots__ = ("priority", "seq", "item", "pos")
+
+    def __init__(self, priority, seq, item, pos):
+        self.priority = priority
+        self.seq = seq
+        self.item = item
+        self.pos = pos
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class IndexedHeapQueue(BinaryHeapQueue):
+    """
+    Binary heap of HeapHandle objects that keep their own position up to date.
+    Used by algorithms like Dijkstra that lower the priority of queued items.
+    """
+
+    def _place(self, i, handle):
+        self.heap[i] = handle
+        handle.pos = i
+
+    def _sift_up(self, i):
+        heap = self.heap
+        handle = heap[i]
+        while i > 0:
+            parent = (i - 1) // 2
+            if handle < heap[parent]:
+                self._place(i, heap[parent])
+                i = parent
+            else:
+                break
+        self._place(i, handle)
+
+    def _sift_down(self, i):
+        heap = self.heap
+        n = len(heap)
+        handle = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < handle:
+                self._place(i, heap[child])
+                i = child
+            else:
+                break
+        self._place(i, handle)
+
+    def enqueue(self, item, priority):
+        """Add item and return its handle."""
+        handle = HeapHandle(priority, next(self.counter), item, len(self.heap))
+        self.heap.append(handle)
+        self._sift_up(handle.pos)
+        if self.trace:
+            self.trace(self, "enqueue", item)
+        return handle
+
+    def push_many(self, pairs):
+        """Add (item, priority) pairs in O(n) and return their handles."""
+        start = len(self.heap)
+        self.heap.extend(HeapHandle(priority, next(self.counter), item, start + i)
+                         for i, (item, priority) in enumerate(pairs))
+        handles = self.heap[start:]
+        for i in range((len(self.heap) - 2) // 2, -1, -1):
+            self._sift_down(i)
+        return handles
+
+    def _remove_at(self, i):
+        heap = self.heap
+        handle = heap[i]
+        last = heap.pop()
+        if i < len(heap):
+            self._place(i, last)
+            # The moved entry may belong above or below its new slot
+            if i > 0 and last < heap[(i - 1) // 2]:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        handle.pos = -1
+        return handle
+
+    def dequeue(self):
+        if not self.heap:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
+            return None
+        item = self._remove_at(0).item
+        if self.trace:
+            self.trace(self, "dequeue", item)
+        return item
+
+    def peek(self):
+        if not self.heap:
+            if self.trace:
+                self.trace(self, "empty", "peek")
+            return None
+        return self.heap[0].item
+
+    def contains(self, handle):
+        return 0 <= handle.pos < len(self.heap) and self.heap[handle.pos] is handle
+
+    def decrease_key(self, handle, priority):
+        """Lower the priority of a queued item. O(log n)"""
+        if not self.contains(handle):
+            raise KeyError("handle is not in this queue")
+        if priority > handle.priority:
+            raise ValueError("new priority is larger than the current one")
+        handle.priority = priority
+        self._sift_up(handle.pos)
+
+    def update(self, handle, priority):
+        """Change the priority of a queued item in either direction. O(log n)"""
+        if not self.contains(handle):
+            raise KeyError("handle is not in this queue")
+        handle.priority = priority
+        self._sift_up(handle.pos)
+        self._sift_down(handle.pos)
+
+    def remove(self, handle):
+        """Remove a queued item by its handle and return the item. O(log n)"""
+        if not self.contains(handle):
+            raise KeyError("handle is not in this queue")
+        return self._remove_at(handle.pos).item
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_priority_queues(ops=10**6):
+    """
+    ops/2 enqueues followed by ops/2 dequeues with random priorities,
+    plus bulk loading with push_many, compared with raw heapq.
+    """
+    import random
+    import time
+
+    n = ops // 2
+    priorities = [random.random() for _ in range(n)]
+
+    def raw_heapq():
+        heap = []
+        push, pop = heapq.heappush, heapq.heappop
+        for seq, p in enumerate(priorities):
+            push(heap, (p, seq, seq))
+        for _ in range(n):
+            pop(heap)
+
+    def queue_case(make):
+        def run():
+            q = make()
+            for i, p in enumerate(priorities):
+                q.enqueue(i, p)
+            for _ in range(n):
+                q.dequeue()
+        return run
+
+    def bulk_case(make):
+        def run():
+            q = make()
+            q.push_many(zip(range(n), priorities))
+        return run
+
+    def raw_heapify():
+        heap = [(p, seq, seq) for seq, p in enumerate(priorities)]
+        heapq.heapify(heap)
+
+    cases = [
+        ("heapq (raw tuples)", raw_heapq),
+        ("BinaryHeapQueue", queue_case(BinaryHeapQueue)),
+        ("DaryHeapQueue d=4", queue_case(DaryHeapQueue)),
+        ("IndexedHeapQueue", queue_case(IndexedHeapQueue)),
+        ("heapq.heapify", raw_heapify),
+        ("Binary push_many", bulk_case(BinaryHeapQueue)),
+        ("Dary push_many", bulk_case(DaryHeapQueue)),
+        ("Indexed push_many", bulk_case(IndexedHeapQueue)),
+    ]
+    print(f"{ops:,} operations ({n:,} enqueue + {n:,} dequeue), bulk load of {n:,}:")
+    for name, run in cases:
+        start = time.perf_counter()
+        run()
+        print(f"  {name:<22}{time.perf_counter() - start:>8.3f}s")
+
+
+# -----------------------
+# Example usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+    from tracing import print_event
+
+    print("Binary heap priority queue:")
+    pq = BinaryHeapQueue(trace=print_event)
+    pq.enqueue("write report", 2)
+    pq.enqueue("fix bug", 1)
+    pq.enqueue("reply to email", 2)
+    print("Front element:", pq.peek())
+    pq.dequeue()
+    pq.dequeue()  # Equal priorities leave in insertion order
+    print("Queue size:", pq.size())
+
+    print("\nd-ary heap with push_many:")
+    dq = DaryHeapQueue(d=4)
+    dq.push_many([("c", 3), ("a", 1), ("d", 4), ("b", 2)])
+    print("Dequeue order:", [dq.dequeue() for _ in range(dq.size())])
+
+    print("\nIndexed heap with decrease_key and remove:")
+    iq = IndexedHeapQueue()
+    a = iq.enqueue("A", 10)
+    b = iq.enqueue("B", 20)
+    c = iq.enqueue("C", 30)
+    iq.decrease_key(c, 5)
+    iq.remove(a)
+    print("Dequeue order:", [iq.dequeue() for _ in range(iq.size())])
+
+    if "--bench" in sys.argv:
+        benchmark_priority_queues()
@@ -13,6 +13,20 @@ Operations:
 3. peek()        - Get the front element without removing it
 4. is_empty()    - Check if the queue is empty
 5. size()        - Get the number of elements in the queue
+
+Operations are silent by default. Pass trace=print_event (see tracing.py)
+to print every enqueue/dequeue, or any other hook(container, event, item).
+
+Approaches:
+-----------
+1. QueueList       - Python list (dequeue is O(n): pop(0) shifts every element)
+2. QueueDeque      - collections.deque (O(1) at both ends)
+3. RingBufferQueue - preallocated circular buffer with head/tail indices
+4. ConcurrentQueue - thread-safe, blocking, optionally bounded
+5. AsyncQueue      - the same for asyncio coroutines
+
+For priority ordering instead of FIFO, see priority_queues.py.
+graphs.py runs breadth-first search on QueueDeque.
 """
 
 # -----------------------
@@ -20,24 +34,31 @@ Operations:
 # -----------------------
 
 class QueueList:
-    def __init__(self):
+    kind = "Queue"
+
+    def __init__(self, trace=None):
         self.queue = []
+        self.trace = trace
 
     def enqueue(self, item):
         self.queue.append(item)
-        print(f"Enqueued: {item}")
+        if self.trace:
+            self.trace(self, "enqueue", item)
 
     def dequeue(self):
-        if self.is_empty():
-            print("Queue is empty! Cannot dequeue.")
+        if not self.queue:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
             return None
         item = self.queue.pop(0)
-        print(f"Dequeued: {item}")
+        if self.trace:
+            self.trace(self, "dequeue", item)
         return item
 
     def peek(self):
-        if self.is_empty():
-            print("Queue is empty!")
+        if not self.queue:
+            if self.trace:
+                self.trace(self, "empty", "peek")
             return None
         return self.queue[0]
 
@@ -54,24 +75,31 @@ class QueueList:
 from collections import deque
 
 class QueueDeque:
-    def __init__(self):
+    kind = "Queue"
+
+    def __init__(self, trace=None):
         self.queue = deque()
+        self.trace = trace
 
     def enqueue(self, item):
         self.queue.append(item)
-        print(f"Enqueued: {item}")
+        if self.trace:
+            self.trace(self, "enqueue", item)
 
     def dequeue(self):
-        if self.is_empty():
-            print("Queue is empty! Cannot dequeue.")
+        if not self.queue:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
             return None
         item = self.queue.popleft()
-        print(f"Dequeued: {item}")
+        if self.trace:
+            self.trace(self, "dequeue", item)
         return item
 
     def peek(self):
-        if self.is_empty():
-            print("Queue is empty!")
+        if not self.queue:
+            if self.trace:
+                self.trace(self, "empty", "peek")
             return None
         return self.queue[0]
 
@@ -82,12 +110,464 @@ class QueueDeque:
         return len(self.queue)
 
 
+# -----------------------
+# Approach 3: Ring buffer (circular array)
+# -----------------------
+from array import array
+
+class RingBufferQueue:
+    """
+    Queue stored in a preallocated list (or array.array for numbers).
+    head points at the front item; the rear is (head + count) % capacity.
+    Indices wrap around instead of shifting elements, so dequeue is O(1).
+
+    capacity  - initial number of slots
+    growable  - double the capacity when full (otherwise the queue is bounded)
+    overwrite - when full and not growable, drop the oldest item to make room
+    typecode  - store numbers in array.array(typecode) instead of a list
+    trace     - optional event hook (see tracing.py)
+
+    Like ConcurrentQueue.enqueue with timeout=0, enqueue returns False when
+    a bounded queue without overwrite is full and the item is not added.
+    enqueue_many/dequeue_many trace one event per batch, not per item.
+    """
+
+    kind = "Queue"
+
+    def __init__(self, capacity=16, growable=True, overwrite=False, typecode=None, trace=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.typecode = typecode
+        self.growable = growable
+        self.overwrite = overwrite
+        self.queue = self._new_storage(capacity)
+        self.head = 0
+        self.count = 0
+        self.trace = trace
+
+    def _new_storage(self, capacity):
+        if self.typecode:
+            return array(self.typecode, [0]) * capacity
+        return [None] * capacity
+
+    def _grow(self, min_capacity):
+        capacity = len(self.queue)
+        while capacity < min_capacity:
+            capacity *= 2
+        storage = self._new_storage(capacity)
+        storage[:self.count] = self._items()
+        self.queue = storage
+        self.head = 0
+
+    def _items(self, k=None):
+        """Front k items (all by default) in FIFO order, as at most two slices."""
+        k = self.count if k is None else k
+        end = self.head + k
+        if end <= len(self.queue):
+            return self.queue[self.head:end]
+        return self.queue[self.head:] + self.queue[:end - len(self.queue)]
+
+    def _write(self, start, items):
+        """Copy items into the buffer starting at slot start, wrapping around."""
+        capacity = len(self.queue)
+        first = min(len(items), capacity - start)
+        self.queue[start:start + first] = items[:first]
+        self.queue[:len(items) - first] = items[first:]
+
+    def _clear(self, start, k):
+        """Drop references held by k slots from start (list storage only)."""
+        if self.typecode:
+            return
+        capacity = len(self.queue)
+        first = min(k, capacity - start)
+        self.queue[start:start + first] = [None] * first
+        self.queue[:k - first] = [None] * (k - first)
+
+    def enqueue(self, item):
+        """Add item at the rear. Returns False if the queue is full and item was dropped."""
+        capacity = len(self.queue)
+        if self.count == capacity:
+            if self.growable:
+                self._grow(capacity * 2)
+                capacity = len(self.queue)
+            elif self.overwrite:
+                dropped = self.queue[self.head]
+                self.queue[self.head] = item
+                self.head = (self.head + 1) % capacity
+                if self.trace:
+                    self.trace(self, "overwrite", dropped)
+                    self.trace(self, "enqueue", item)
+                return True
+            else:
+                if self.trace:
+                    self.trace(self, "full", "enqueue")
+                return False
+        self.queue[(self.head + self.count) % capacity] = item
+        self.count += 1
+        if self.trace:
+            self.trace(self, "enqueue", item)
+        return True
+
+    def dequeue(self):
+        if not self.count:
+            if self.trace:
+                self.trace(self, "empty", "dequeue")
+            return None
+        item = self.queue[self.head]
+        if not self.typecode:
+            self.queue[self.head] = None
+        self.head = (self.head + 1) % len(self.queue)
+        self.count -= 1
+        if self.trace:
+            self.trace(self, "dequeue", item)
+        return item
+
+    def enqueue_many(self, items):
+        """
+        Add several items with at most two slice copies.
+        Returns how many were added (fewer than len(items) only when bounded).
+        """
+        items = list(items) if not self.typecode else array(self.typecode, items)
+        capacity = len(self.queue)
+        if self.count + len(items) > capacity:
+            if self.growable:
+                self._grow(self.count + len(items))
+                capacity = len(self.queue)
+            elif self.overwrite:
+                if len(items) >= capacity:
+                    # Only the newest `capacity` items survive
+                    if self.trace:
+                        self.trace(self, "overwrite", self._items() + items[:len(items) - capacity])
+                        self.trace(self, "enqueue_many", items)
+                    self.queue[:] = items[len(items) - capacity:]
+                    self.head = 0
+                    self.count = capacity
+                    return len(items)
+                dropped = self.count + len(items) - capacity
+                if self.trace:
+                    self.trace(self, "overwrite", self._items(dropped))
+                self._clear(self.head, dropped)
+                self.head = (self.head + dropped) % capacity
+                self.count -= dropped
+            else:
+                items = items[:capacity - self.count]
+                if self.trace:
+                    self.trace(self, "full", "enqueue_many")
+        self._write((self.head + self.count) % capacity, items)
+        self.count += len(items)
+        if self.trace and items:
+            self.trace(self, "enqueue_many", items)
+        return len(items)
+
+    def dequeue_many(self, k):
+        """Remove and return up to k items from the front, in FIFO order."""
+        k = max(0, min(k, self.count))
+        if not self.count and self.trace:
+            self.trace(self, "empty", "dequeue_many")
+        items = self._items(k)
+        self._clear(self.head, k)
+        self.head = (self.head + k) % len(self.queue)
+        self.count -= k
+        if self.trace and k:
+            self.trace(self, "dequeue_many", items)
+        return items
+
+    def peek(self):
+        if not self.count:
+            if self.trace:
+                self.trace(self, "empty", "peek")
+            return None
+        return self.queue[self.head]
+
+    def is_empty(self):
+        return self.count == 0
+
+    def is_full(self):
+        return self.count == len(self.queue)
+
+    def size(self):
+        return self.count
+
+    def capacity(self):
+        return len(self.queue)
+
+
+# -----------------------
+# Approach 4: Thread-safe queue (producer/consumer)
+# -----------------------
+import threading
+
+class ConcurrentQueue:
+    """
+    deque guarded by one lock and two conditions:
+        not_empty - consumers wait here until an item arrives
+        not_full  - producers wait here while a bounded queue is full (backpressure)
+
+    timeout=None blocks forever, timeout=0 never blocks.
+    Nothing is printed per operation: many threads share the queue.
+    """
+
+    def __init__(self, maxsize=0):
+        self.queue = deque()
+        self.maxsize = maxsize  # 0 means unbounded
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self.queue) < self.maxsize
+
+    def enqueue(self, item, timeout=None):
+        """Add item, waiting for room if bounded. Returns False on timeout."""
+        with self.not_full:
+            if not self._has_room() and not self.not_full.wait_for(self._has_room, timeout):
+                return False
+            self.queue.append(item)
+            self.not_empty.notify()
+        return True
+
+    def _has_items(self):
+        return len(self.queue) > 0
+
+    def dequeue(self, timeout=None):
+        """Remove and return the front item, or None on timeout."""
+        with self.not_empty:
+            if not self.queue and not self.not_empty.wait_for(self._has_items, timeout):
+                return None
+            item = self.queue.popleft()
+            self.not_full.notify()
+        return item
+
+    def dequeue_many(self, max_items, timeout=None):
+        """
+        Wait for at least one item, then take up to max_items under one lock.
+        Returns an empty list on timeout.
+        """
+        with self.not_empty:
+            if not self.queue and not self.not_empty.wait_for(self._has_items, timeout):
+                return []
+            popleft = self.queue.popleft
+            items = [popleft() for _ in range(min(max_items, len(self.queue)))]
+            self.not_full.notify(len(items))
+        return items
+
+    def peek(self):
+        with self.lock:
+            return self.queue[0] if self.queue else None
+
+    def is_empty(self):
+        with self.lock:
+            return len(self.queue) == 0
+
+    def size(self):
+        with self.lock:
+            return len(self.queue)
+
+
+# -----------------------
+# Approach 5: asyncio queue
+# -----------------------
+import asyncio
+
+class AsyncQueue:
+    """
+    Coroutine version of ConcurrentQueue for code running on one event loop.
+    Waiting coroutines park on a future; the next enqueue/dequeue wakes one of them.
+    enqueue/dequeue/dequeue_many must be awaited.
+    """
+
+    def __init__(self, maxsize=0):
+        self.queue = deque()
+        self.maxsize = maxsize  # 0 means unbounded
+        self.getters = deque()  # Futures of coroutines waiting for an item
+        self.putters = deque()  # Futures of coroutines waiting for room
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self.queue) < self.maxsize
+
+    def _has_items(self):
+        return len(self.queue) > 0
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready, timeout):
+        """Wait until ready() is true. Returns False on timeout."""
+        if ready():
+            return True
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout(timeout):
+                while not ready():
+                    waiter = loop.create_future()
+                    waiters.append(waiter)
+                    try:
+                        await waiter
+                    except BaseException:
+                        waiter.cancel()
+                        if waiter in waiters:
+                            waiters.remove(waiter)
+                        # We were woken up but are leaving: pass the wake-up on
+                        if ready() and not waiter.cancelled():
+                            self._wake_next(waiters)
+                        raise
+        except TimeoutError:
+            return False
+        return True
+
+    async def enqueue(self, item, timeout=None):
+        """Add item, waiting for room if bounded. Returns False on timeout."""
+        if not await self._wait(self.putters, self._has_room, timeout):
+            return False
+        self.queue.append(item)
+        self._wake_next(self.getters)
+        return True
+
+    async def dequeue(self, timeout=None):
+        """Remove and return the front item, or None on timeout."""
+        if not await self._wait(self.getters, self._has_items, timeout):
+            return None
+        item = self.queue.popleft()
+        self._wake_next(self.putters)
+        return item
+
+    async def dequeue_many(self, max_items, timeout=None):
+        """Wait for at least one item, then take up to max_items. [] on timeout."""
+        if not await self._wait(self.getters, self._has_items, timeout):
+            return []
+        popleft = self.queue.popleft
+        items = [popleft() for _ in range(min(max_items, len(self.queue)))]
+        for _ in items:
+            self._wake_next(self.putters)
+        return items
+
+    def peek(self):
+        return self.queue[0] if self.queue else None
+
+    def is_empty(self):
+        return len(self.queue) == 0
+
+    def size(self):
+        return len(self.queue)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_queues(sizes=(10**3, 10**4, 10**5)):
+    """
+    Fill each queue with n items, then drain it (tracing off).
+    """
+    import time
+
+    queues = [
+        ("QueueList", QueueList),
+        ("QueueDeque", QueueDeque),
+        ("RingBufferQueue", RingBufferQueue),
+    ]
+    print(f"{'n':>10}  " + "".join(f"{name:>18}" for name, _ in queues) + "   (ops/sec)")
+    for n in sizes:
+        row = f"{n:>10}  "
+        for name, cls in queues:
+            q = cls()
+            start = time.perf_counter()
+            for i in range(n):
+                q.enqueue(i)
+            for _ in range(n):
+                q.dequeue()
+            elapsed = time.perf_counter() - start
+            row += f"{2 * n / elapsed:>18,.0f}"
+        print(row)
+
+    n = sizes[-1]
+    q = RingBufferQueue(typecode="q")
+    start = time.perf_counter()
+    q.enqueue_many(range(n))
+    while not q.is_empty():
+        q.dequeue_many(1024)
+    elapsed = time.perf_counter() - start
+    print(f"RingBufferQueue enqueue_many/dequeue_many, n={n}: {2 * n / elapsed:,.0f} ops/sec")
+
+
+def benchmark_concurrent_queues(worker_counts=(1, 2, 4, 8, 16, 32), items=100_000, maxsize=1024):
+    """
+    k producers and k consumers move `items` items through a bounded queue.
+    ConcurrentQueue is compared with queue.Queue, AsyncQueue with asyncio.Queue.
+    """
+    import queue
+    import time
+
+    done = object()  # Sentinel that tells a consumer to stop
+
+    def run_threads(k, put, get):
+        per_producer = items // k
+        producers = [threading.Thread(target=lambda: [put(i) for i in range(per_producer)])
+                     for _ in range(k)]
+
+        def consume():
+            while get() is not done:
+                pass
+
+        consumers = [threading.Thread(target=consume) for _ in range(k)]
+        start = time.perf_counter()
+        for t in producers + consumers:
+            t.start()
+        for t in producers:
+            t.join()
+        for _ in consumers:
+            put(done)
+        for t in consumers:
+            t.join()
+        return per_producer * k / (time.perf_counter() - start)
+
+    async def run_tasks(k, put, get):
+        per_producer = items // k
+
+        async def produce():
+            for i in range(per_producer):
+                await put(i)
+
+        async def consume():
+            while await get() is not done:
+                pass
+
+        start = time.perf_counter()
+        consumers = [asyncio.create_task(consume()) for _ in range(k)]
+        await asyncio.gather(*(produce() for _ in range(k)))
+        for _ in consumers:
+            await put(done)
+        await asyncio.gather(*consumers)
+        return per_producer * k / (time.perf_counter() - start)
+
+    async def async_case(k, make_queue, put_name, get_name):
+        q = make_queue()
+        return await run_tasks(k, getattr(q, put_name), getattr(q, get_name))
+
+    print(f"{'k':>4}{'queue.Queue':>16}{'ConcurrentQueue':>18}{'asyncio.Queue':>16}{'AsyncQueue':>14}   (items/sec)")
+    for k in worker_counts:
+        std = queue.Queue(maxsize)
+        ours = ConcurrentQueue(maxsize)
+        row = f"{k:>4}"
+        row += f"{run_threads(k, std.put, std.get):>16,.0f}"
+        row += f"{run_threads(k, ours.enqueue, ours.dequeue):>18,.0f}"
+        row += f"{asyncio.run(async_case(k, lambda: asyncio.Queue(maxsize), 'put', 'get')):>16,.0f}"
+        row += f"{asyncio.run(async_case(k, lambda: AsyncQueue(maxsize), 'enqueue', 'dequeue')):>14,.0f}"
+        print(row)
+
+
 # -----------------------
 # Example usage
 # -----------------------
 if __name__ == "__main__":
+    from tracing import print_event
+
     print("Queue using list:")
-    q1 = QueueList()
+    q1 = QueueList(trace=print_event)
     q1.enqueue(10)
     q1.enqueue(20)
     q1.enqueue(30)
@@ -98,7 +578,7 @@ if __name__ == "__main__":
     print("Is queue empty?", q1.is_empty())
 
     print("\nQueue using deque:")
-    q2 = QueueDeque()
+    q2 = QueueDeque(trace=print_event)
     q2.enqueue(100)
     q2.enqueue(200)
     q2.enqueue(300)
@@ -107,3 +587,35 @@ if __name__ == "__main__":
     q2.dequeue()
     print("Queue size:", q2.size())
     print("Is queue empty?", q2.is_empty())
+
+    print("\nQueue using ring buffer (capacity 3, overwrite when full):")
+    q3 = RingBufferQueue(capacity=3, growable=False, overwrite=True, trace=print_event)
+    q3.enqueue(1)
+    q3.enqueue(2)
+    q3.enqueue(3)
+    q3.enqueue(4)
+    print("Front element:", q3.peek())
+    q3.enqueue_many([5, 6])
+    print("Dequeued two:", q3.dequeue_many(2))
+    print("Queue size:", q3.size())
+
+    print("\nThread-safe queue (bounded, producer thread + consumer):")
+    q4 = ConcurrentQueue(maxsize=2)
+    producer = threading.Thread(target=lambda: [q4.enqueue(i) for i in range(5)])
+    producer.start()
+    print("Consumed:", [q4.dequeue(timeout=1) for _ in range(5)])
+    producer.join()
+    print("Dequeue on empty queue with timeout:", q4.dequeue(timeout=0.1))
+
+    async def async_demo():
+        q5 = AsyncQueue()
+        await q5.enqueue("job-1")
+        await q5.enqueue("job-2")
+        return await q5.dequeue_many(10)
+
+    print("\nAsync queue batch drain:", asyncio.run(async_demo()))
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_queues()
+        benchmark_concurrent_queues()
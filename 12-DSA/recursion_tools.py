@@ -0,0 +1,178 @@
+"""
+recursion_tools.py
+
+Explicit-Stack Helpers for Recursive Algorithms
+-----------------------------------------------
+
+Recursive code is short, but every call costs a Python frame and Python stops
+at about 1000 nested calls (RecursionError). A degenerate tree with 10,000
+nodes in a line is enough to crash a recursive traversal.
+
+The same algorithms can keep their own stack in a list instead:
+    - No RecursionError, however deep the input is
+    - No function call per step, just list.append / list.pop
+
+This module holds the explicit-stack versions used by the "iterative" modes
+in trees.py and searching_algorithms.py. They work with any node object that
+has .left and .right attributes (like TreeNode).
+"""
+
+
+# -----------------------
+# 1. Depth-first tree traversals
+# -----------------------
+def iter_preorder(root):
+    """
+    Yield nodes Root -> Left -> Right using an explicit stack.
+    """
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        # Push right first so left is processed first
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+
+def iter_inorder(root):
+    """
+    Yield nodes Left -> Root -> Right using an explicit stack.
+    """
+    stack = []
+    node = root
+    while stack or node:
+        while node:  # Go as far left as possible
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def iter_postorder(root):
+    """
+    Yield nodes Left -> Right -> Root using an explicit stack.
+    A node is yielded once its right subtree is done (or empty).
+    """
+    stack = []
+    node = root
+    last_visited = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last_visited:
+            node = top.right
+        else:
+            yield top
+            last_visited = stack.pop()
+
+
+# -----------------------
+# 2. Bounded binary search
+# -----------------------
+def binary_search_range(arr, target, low, high):
+    """
+    Loop version of binary_search_recursive: same low/high arguments,
+    but low and high are updated in place instead of passed to a new call.
+    """
+    while low <= high:
+        mid = (low + high) // 2
+        if arr[mid] == target:
+            return mid
+        elif arr[mid] < target:
+            low = mid + 1
+        else:
+            high = mid - 1
+    return -1
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_recursion(tree_size=2**16 - 1, deep_size=10**5, searches=10**5):
+    """
+    Compare the recursive and iterative modes of trees.py and searching_algorithms.py.
+    """
+    import contextlib
+    import io
+    import random
+    import time
+    from searching_algorithms import binary_search_recursive
+    from trees import BinaryTree, TreeNode
+
+    def timed(func, *args):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # Traversals print every node
+            func(*args)
+        return time.perf_counter() - start
+
+    # Balanced tree with tree_size nodes
+    nodes = [TreeNode(i) for i in range(tree_size)]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < tree_size:
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < tree_size:
+            node.right = nodes[2 * i + 2]
+    balanced = BinaryTree(None)
+    balanced.root = nodes[0]
+
+    print(f"Balanced tree, {tree_size:,} nodes (ns per visited node):")
+    for name in ("preorder", "inorder", "postorder"):
+        method = getattr(balanced, name)
+        recursive = timed(method, balanced.root)
+        iterative = timed(lambda: method(balanced.root, iterative=True))
+        print(f"  {name:<10} recursive {recursive / tree_size * 1e9:>6.0f}"
+              f"   iterative {iterative / tree_size * 1e9:>6.0f}")
+
+    # Degenerate tree: one long left spine
+    deep = BinaryTree(0)
+    node = deep.root
+    for i in range(1, deep_size):
+        node.left = TreeNode(i)
+        node = node.left
+    print(f"\nDegenerate tree, depth {deep_size:,}:")
+    try:
+        timed(deep.inorder, deep.root)
+        print("  recursive: finished")
+    except RecursionError:
+        print("  recursive: RecursionError")
+    print(f"  iterative: {timed(lambda: deep.inorder(deep.root, iterative=True)):.3f}s")
+
+    # Binary search, ns per call
+    arr = list(range(0, 2 * 10**6, 2))
+    targets = [random.randrange(2 * 10**6) for _ in range(searches)]
+    high = len(arr) - 1
+    recursive = timed(lambda: [binary_search_recursive(arr, t, 0, high) for t in targets])
+    iterative = timed(lambda: [binary_search_recursive(arr, t, 0, high, iterative=True) for t in targets])
+    print(f"\nbinary_search_recursive, {len(arr):,} keys (ns per call):")
+    print(f"  recursive {recursive / searches * 1e9:>6.0f}   iterative {iterative / searches * 1e9:>6.0f}")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    from trees import TreeNode
+
+    #        1
+    #      /   \
+    #     2     3
+    #    / \
+    #   4   5
+    root = TreeNode(1)
+    root.left, root.right = TreeNode(2), TreeNode(3)
+    root.left.left, root.left.right = TreeNode(4), TreeNode(5)
+
+    print("Pre-order: ", [node.data for node in iter_preorder(root)])
+    print("In-order:  ", [node.data for node in iter_inorder(root)])
+    print("Post-order:", [node.data for node in iter_postorder(root)])
+    print("Binary search for 7 in [1, 3, 5, 7, 9]:", binary_search_range([1, 3, 5, 7, 9], 7, 0, 4))
+
+    if "--bench" in sys.argv:
+        benchmark_recursion()
@@ -15,7 +15,22 @@ Searching algorithms help us find elements in a data structure efficiently.
     - Requires a **sorted list**
     - Divide and conquer approach
     - Time Complexity: O(log n)
+
+3️⃣ Interpolation, Exponential & Galloping Search:
+    - Also need sorted data, but choose their probes more cleverly
+    - Interpolation: O(log log n) on evenly spread numeric keys
+    - Exponential / Galloping: O(log d) when the target is d steps from the start / a hint
+    - auto_search samples the keys and picks interpolation or binary search
+
+Numeric array.array / NumPy inputs are handed to numeric_backend.py,
+which does the same work with vectorized kernels.
 """
+import math
+from bisect import bisect_left
+
+import numeric_backend
+from recursion_tools import binary_search_range
+from numeric_backend import binary_search_many, is_numeric_array
 
 # -----------------------
 # 1. Linear Search
@@ -24,6 +39,8 @@ def linear_search(arr, target):
     """
     Returns index of target if found, else -1
     """
+    if is_numeric_array(arr):
+        return numeric_backend.linear_search(arr, target)
     for index, value in enumerate(arr):
         if value == target:
             return index
@@ -44,6 +61,8 @@ def binary_search_iterative(arr, target):
     Returns index of target if found, else -1
     List must be sorted
     """
+    if is_numeric_array(arr):
+        return numeric_backend.binary_search(arr, target)
     low = 0
     high = len(arr) - 1
 
@@ -67,7 +86,13 @@ print(f"Binary Search (Iterative): {target} found at index {index}" if index !=
 # -----------------------
 # 3. Binary Search (Recursive)
 # -----------------------
-def binary_search_recursive(arr, target, low, high):
+def binary_search_recursive(arr, target, low, high, iterative=False):
+    """
+    Returns index of target in arr[low:high + 1] if found, else -1
+    iterative=True runs the same search as a loop (no new call per step)
+    """
+    if iterative:
+        return binary_search_range(arr, target, low, high)
     if low > high:
         return -1
     mid = (low + high) // 2
@@ -85,11 +110,240 @@ print(f"Binary Search (Recursive): {target} found at index {index}" if index !=
 
 
 # -----------------------
-# 4. Notes & Tips
+# 4. Batched Binary Search
+# -----------------------
+# binary_search_many(sorted_arr, targets) answers many lookups in one call
+# (np.searchsorted when NumPy is installed, one bisect per target otherwise).
+targets = [11, 50, 70]
+print(f"Batched Binary Search: {targets} -> {[int(i) for i in binary_search_many(sorted_arr, targets)]}")
+
+
+# -----------------------
+# 5. Interpolation, Exponential & Galloping Search
+# -----------------------
+def interpolation_search(arr, target):
+    """
+    Returns index of target in a sorted list of numbers, else -1
+    Guesses the position from the values, like opening a phone book near "S":
+        pos = low + (target - arr[low]) * (high - low) / (arr[high] - arr[low])
+    O(log log n) probes on evenly spread keys. A guess that does not halve the
+    range is followed by one plain bisection step, so skewed keys still cost
+    at most about 2 * log2(n) probes.
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    low, high = 0, n - 1
+    low_value, high_value = arr[low], arr[high]
+    if target <= low_value:
+        return 0 if low_value == target else -1
+    if target > high_value:
+        return -1
+    # arr[low] < target <= arr[high]: the leftmost match, if any, is at (low, high]
+    halve = False
+    while high - low > 1:
+        if halve:
+            pos = (low + high) // 2
+        else:
+            pos = low + 1 + int((target - low_value) * (high - low - 1) // (high_value - low_value))
+            pos = min(pos, high - 1)
+        value = arr[pos]
+        width = high - low
+        if value < target:
+            low, low_value = pos, value
+        else:
+            high, high_value = pos, value
+        halve = not halve and 2 * (high - low) > width
+    return high if high_value == target else -1
+
+
+def _before(arr, i, target):
+    """arr[i] < target, where positions past the end count as larger than anything."""
+    try:
+        return arr[i] < target
+    except IndexError:
+        return False
+
+
+def exponential_search(arr, target):
+    """
+    Returns index of target in a sorted sequence, else -1
+    Checks positions 1, 2, 4, 8, ... until it passes target, then binary
+    searches the last gap. Only uses arr[i] (IndexError past the end), never
+    len(arr), so it also works on streamed data of unknown length.
+    O(log i) probes, where i is the position of target
+    """
+    bound = 1
+    while _before(arr, bound, target):
+        bound *= 2
+    low, high = bound // 2, bound
+    while low < high:
+        mid = (low + high) // 2
+        if _before(arr, mid, target):
+            low = mid + 1
+        else:
+            high = mid
+    try:
+        return low if arr[low] == target else -1
+    except IndexError:
+        return -1
+
+
+def galloping_search(arr, target, hint=0):
+    """
+    Returns index of target in a sorted list, else -1
+    Starts at a guessed position (hint) and gallops away from it with steps
+    1, 2, 4, ... before a bisect of the final gap. Cheap when target is near
+    hint, e.g. the previous answer when looking up keys in increasing order.
+    O(log d) probes, where d is the distance from hint to target
+    """
+    n = len(arr)
+    if n == 0:
+        return -1
+    hint = min(max(hint, 0), n - 1)
+    step = 1
+    if arr[hint] < target:  # Gallop right
+        low, high = hint + 1, hint + 1
+        while high < n and arr[high] < target:
+            low = high + 1
+            high = hint + 2 * step
+            step *= 2
+        high = min(high, n)
+    else:  # Gallop left
+        low, high = hint, hint
+        while low > 0 and arr[low - 1] >= target:
+            high = low - 1
+            low = max(0, hint - 2 * step)
+            step *= 2
+    index = bisect_left(arr, target, low, high)
+    return index if index < n and arr[index] == target else -1
+
+
+class _ProbeCounter:
+    """Sequence wrapper that counts how often an element is read."""
+
+    def __init__(self, data):
+        self.data = data
+        self.probes = 0
+
+    def __getitem__(self, i):
+        self.probes += 1
+        return self.data[i]
+
+    def __len__(self):
+        return len(self.data)
+
+
+def plan_search(arr, samples=32):
+    """
+    Pick the cheapest search for a sorted list by sampling its keys.
+    Runs interpolation_search for `samples` keys spread over the list and
+    counts the elements it reads. Binary search reads about log2(n) elements
+    per query and does less arithmetic per read, so interpolation has to need
+    fewer than half as many reads to be picked. Returns the search function.
+    """
+    n = len(arr)
+    if is_numeric_array(arr) or n < 64 or not isinstance(arr[0], (int, float)):
+        return binary_search_iterative
+    counted = _ProbeCounter(arr)
+    for k in range(samples):
+        interpolation_search(counted, arr[k * (n - 1) // max(1, samples - 1)])
+    if 2 * counted.probes / samples < math.log2(n):
+        return interpolation_search
+    return binary_search_iterative
+
+
+def auto_search(arr, target, plan=None):
+    """
+    Returns index of target in a sorted list, else -1, using plan_search's pick
+    Sampling costs more probes than one search, so for many queries call
+    plan_search(arr) once and pass its result as plan.
+    """
+    search = plan or plan_search(arr)
+    return search(arr, target)
+
+# Example usage of the adaptive searches
+uniform = list(range(0, 100_000, 5))
+print(f"Interpolation Search: 455 found at index {interpolation_search(uniform, 455)}")
+print(f"Exponential Search: 70 found at index {exponential_search(sorted_arr, 70)}")
+print(f"Galloping Search from index 150: 800 found at index {galloping_search(uniform, 800, hint=150)}")
+print(f"Auto Search picks {plan_search(uniform).__name__} for evenly spaced keys")
+
+
+# -----------------------
+# 6. Notes & Tips
 # -----------------------
 """
 - Linear Search is simple but inefficient for large datasets.
 - Binary Search is much faster but requires sorted data.
 - Always ensure the list is sorted before using binary search.
 - Binary search can be implemented iteratively or recursively.
+- Recursion costs a function call per step; pass iterative=True to skip it.
+- For millions of lookups, batch them with binary_search_many instead of looping.
+- For repeated "is x in it?" checks on unsorted data, keep a MembershipIndex
+  (membership_index.py) instead of calling linear_search every time.
+- Evenly spread numeric keys: interpolation_search needs far fewer probes.
+- Unknown length or target near the front: exponential_search.
+- Lookups close to the previous answer: galloping_search(arr, target, hint=previous).
+- Run `python searching_algorithms.py --bench` to compare probes and time per query.
+- instrumentation.measure(func, data, ...) counts comparisons, probes and moves
+  (and times the phases) of any of these functions without changing them.
 """
+
+# -----------------------
+# Benchmark
+# -----------------------
+import random
+import sys
+import time
+
+
+def _make_keys(shape, n):
+    if shape == "uniform":
+        return sorted(random.sample(range(n * 10), n))
+    # Skewed: most keys crowded at the low end
+    return sorted({int(random.paretovariate(1.0) * 1000) for _ in range(n)})
+
+
+def benchmark_searches(n=10**6, queries=10**4, shapes=("uniform", "skewed")):
+    """
+    Probes (elements read) and wall time per query for every sorted-list search.
+    Probes are counted on a wrapped list; times are measured on the plain list.
+    Queries come in increasing order and galloping_search starts from the
+    previous answer, the case it is built for.
+    """
+    previous = 0
+
+    def gallop_from_previous(arr, target):
+        nonlocal previous
+        previous = galloping_search(arr, target, hint=previous)
+        return previous
+
+    searches = [
+        ("binary_search_iterative", binary_search_iterative),
+        ("interpolation_search", interpolation_search),
+        ("exponential_search", exponential_search),
+        ("galloping_search", gallop_from_previous),
+        ("auto_search", None),
+    ]
+    print(f"{'keys':<10}{'search':<26}{'probes/query':>14}{'us/query':>11}")
+    for shape in shapes:
+        keys = _make_keys(shape, n)
+        wanted = sorted(random.choice(keys) for _ in range(queries))
+        plan = plan_search(keys)
+        for name, search in searches:
+            search = search or (lambda arr, target: auto_search(arr, target, plan))
+            counted = _ProbeCounter(keys)
+            for target in wanted:
+                search(counted, target)
+            start = time.perf_counter()
+            for target in wanted:
+                assert keys[search(keys, target)] == target
+            elapsed = time.perf_counter() - start
+            label = name if name != "auto_search" else f"auto ({plan.__name__.split('_')[0]})"
+            print(f"{shape:<10}{label:<26}{counted.probes / queries:>14.1f}"
+                  f"{elapsed / queries * 1e6:>11.2f}")
+
+
+if __name__ == "__main__" and "--bench" in sys.argv:
+    benchmark_searches()
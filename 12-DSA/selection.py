@@ -0,0 +1,265 @@
+"""
+selection.py
+
+Selection: nth_element, partial_sort and top_k in Python
+--------------------------------------------------------
+
+Often only part of the sorted order is needed: the median, the 10 cheapest
+items, the 100 biggest values in a stream. Sorting everything costs
+O(n log n); these functions do less work:
+
+1. nth_element(arr, n)   - put the item that belongs at index n there, smaller
+                            items before it, larger ones after. O(n) average
+2. quickselect(arr, n)   - the same, on a copy, returning just the value
+3. partial_sort(arr, k)  - the k smallest items, sorted, at the front. O(n + k log k)
+4. top_k(iterable, k)    - the k largest (or smallest) items of any iterable,
+                            with a heap of k entries: O(n log k) time, O(k) memory
+
+nth_element is an introselect: quickselect with median-of-3 pivots and a
+3-way partition (fast with many duplicates). If the pivots keep being bad it
+stops recursing and sorts the remaining range, so the worst case stays
+O(n log n) instead of quickselect's O(n^2).
+
+Numeric array.array / NumPy inputs without a key use NumPy's own introselect
+(ndarray.partition) when NumPy is installed. On plain lists the partition
+loop runs in Python, so list.sort (in C) can still win on cheap comparisons;
+see benchmark_selection.
+"""
+
+import heapq
+from array import array
+from itertools import count
+
+from numeric_backend import is_numeric_array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+SMALL = 16  # Ranges this short are finished with a plain sort
+
+
+# -----------------------
+# 1. nth_element (introselect)
+# -----------------------
+def _sorted_like(arr, items, key=None, reverse=False):
+    """sorted(items), as an array.array when arr is one (for slice assignment)."""
+    result = sorted(items, key=key, reverse=reverse)
+    return array(arr.typecode, result) if isinstance(arr, array) else result
+
+
+def _median_of_three(arr, lo, hi):
+    a, b, c = arr[lo], arr[(lo + hi) // 2], arr[hi - 1]
+    if a < b:
+        return b if b < c else (c if a < c else a)
+    return a if a < c else (c if b < c else b)
+
+
+def _partition3(arr, lo, hi, pivot):
+    """
+    Rearrange arr[lo:hi] into  < pivot | == pivot | > pivot
+    and return the bounds (lt, gt) of the middle part.
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        item = arr[i]
+        if item < pivot:
+            arr[lt], arr[i] = item, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < item:
+            gt -= 1
+            arr[gt], arr[i] = item, arr[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _select(arr, n):
+    lo, hi = 0, len(arr)
+    budget = 2 * len(arr).bit_length()  # Bad pivots allowed before giving up
+    while hi - lo > SMALL and budget:
+        width = hi - lo
+        lt, gt = _partition3(arr, lo, hi, _median_of_three(arr, lo, hi))
+        if n < lt:
+            hi = lt
+        elif n >= gt:
+            lo = gt
+        else:
+            return  # arr[n] equals the pivot, which is in its final place
+        if 4 * (hi - lo) > 3 * width:
+            budget -= 1  # Bad pivot: less than a quarter of the range was cut off
+    arr[lo:hi] = _sorted_like(arr, arr[lo:hi])
+
+
+def nth_element(arr, n, key=None):
+    """
+    Rearrange arr in place so that arr[n] is the item a full sort would put
+    there, with no larger item before it and no smaller item after it.
+    Returns arr[n]. Negative n counts from the end, like indexing.
+    """
+    length = len(arr)
+    if n < 0:
+        n += length
+    if not 0 <= n < length:
+        raise IndexError("nth_element index out of range")
+    if key is None and is_numeric_array(arr) and np is not None:
+        view = arr if isinstance(arr, np.ndarray) else np.frombuffer(arr, dtype=arr.typecode)
+        view.partition(n)
+        return arr[n]
+    if key is None:
+        _select(arr, n)
+        return arr[n]
+    # Decorate with the position so ties never compare the items
+    decorated = [(key(item), i, item) for i, item in enumerate(arr)]
+    _select(decorated, n)
+    items = [item for _, _, item in decorated]
+    arr[:] = array(arr.typecode, items) if isinstance(arr, array) else items
+    return arr[n]
+
+
+def quickselect(iterable, n, key=None):
+    """The item at index n of sorted(iterable, key=key), without sorting. O(n) average"""
+    items = list(iterable)
+    return nth_element(items, n, key=key)
+
+
+# -----------------------
+# 2. partial_sort
+# -----------------------
+def partial_sort(arr, k, key=None, reverse=False):
+    """
+    Put the k smallest items (largest with reverse=True) at the front of arr,
+    in sorted order. The order of the remaining items is unspecified.
+    Returns arr.
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+    if k == 0:
+        return arr
+    if key is None and not reverse and is_numeric_array(arr) and np is not None:
+        view = arr if isinstance(arr, np.ndarray) else np.frombuffer(arr, dtype=arr.typecode)
+        view.partition(k - 1)
+        view[:k].sort()
+        return arr
+    if reverse:
+        # Select the boundary of the k largest, then move them to the front
+        if k < n:
+            nth_element(arr, n - k, key=key)
+        head = _sorted_like(arr, arr[n - k:], key=key, reverse=True)
+        arr[k:] = arr[:n - k]
+        arr[:k] = head
+        return arr
+    if k < n:
+        nth_element(arr, k - 1, key=key)
+    arr[:k] = _sorted_like(arr, arr[:k], key=key)
+    return arr
+
+
+# -----------------------
+# 3. Streaming top_k
+# -----------------------
+class _Largest:
+    """Heap entry for the k smallest: the root is the largest key (latest on ties)."""
+
+    __slots__ = ("key", "seq", "item")
+
+    def __init__(self, key, seq, item):
+        self.key = key
+        self.seq = seq
+        self.item = item
+
+    def __lt__(self, other):
+        if other.key < self.key:
+            return True
+        return not self.key < other.key and self.seq > other.seq
+
+
+def top_k(iterable, k, key=None, smallest=False):
+    """
+    The k largest items (k smallest with smallest=True) of any iterable, best
+    first. Equal items keep their input order, like heapq.nlargest/nsmallest.
+
+    Only a heap of k entries is kept, so a generator of any length is read
+    once in O(n log k) time and O(k) memory. The root of the heap is the worst
+    item kept so far; a new item only enters if it beats the root.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    seq = count()
+    key = key or (lambda item: item)
+    if not smallest:
+        # Entries (key, -seq, item): the root is the smallest key, latest on ties
+        for item in iterable:
+            k_item = key(item)
+            if len(heap) < k:
+                heapq.heappush(heap, (k_item, -next(seq), item))
+            elif heap[0][0] < k_item:
+                heapq.heapreplace(heap, (k_item, -next(seq), item))
+            else:
+                next(seq)
+        return [item for _, _, item in sorted(heap, reverse=True)]
+
+    for item in iterable:
+        k_item = key(item)
+        if len(heap) < k:
+            heapq.heappush(heap, _Largest(k_item, next(seq), item))
+        elif k_item < heap[0].key:
+            heapq.heapreplace(heap, _Largest(k_item, next(seq), item))
+        else:
+            next(seq)
+    return [entry.item for entry in sorted(heap, reverse=True)]
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_selection(n=10**6, ks=(10, 100, 1000)):
+    """
+    Each selection function on n random floats against a full sort, plus
+    top_k over a generator (nothing stored) against heapq.nlargest.
+    """
+    import random
+    import time
+
+    data = [random.random() for _ in range(n)]
+
+    def timed(run):
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+
+    print(f"{n:,} random floats:")
+    print(f"  {'sorted (full sort)':<28}{timed(lambda: sorted(data)):>8.3f}s")
+    print(f"  {'nth_element (median)':<28}{timed(lambda: nth_element(data.copy(), n // 2)):>8.3f}s")
+    for k in ks:
+        print(f"  k = {k}")
+        print(f"    {'partial_sort':<26}{timed(lambda: partial_sort(data.copy(), k)):>8.3f}s")
+        print(f"    {'top_k (generator)':<26}"
+              f"{timed(lambda: top_k((x for x in data), k)):>8.3f}s")
+        print(f"    {'heapq.nlargest':<26}{timed(lambda: heapq.nlargest(k, data)):>8.3f}s")
+        print(f"    {'sorted(...)[-k:]':<26}{timed(lambda: sorted(data)[-k:]):>8.3f}s")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    arr = [64, 34, 25, 12, 22, 11, 90, 25]
+    work = arr.copy()
+    print("Median via nth_element:", nth_element(work, len(work) // 2), "->", work)
+    print("Third smallest (quickselect):", quickselect(arr, 2))
+    print("partial_sort k=3:", partial_sort(arr.copy(), 3)[:3])
+    print("partial_sort k=3, reverse:", partial_sort(arr.copy(), 3, reverse=True)[:3])
+
+    prices = (("tea", 3.5), ("cake", 4.0), ("water", 1.0), ("coffee", 3.5), ("juice", 2.5))
+    print("Two most expensive:", top_k(prices, 2, key=lambda p: p[1]))
+    print("Two cheapest:", top_k(prices, 2, key=lambda p: p[1], smallest=True))
+    print("Top 3 of a 1,000,000 item generator:", top_k((i * 7919 % 1_000_003 for i in range(10**6)), 3))
+
+    if "--bench" in sys.argv:
+        benchmark_selection()
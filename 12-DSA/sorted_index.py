@@ -0,0 +1,275 @@
+"""
+sorted_index.py
+
+Eytzinger-Layout Sorted Index
+-----------------------------
+
+binary_search_iterative walks a sorted list from the middle outwards, so every
+probe lands far away from the previous one in memory. The Eytzinger layout
+stores the same keys in BFS order of the implicit search tree:
+
+    sorted:     [10, 20, 30, 40, 50, 60, 70]
+    eytzinger:  [ _, 40, 20, 60, 10, 30, 50, 70]   (index 0 unused)
+
+The root is at index 1 and the children of k are at 2k and 2k + 1, so the first
+levels of the tree sit next to each other in memory and the search is a simple
+loop without low/high bookkeeping:
+
+    k = 1
+    while k <= n:
+        k = 2 * k + (eytz[k] < x)
+
+SortedIndex is built once from sorted keys (O(n)) and then answers:
+    - find(x)                   -> index of x in the sorted keys, else -1
+    - lower_bound / upper_bound -> first index with key >= x / key > x
+    - range_query(lo, hi)       -> keys in [lo, hi)
+    - *_many(xs)                -> the same for a batch of queries
+
+Numeric keys are stored in array.array. With NumPy installed, the batch queries
+walk all queries down the tree together, one vectorized step per level.
+"""
+
+from array import array
+from numbers import Integral
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+def _to_array(keys):
+    """
+    Store keys compactly: array('q') for ints, array('d') for floats,
+    a plain list for anything else. Ints too big for 'q' stay in a list:
+    as doubles, neighbouring keys like 2**70 and 2**70 + 1 would be equal.
+    """
+    if isinstance(keys, array):
+        return array(keys.typecode, keys)
+    keys = list(keys)
+    try:
+        return array("q", keys)
+    except (TypeError, OverflowError):
+        pass
+    if not all(isinstance(k, Integral) for k in keys):
+        try:
+            doubles = array("d", keys)
+        except (TypeError, OverflowError):
+            return keys
+        if all(d == k for d, k in zip(doubles, keys)):  # No int lost precision
+            return doubles
+    return keys
+
+
+def _eytzinger_ranks(n):
+    """
+    For every Eytzinger position k = 1..n, the index of its key in sorted order.
+
+    In a perfect tree of `levels` levels, node k at depth d with offset j has
+    in-order rank r = (2j + 1) * 2^(levels - 1 - d) - 1. Our last level is only
+    partly filled (from the left), so we subtract the leaves that are missing
+    before r.
+    """
+    levels = n.bit_length()
+    last_level = n - (2 ** (levels - 1) - 1)  # Nodes present on the last level
+    ranks = array("q", [n]) * (n + 1)  # ranks[0] = n means "past the end"
+    for k in range(1, n + 1):
+        depth = k.bit_length() - 1
+        offset = k - (1 << depth)
+        if depth == levels - 1:
+            ranks[k] = 2 * offset
+        else:
+            r = ((2 * offset + 1) << (levels - 1 - depth)) - 1
+            missing = (r + 1) // 2 - last_level
+            ranks[k] = r - missing if missing > 0 else r
+    return ranks
+
+
+def _eytzinger_ranks_numpy(n):
+    """Vectorized version of _eytzinger_ranks."""
+    levels = n.bit_length()
+    last_level = n - (2 ** (levels - 1) - 1)
+    k = np.arange(1, n + 1, dtype=np.int64)
+    depth = np.frexp(k.astype(np.float64))[1] - 1  # floor(log2(k))
+    offset = k - (np.int64(1) << depth)
+    r = ((2 * offset + 1) << (levels - 1 - depth)) - 1
+    r = r - np.maximum((r + 1) // 2 - last_level, 0)
+    r[depth == levels - 1] = 2 * offset[depth == levels - 1]
+    ranks = np.empty(n + 1, dtype=np.int64)
+    ranks[0] = n
+    ranks[1:] = r
+    return array("q", ranks.tobytes())
+
+
+class SortedIndex:
+    """
+    Read-only index over sorted keys with Eytzinger layout.
+    Memory: the sorted keys, the Eytzinger copy and one rank per key.
+    """
+
+    __slots__ = ("_n", "_keys", "_eytz", "_ranks")
+
+    def __init__(self, sorted_keys):
+        keys = _to_array(sorted_keys)
+        n = len(keys)
+        for i in range(1, n):
+            if keys[i] < keys[i - 1]:
+                raise ValueError("SortedIndex needs the keys in ascending order")
+        self._n = n
+        self._keys = keys
+        if np is not None and isinstance(keys, array) and n:
+            self._ranks = _eytzinger_ranks_numpy(n)
+            eytz = np.frombuffer(keys, dtype=keys.typecode)[np.frombuffer(self._ranks, dtype=np.int64)[1:]]
+            self._eytz = array(keys.typecode, [0]) + array(keys.typecode, eytz.tobytes())
+        else:
+            self._ranks = _eytzinger_ranks(n)
+            first = [keys[0]] if n else []
+            eytz = [keys[r] for r in self._ranks[1:]]
+            self._eytz = array(keys.typecode, first + eytz) if isinstance(keys, array) else first + eytz
+
+    def __len__(self):
+        return self._n
+
+    def __contains__(self, x):
+        return self.find(x) != -1
+
+    # -----------------------
+    # Single queries
+    # -----------------------
+    def lower_bound(self, x):
+        """Index of the first key >= x (len(self) if there is none)."""
+        eytz, n = self._eytz, self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (eytz[k] < x)
+        # The answer is the last node where we went left: drop the trailing
+        # right turns (1 bits) and that left turn (the 0 bit before them)
+        k >>= (~k & (k + 1)).bit_length()
+        return self._ranks[k]
+
+    def upper_bound(self, x):
+        """Index of the first key > x (len(self) if there is none)."""
+        eytz, n = self._eytz, self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (eytz[k] <= x)
+        k >>= (~k & (k + 1)).bit_length()
+        return self._ranks[k]
+
+    def find(self, x):
+        """Index of x in the sorted keys (the first one if repeated), else -1."""
+        i = self.lower_bound(x)
+        if i < self._n and self._keys[i] == x:
+            return i
+        return -1
+
+    def range_query(self, lo, hi):
+        """Keys k with lo <= k < hi, in sorted order."""
+        return self._keys[self.lower_bound(lo):self.lower_bound(hi)]
+
+    def count_range(self, lo, hi):
+        """Number of keys k with lo <= k < hi."""
+        return max(0, self.lower_bound(hi) - self.lower_bound(lo))
+
+    # -----------------------
+    # Batch queries
+    # -----------------------
+    def _bound_many(self, xs, strict):
+        """
+        Walk every query down the tree at once (NumPy), one level per step.
+        Queries that already fell off the tree keep going right, which adds
+        1 bits that the final shift strips again.
+        """
+        n = self._n
+        queries = np.asarray(xs)
+        eytz = np.frombuffer(self._eytz, dtype=self._eytz.typecode)
+        k = np.ones(len(queries), dtype=np.int64)
+        for _ in range(n.bit_length()):
+            inside = k <= n
+            probe = eytz[np.where(inside, k, 0)]
+            go_right = (probe <= queries) if strict else (probe < queries)
+            k = 2 * k + (go_right | ~inside)
+        low_zero = ~k & (k + 1)
+        k >>= np.frexp(low_zero.astype(np.float64))[1]
+        return np.frombuffer(self._ranks, dtype=np.int64)[k]
+
+    def _vectorized(self):
+        return np is not None and isinstance(self._eytz, array) and self._n > 0
+
+    def lower_bound_many(self, xs):
+        """lower_bound for each query (NumPy array with NumPy, else a list)."""
+        if self._vectorized():
+            return self._bound_many(xs, strict=False)
+        return [self.lower_bound(x) for x in xs]
+
+    def upper_bound_many(self, xs):
+        """upper_bound for each query (NumPy array with NumPy, else a list)."""
+        if self._vectorized():
+            return self._bound_many(xs, strict=True)
+        return [self.upper_bound(x) for x in xs]
+
+    def find_many(self, xs):
+        """find for each query (NumPy array with NumPy, else a list)."""
+        if self._vectorized():
+            queries = np.asarray(xs)
+            bounds = self._bound_many(queries, strict=False)
+            keys = np.frombuffer(self._keys, dtype=self._keys.typecode)
+            hits = keys[np.minimum(bounds, self._n - 1)] == queries
+            return np.where(hits & (bounds < self._n), bounds, -1)
+        return [self.find(x) for x in xs]
+
+    def count_range_many(self, ranges):
+        """count_range for each (lo, hi) pair."""
+        return [self.count_range(lo, hi) for lo, hi in ranges]
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_index(sizes=(10**6, 10**7, 10**8), queries=10**5):
+    """
+    Compare per-query lookups and batch lookups against searching_algorithms.py.
+    Keys are the even numbers 0, 2, ..., 2(n - 1), so about half the queries miss.
+    """
+    import random
+    import time
+    from searching_algorithms import binary_search_iterative, binary_search_recursive
+
+    for n in sizes:
+        keys = array("q", range(0, 2 * n, 2))
+        targets = [random.randrange(2 * n) for _ in range(queries)]
+
+        start = time.perf_counter()
+        index = SortedIndex(keys)
+        print(f"\nn = {n:,}  (build: {time.perf_counter() - start:.2f}s, {queries:,} queries)")
+
+        cases = [
+            ("binary_search_recursive", lambda: [binary_search_recursive(keys, t, 0, n - 1) for t in targets]),
+            ("binary_search_iterative", lambda: [binary_search_iterative(keys, t) for t in targets]),
+            ("SortedIndex.find", lambda: [index.find(t) for t in targets]),
+            ("SortedIndex.find_many", lambda: index.find_many(targets)),
+        ]
+        for name, run in cases:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<26}{elapsed:>8.3f}s  {elapsed / queries * 1e9:>8.0f} ns/query")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    index = SortedIndex([10, 20, 30, 40, 50, 60, 70])
+    print("Eytzinger layout:", list(index._eytz[1:]))
+    print("find(30):", index.find(30))
+    print("find(35):", index.find(35))
+    print("lower_bound(35):", index.lower_bound(35))
+    print("upper_bound(40):", index.upper_bound(40))
+    print("range_query(20, 60):", list(index.range_query(20, 60)))
+    print("find_many([10, 15, 70]):", [int(i) for i in index.find_many([10, 15, 70])])
+
+    if "--bench" in sys.argv:
+        benchmark_index()
@@ -10,9 +10,13 @@ This file covers:
 1. Bubble Sort
 2. Selection Sort
 3. Insertion Sort
+4. Hybrid Sort (adaptive merge sort with an insertion-sort cutoff)
+5. Counting, Radix & Bucket Sort (no comparisons, for integer/numeric keys)
 
 All examples use ascending order.
 """
+from numeric_backend import is_numeric_array
+import numeric_backend
 
 # -----------------------
 # 1. Bubble Sort
@@ -83,6 +87,364 @@ arr3 = [64, 34, 25, 12, 22, 11, 90]
 print("Insertion Sort:", insertion_sort(arr3.copy()))
 
 
+# -----------------------
+# 4. Hybrid Sort
+# -----------------------
+from array import array
+from bisect import bisect_right
+
+MIN_RUN = 32  # Runs shorter than this are extended with insertion sort
+
+
+def _insertion_sort_range(arr, lo, hi, start):
+    """
+    Binary insertion sort of arr[lo:hi], where arr[lo:start] is already sorted.
+    Uses bisect to find the slot and a slice assignment to shift, so each
+    insert is one C-level memmove instead of a Python loop.
+    """
+    for i in range(start, hi):
+        item = arr[i]
+        pos = bisect_right(arr, item, lo, i)  # bisect_right keeps it stable
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = item
+
+
+def _next_run(arr, lo, n):
+    """
+    Find the natural run starting at lo and return where it ends.
+    Strictly descending runs are reversed in place so every run is ascending.
+    """
+    hi = lo + 1
+    if hi == n:
+        return hi
+    if arr[hi] < arr[lo]:
+        while hi + 1 < n and arr[hi + 1] < arr[hi]:
+            hi += 1
+        hi += 1
+        arr[lo:hi] = arr[lo:hi][::-1]
+    else:
+        while hi + 1 < n and not arr[hi + 1] < arr[hi]:
+            hi += 1
+        hi += 1
+    return hi
+
+
+def _merge(arr, lo, mid, hi):
+    """
+    Merge the sorted runs arr[lo:mid] and arr[mid:hi].
+    Only the left run is copied; leftovers of the right run are already in place.
+    """
+    if not arr[mid] < arr[mid - 1]:
+        return  # Runs are already in order
+    left = arr[lo:mid]
+    i, j, k = 0, mid, lo
+    left_len = len(left)
+    while i < left_len and j < hi:
+        if arr[j] < left[i]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = left[i]
+            i += 1
+        k += 1
+    arr[k:k + left_len - i] = left[i:]
+
+
+def _hybrid_sort_plain(arr):
+    """
+    Sort arr in place without key/reverse handling.
+    Returns the strategy that was used.
+    """
+    n = len(arr)
+    if n < 2:
+        return "noop"
+    if n <= MIN_RUN:
+        _insertion_sort_range(arr, 0, n, 1)
+        return "insertion"
+
+    # Split into natural runs, padding short ones up to MIN_RUN
+    bounds = []
+    lo = 0
+    natural = 0
+    while lo < n:
+        hi = _next_run(arr, lo, n)
+        if hi - lo < MIN_RUN:
+            forced = min(n, lo + MIN_RUN)
+            _insertion_sort_range(arr, lo, forced, hi)
+            hi = forced
+        else:
+            natural += 1
+        bounds.append(lo)
+        lo = hi
+    bounds.append(n)
+
+    if len(bounds) == 2:
+        return "single-run"  # Already sorted (or reversed and flipped)
+
+    # Bottom-up merge of neighbouring runs until one run is left
+    while len(bounds) > 2:
+        last = len(bounds) - 1
+        for i in range(0, last - 1, 2):
+            _merge(arr, bounds[i], bounds[i + 1], bounds[i + 2])
+        bounds = bounds[::2]
+        if bounds[-1] != n:
+            bounds.append(n)
+    return "natural-merge" if natural else "run-merge"
+
+
+def hybrid_sort(arr, key=None, reverse=False):
+    """
+    Adaptive, stable, in-place sort with the same key/reverse options as list.sort.
+
+    Strategy is picked from the input:
+        - n <= MIN_RUN            -> binary insertion sort
+        - already sorted/reversed -> single O(n) pass (reversed runs are flipped)
+        - partially sorted        -> merge of the natural runs found in the data
+        - random                  -> MIN_RUN blocks sorted by insertion, then merged
+
+    Time Complexity: O(n log n) worst case, O(n) on presorted input
+    Extra Space: O(n) for the merge buffer (and the keys, if key is given)
+
+    Numeric array.array / NumPy inputs without a key go to numeric_backend.sort.
+    """
+    if key is None and is_numeric_array(arr):
+        return numeric_backend.sort(arr, reverse=reverse)
+    if reverse:
+        arr.reverse()  # Reverse + stable sort + reverse keeps equal items in order
+    if key is None:
+        _hybrid_sort_plain(arr)
+    else:
+        # Decorate with the original position so ties never compare the items
+        decorated = [(key(item), i, item) for i, item in enumerate(arr)]
+        _hybrid_sort_plain(decorated)
+        items = [item for _, _, item in decorated]
+        arr[:] = array(arr.typecode, items) if isinstance(arr, array) else items
+    if reverse:
+        arr.reverse()
+    return arr
+
+# Example usage
+arr4 = [64, 34, 25, 12, 22, 11, 90]
+print("Hybrid Sort:", hybrid_sort(arr4.copy()))
+print("Hybrid Sort (reverse):", hybrid_sort(arr4.copy(), reverse=True))
+words = ["banana", "Apple", "cherry", "date"]
+print("Hybrid Sort (key=str.lower):", hybrid_sort(words.copy(), key=str.lower))
+
+
+# -----------------------
+# 5. Integer Sorts (Counting, Radix, Bucket)
+# -----------------------
+from itertools import accumulate, chain
+from operator import index, itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+INTEGER_TYPECODES = "bBhHiIlLqQ"
+RADIX_BITS = 8  # One byte of the key per pass: 256 buckets
+
+
+def _int_view(arr):
+    """Zero-copy NumPy view of an integer array.array / NumPy array, else None."""
+    if np is None or not is_numeric_array(arr):
+        return None
+    view = arr if isinstance(arr, np.ndarray) else np.frombuffer(arr, dtype=arr.typecode)
+    return view if view.dtype.kind in "iu" else None
+
+
+def _as_ints(keys):
+    """keys as Python ints (NumPy integer scalars included), or None if one is not an integer."""
+    try:
+        return [index(k) for k in keys]
+    except TypeError:
+        return None
+
+
+def _int_keys(arr, key, name):
+    keys = _as_ints(arr if key is None else (key(item) for item in arr))
+    if keys is None:
+        raise TypeError(f"{name} needs integer keys")
+    return keys
+
+
+def _write_back(arr, items):
+    """Store the sorted items in arr itself (list, array.array or NumPy array)."""
+    if isinstance(arr, list):
+        arr[:] = items
+    elif np is not None and isinstance(arr, np.ndarray):
+        arr[:] = np.asarray(items, dtype=arr.dtype) if arr.dtype != object else items
+    else:
+        arr[:] = type(arr)(arr.typecode, items)
+
+
+def _offsets(view):
+    """Keys of an integer NumPy array shifted to start at 0, as uint64 (negatives allowed)."""
+    lo = int(view.min())
+    return view.astype(np.uint64) - np.uint64(lo % 2**64), lo
+
+
+def counting_sort(arr, key=None, reverse=False):
+    """
+    Stable sort for integer keys in O(n + k), where k = max key - min key + 1.
+    Counts how often each key occurs, turns the counts into start positions,
+    then drops every item straight into its slot.
+    Best when k is not much larger than n (k extra memory).
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    view = _int_view(arr) if key is None else None
+    if view is not None:
+        shifted, lo = _offsets(view)
+        counts = np.bincount(shifted.astype(np.intp))
+        result = np.repeat(np.arange(lo, lo + len(counts), dtype=view.dtype), counts)
+        view[:] = result[::-1] if reverse else result
+        return arr
+
+    keys = _int_keys(arr, key, "counting_sort")
+    lo, hi = min(keys), max(keys)
+    if reverse:
+        keys = [lo + hi - k for k in keys]  # Mirror the keys: ascending becomes descending, still stable
+    counts = [0] * (hi - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+    starts = list(accumulate(counts, initial=0))
+    result = [None] * n
+    for k, item in zip(keys, list(arr)):
+        result[starts[k - lo]] = item
+        starts[k - lo] += 1
+    _write_back(arr, result)
+    return arr
+
+
+def _msd_pass(pairs, shift, mask):
+    """Split (key, item) pairs on the digit at shift, then sort each bucket on the next digit."""
+    if len(pairs) <= MIN_RUN or shift < 0:
+        pairs.sort(key=itemgetter(0))  # Small buckets: a stable comparison sort is cheaper
+        return pairs
+    buckets = [[] for _ in range(mask + 1)]
+    for pair in pairs:
+        buckets[(pair[0] >> shift) & mask].append(pair)
+    result = []
+    for bucket in buckets:
+        if len(bucket) > 1:
+            bucket = _msd_pass(bucket, shift - RADIX_BITS, mask)
+        result.extend(bucket)
+    return result
+
+
+def radix_sort(arr, key=None, reverse=False, msd=False):
+    """
+    Stable sort for integer keys, one byte at a time: O(n * passes),
+    passes = bytes in (max key - min key). Negative keys are shifted by the
+    minimum first, so every key is a non-negative offset.
+
+    LSD (default): distribute by the lowest byte, then the next one, ...
+        Every pass is stable, so earlier bytes stay in order within a bucket.
+    MSD (msd=True): distribute by the highest byte, then sort each bucket on
+        its own; buckets that are small (or keys that run out) stop early.
+
+    Integer NumPy / array.array inputs without a key use LSD passes of
+    NumPy stable argsorts on each byte.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    mask = (1 << RADIX_BITS) - 1
+    view = _int_view(arr) if key is None else None
+    if view is not None:
+        shifted, _ = _offsets(view)
+        order = np.arange(n)
+        for shift in range(0, max(1, int(shifted.max()).bit_length()), RADIX_BITS):
+            # uint8 digits: NumPy only radix-sorts types of 16 bits or fewer, else it uses timsort
+            digits = ((shifted[order] >> np.uint64(shift)) & np.uint64(mask)).astype(np.uint8)
+            order = order[np.argsort(digits, kind="stable")]
+        result = view[order]
+        view[:] = result[::-1] if reverse else result
+        return arr
+
+    keys = _int_keys(arr, key, "radix_sort")
+    lo, hi = min(keys), max(keys)
+    offsets = [hi - k for k in keys] if reverse else [k - lo for k in keys]
+    pairs = list(zip(offsets, list(arr)))
+    width = (hi - lo).bit_length()
+    if msd:
+        pairs = _msd_pass(pairs, max(0, (width - 1) // RADIX_BITS * RADIX_BITS), mask)
+    else:
+        for shift in range(0, max(1, width), RADIX_BITS):
+            buckets = [[] for _ in range(mask + 1)]
+            for pair in pairs:
+                buckets[(pair[0] >> shift) & mask].append(pair)
+            pairs = list(chain.from_iterable(buckets))
+    _write_back(arr, [item for _, item in pairs])
+    return arr
+
+
+def bucket_sort(arr, key=None, reverse=False, buckets=None):
+    """
+    Stable sort for numeric keys (ints or floats) that are spread out evenly.
+    The key range is cut into equal-width buckets (default: one per 16 items),
+    every item goes into its bucket, each bucket is sorted, and the buckets
+    are joined. O(n) on average for uniform keys, O(n log n) in the worst case.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    keys = list(arr) if key is None else [key(item) for item in arr]
+    if reverse:
+        keys = [-k for k in keys]
+    lo, hi = min(keys), max(keys)
+    if lo == hi:
+        return arr  # All keys equal: a stable sort changes nothing
+    count = buckets or max(1, n // 16)
+    scale = count / (hi - lo)
+    groups = [[] for _ in range(count)]
+    for k, item in zip(keys, list(arr)):
+        groups[min(int((k - lo) * scale), count - 1)].append((k, item))
+    for group in groups:
+        if len(group) > 1:
+            group.sort(key=itemgetter(0))
+    _write_back(arr, [item for _, item in chain.from_iterable(groups)])
+    return arr
+
+
+def auto_sort(arr, key=None, reverse=False):
+    """
+    Sort with whichever algorithm suits the keys, and return arr:
+        - numeric arrays without a key  -> hybrid_sort (C sort in numeric_backend)
+        - non-integer keys, n < 64      -> hybrid_sort
+        - key range k <= 4n             -> counting_sort, O(n + k)
+        - fewer radix passes than log2(n) / 2 -> radix_sort (LSD)
+        - otherwise                     -> hybrid_sort
+    A radix pass touches every item once; a comparison sort touches every
+    item about log2(n) times, at a lower cost per touch.
+    """
+    n = len(arr)
+    if (key is None and is_numeric_array(arr)) or n < 64:
+        return hybrid_sort(arr, key=key, reverse=reverse)
+    keys = _as_ints(arr if key is None else (key(item) for item in arr))
+    if keys is None:
+        return hybrid_sort(arr, key=key, reverse=reverse)
+    span = max(keys) - min(keys) + 1
+    if span <= 4 * n:
+        return counting_sort(arr, key=key, reverse=reverse)
+    passes = -(-(span - 1).bit_length() // RADIX_BITS)
+    if passes < n.bit_length() / 2:
+        return radix_sort(arr, key=key, reverse=reverse)
+    return hybrid_sort(arr, key=key, reverse=reverse)
+
+# Example usage
+arr5 = [170, -45, 75, -90, 802, 24, 2, 66]
+print("Counting Sort:", counting_sort(arr5.copy()))
+print("Radix Sort (LSD):", radix_sort(arr5.copy()))
+print("Radix Sort (MSD, reverse):", radix_sort(arr5.copy(), reverse=True, msd=True))
+print("Bucket Sort:", bucket_sort([0.42, 0.32, 0.23, 0.52, 0.25, 0.47]))
+orders = [("b", 3), ("a", 1), ("c", 3), ("d", 2)]
+print("Counting Sort of records by key:", counting_sort(orders.copy(), key=itemgetter(1)))
+
+
 # -----------------------
 # Notes & Tips
 # -----------------------
@@ -90,5 +452,74 @@ print("Insertion Sort:", insertion_sort(arr3.copy()))
 - Bubble Sort: Simple but inefficient for large arrays; use early exit optimization.
 - Selection Sort: Finds min element each iteration; useful when memory writes are costly.
 - Insertion Sort: Efficient for small or nearly sorted arrays; stable sort.
+- Hybrid Sort: Insertion sort for small runs + merging of natural runs; O(n) on sorted data.
+- Counting / Radix Sort: O(n + k) / O(n * bytes) for integer keys such as IDs and timestamps.
+- Bucket Sort: evenly spread numeric keys; auto_sort picks one of these or hybrid_sort for you.
 - For large datasets, prefer built-in Python sort (Timsort): arr.sort() or sorted(arr)
+- For data bigger than RAM, use external_sort.py (sorted runs on disk + heap merge).
+- Need only the k smallest / the median / the top k of a stream? See selection.py.
+- Run `python sorting_algorithms.py --bench` to compare all of them on bigger inputs.
+- instrumentation.measure(func, data, ...) counts comparisons, probes and moves
+  (and times the phases) of any of these functions without changing them.
 """
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+import random
+import sys
+import time
+
+
+def _make_input(shape, n):
+    data = [random.randint(0, n) for _ in range(n)]
+    if shape == "sorted":
+        data.sort()
+    elif shape == "reversed":
+        data.sort(reverse=True)
+    elif shape == "nearly sorted":
+        data.sort()
+        for _ in range(max(1, n // 100)):  # Swap 1% of the elements
+            i, j = random.randrange(n), random.randrange(n)
+            data[i], data[j] = data[j], data[i]
+    return data
+
+
+def benchmark_sorts(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), quadratic_limit=10**4,
+                    shapes=("random", "nearly sorted", "sorted", "reversed")):
+    """
+    Time every sort on each input shape and size.
+    The O(n^2) sorts are skipped above quadratic_limit elements.
+    """
+    sorts = [
+        ("bubble_sort", bubble_sort, True),
+        ("selection_sort", selection_sort, True),
+        ("insertion_sort", insertion_sort, True),
+        ("hybrid_sort", hybrid_sort, False),
+        ("counting_sort", counting_sort, False),
+        ("radix_sort", radix_sort, False),
+        ("bucket_sort", bucket_sort, False),
+        ("list.sort", list.sort, False),
+    ]
+    print(f"{'shape':<14}{'n':>10}  " + "".join(f"{name:>16}" for name, _, _ in sorts))
+    for shape in shapes:
+        for n in sizes:
+            data = _make_input(shape, n)
+            expected = sorted(data)
+            row = f"{shape:<14}{n:>10}  "
+            for name, sort, quadratic in sorts:
+                if quadratic and n > quadratic_limit:
+                    row += f"{'skipped':>16}"
+                    continue
+                work = data.copy()
+                start = time.perf_counter()
+                sort(work)
+                elapsed = time.perf_counter() - start
+                assert work == expected, f"{name} produced a wrong result"
+                row += f"{elapsed:>15.4f}s"
+            print(row)
+
+
+if __name__ == "__main__" and "--bench" in sys.argv:
+    benchmark_sorts()
@@ -14,30 +14,46 @@ Operations:
 3. peek()     - Get the top element without removing it
 4. is_empty() - Check if the stack is empty
 5. size()     - Get the number of elements in the stack
+
+Approaches:
+-----------
+1. StackList  - Python list
+2. StackDeque - collections.deque
+3. ArrayStack - preallocated array.array of numbers, with push_many/pop_many
+                and snapshot()/rollback() for backtracking
+
+expression_evaluator.py uses StackDeque to compile and evaluate formulas.
 """
 
 # -----------------------
 # Approach 1: Using Python List
 # -----------------------
 class StackList:
-    def __init__(self):
+    kind = "Stack"
+
+    def __init__(self, trace=None):
         self.stack = []
+        self.trace = trace
 
     def push(self, item):
         self.stack.append(item)
-        print(f"Pushed: {item}")
+        if self.trace:
+            self.trace(self, "push", item)
 
     def pop(self):
-        if self.is_empty():
-            print("Stack is empty! Cannot pop.")
+        if not self.stack:
+            if self.trace:
+                self.trace(self, "empty", "pop")
             return None
         item = self.stack.pop()
-        print(f"Popped: {item}")
+        if self.trace:
+            self.trace(self, "pop", item)
         return item
 
     def peek(self):
-        if self.is_empty():
-            print("Stack is empty!")
+        if not self.stack:
+            if self.trace:
+                self.trace(self, "empty", "peek")
             return None
         return self.stack[-1]
 
@@ -54,24 +70,31 @@ class StackList:
 from collections import deque
 
 class StackDeque:
-    def __init__(self):
+    kind = "Stack"
+
+    def __init__(self, trace=None):
         self.stack = deque()
+        self.trace = trace
 
     def push(self, item):
         self.stack.append(item)
-        print(f"Pushed: {item}")
+        if self.trace:
+            self.trace(self, "push", item)
 
     def pop(self):
-        if self.is_empty():
-            print("Stack is empty! Cannot pop.")
+        if not self.stack:
+            if self.trace:
+                self.trace(self, "empty", "pop")
             return None
         item = self.stack.pop()
-        print(f"Popped: {item}")
+        if self.trace:
+            self.trace(self, "pop", item)
         return item
 
     def peek(self):
-        if self.is_empty():
-            print("Stack is empty!")
+        if not self.stack:
+            if self.trace:
+                self.trace(self, "empty", "peek")
             return None
         return self.stack[-1]
 
@@ -82,12 +105,167 @@ class StackDeque:
         return len(self.stack)
 
 
+# -----------------------
+# Approach 3: Preallocated array.array (numbers only)
+# -----------------------
+from array import array
+
+class ArrayStack:
+    """
+    Stack of numbers in a preallocated array.array. top is the number of
+    items; push writes at stack[top], pop reads stack[top - 1]. Nothing is
+    allocated per push, and each number takes 8 bytes (typecode "q" or "d").
+
+    capacity - initial number of slots
+    growable - double the capacity when full (otherwise pushes are dropped)
+    typecode - array.array typecode of the numbers
+    trace    - optional event hook (see tracing.py)
+    """
+
+    __slots__ = ("stack", "top", "growable", "trace")
+    kind = "Stack"
+
+    def __init__(self, capacity=16, growable=True, typecode="q", trace=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.stack = array(typecode, [0]) * capacity
+        self.top = 0
+        self.growable = growable
+        self.trace = trace
+
+    def _grow(self, min_capacity):
+        capacity = len(self.stack)
+        while capacity < min_capacity:
+            capacity *= 2
+        # A new array (not extend) so views returned by pop_many stay valid
+        storage = array(self.stack.typecode, [0]) * capacity
+        storage[:self.top] = self.stack[:self.top]
+        self.stack = storage
+
+    def push(self, item):
+        if self.top == len(self.stack):
+            if not self.growable:
+                if self.trace:
+                    self.trace(self, "full", "push")
+                return
+            self._grow(self.top + 1)
+        self.stack[self.top] = item
+        self.top += 1
+        if self.trace:
+            self.trace(self, "push", item)
+
+    def pop(self):
+        if not self.top:
+            if self.trace:
+                self.trace(self, "empty", "pop")
+            return None
+        self.top -= 1
+        item = self.stack[self.top]
+        if self.trace:
+            self.trace(self, "pop", item)
+        return item
+
+    def push_many(self, items):
+        """
+        Push several numbers with one slice copy.
+        Returns how many were pushed (fewer than len(items) only when bounded).
+        """
+        items = array(self.stack.typecode, items)
+        if self.top + len(items) > len(self.stack):
+            if self.growable:
+                self._grow(self.top + len(items))
+            else:
+                items = items[:len(self.stack) - self.top]
+        self.stack[self.top:self.top + len(items)] = items
+        self.top += len(items)
+        return len(items)
+
+    def pop_many(self, k):
+        """
+        Pop up to k numbers and return them as a memoryview, bottom to top
+        (the last one is the former top). Nothing is copied, so the view
+        shows the stack's own slots: use it before the next push, or copy it
+        with .tolist().
+        """
+        k = max(0, min(k, self.top))
+        self.top -= k
+        return memoryview(self.stack)[self.top:self.top + k]
+
+    def peek(self):
+        if not self.top:
+            if self.trace:
+                self.trace(self, "empty", "peek")
+            return None
+        return self.stack[self.top - 1]
+
+    def snapshot(self):
+        """Remember the current height, for rollback()."""
+        return self.top
+
+    def rollback(self, mark):
+        """
+        Drop everything pushed since snapshot() returned mark, in O(1).
+        Items popped below the mark are not brought back.
+        """
+        if not 0 <= mark <= self.top:
+            raise ValueError("mark is above the current top of the stack")
+        self.top = mark
+
+    def is_empty(self):
+        return self.top == 0
+
+    def size(self):
+        return self.top
+
+    def capacity(self):
+        return len(self.stack)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_stacks(n=10**6, batch=1000):
+    """
+    n pushes then n pops on each stack, and the same work in batches of
+    `batch` with ArrayStack.push_many / pop_many.
+    """
+    import time
+
+    def one_by_one(stack):
+        def run():
+            for i in range(n):
+                stack.push(i)
+            for _ in range(n):
+                stack.pop()
+        return run
+
+    def batched():
+        stack = ArrayStack()
+        chunk = array("q", range(batch))
+        for _ in range(n // batch):
+            stack.push_many(chunk)
+        for _ in range(n // batch):
+            stack.pop_many(batch)
+
+    print(f"{n:,} pushes + {n:,} pops:")
+    for name, run in (("StackList", one_by_one(StackList())),
+                      ("StackDeque", one_by_one(StackDeque())),
+                      ("ArrayStack", one_by_one(ArrayStack())),
+                      (f"ArrayStack x{batch}", batched)):
+        start = time.perf_counter()
+        run()
+        print(f"  {name:<18}{time.perf_counter() - start:>8.3f}s")
+
+
 # -----------------------
 # Example Usage
 # -----------------------
 if __name__ == "__main__":
+    import sys
+    from tracing import print_event
+
     print("Stack using list:")
-    s1 = StackList()
+    s1 = StackList(trace=print_event)
     s1.push(10)
     s1.push(20)
     s1.push(30)
@@ -97,7 +275,7 @@ if __name__ == "__main__":
     print("Is stack empty?", s1.is_empty())
 
     print("\nStack using deque:")
-    s2 = StackDeque()
+    s2 = StackDeque(trace=print_event)
     s2.push(100)
     s2.push(200)
     s2.push(300)
@@ -105,3 +283,16 @@ if __name__ == "__main__":
     s2.pop()
     print("Stack size:", s2.size())
     print("Is stack empty?", s2.is_empty())
+
+    print("\nStack using array.array:")
+    s3 = ArrayStack(capacity=4, typecode="q")
+    s3.push_many([1, 2, 3])
+    mark = s3.snapshot()
+    s3.push_many([4, 5, 6])  # Doubles the capacity to 8
+    print("Capacity:", s3.capacity(), "size:", s3.size())
+    s3.rollback(mark)  # Backtrack: drop 4, 5, 6 in O(1)
+    print("After rollback, top element:", s3.peek())
+    print("pop_many(2):", s3.pop_many(2).tolist())
+
+    if "--bench" in sys.argv:
+        benchmark_stacks()
@@ -0,0 +1,68 @@
+"""
+test_external_sort.py
+
+Checks that external_sort never opens more than fan_in run files at once.
+Run with: python -m pytest test_external_sort.py  (or python test_external_sort.py)
+"""
+
+import random
+import unittest
+from operator import itemgetter
+
+import external_sort
+
+
+class CountOpenRuns:
+    """Wraps external_sort._read_run and records the most run files open at once."""
+
+    def __init__(self, read_run):
+        self.read_run = read_run
+        self.open = 0
+        self.most = 0
+
+    def __call__(self, path):
+        self.open += 1
+        self.most = max(self.most, self.open)
+        try:
+            yield from self.read_run(path)
+        finally:
+            self.open -= 1
+
+
+class ExternalSortFanInTest(unittest.TestCase):
+    def setUp(self):
+        self.read_run = external_sort._read_run
+        self.counter = CountOpenRuns(self.read_run)
+        external_sort._read_run = self.counter
+
+    def tearDown(self):
+        external_sort._read_run = self.read_run
+
+    def test_more_runs_than_fan_in(self):
+        data = [random.randrange(1000) for _ in range(20_000)]
+        # ~28 bytes per int and a 4 KB budget: well over a hundred runs
+        result = list(external_sort.external_sort(data, memory_limit=4096, max_workers=1, fan_in=4))
+        self.assertEqual(result, sorted(data))
+        self.assertGreater(self.counter.most, 1)
+        self.assertLessEqual(self.counter.most, 4)
+
+    def test_passes_keep_stability_and_reverse(self):
+        data = [(random.randrange(50), i) for i in range(5_000)]
+        result = list(external_sort.external_sort(data, key=itemgetter(0), reverse=True,
+                                                  memory_limit=4096, max_workers=1, fan_in=3))
+        self.assertEqual(result, sorted(data, key=itemgetter(0), reverse=True))
+        self.assertLessEqual(self.counter.most, 3)
+
+    def test_default_fan_in_follows_memory_limit(self):
+        self.assertEqual(external_sort._fan_in(100 * 1000 * 10, 100), 10)
+        self.assertEqual(external_sort._fan_in(1, 100), 2)
+        self.assertLessEqual(external_sort._fan_in(10**12, 1), external_sort.MAX_FAN_IN)
+
+    def test_fan_in_below_two_is_rejected(self):
+        with self.assertRaises(ValueError):
+            list(external_sort.external_sort(range(10_000, 0, -1), memory_limit=4096,
+                                             max_workers=1, fan_in=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
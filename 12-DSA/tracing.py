@@ -0,0 +1,123 @@
+"""
+tracing.py
+
+Event Hooks for Stacks and Queues
+---------------------------------
+
+The stacks and queues in stacks.py and queues.py used to print() on every
+push/pop/enqueue/dequeue. Printing is far slower than the operation itself,
+so tracing is now off by default and each container takes an optional hook:
+
+    s = StackDeque()                      # silent, only the deque operation
+    s = StackDeque(trace=print_event)     # prints "Pushed: 10" like before
+    s = StackDeque(trace=TraceBuffer())   # keeps the last N events in memory
+
+A hook is any callable hook(container, event, item). Events:
+    push / pop / enqueue / dequeue -> item is the value moved
+    enqueue_many / dequeue_many    -> item is the batch moved, one event per batch
+    overwrite                      -> item is what a full ring buffer dropped
+    empty / full                   -> item is the operation that could not run
+"""
+
+from collections import deque
+
+PAST_TENSE = {
+    "push": "Pushed",
+    "pop": "Popped",
+    "enqueue": "Enqueued",
+    "dequeue": "Dequeued",
+    "enqueue_many": "Enqueued",
+    "dequeue_many": "Dequeued",
+    "overwrite": "Overwrote",
+}
+
+
+def print_event(container, event, item):
+    """Hook that prints the same messages the containers used to print."""
+    if event == "empty":
+        if item == "peek":
+            print(f"{container.kind} is empty!")
+        else:
+            print(f"{container.kind} is empty! Cannot {item}.")
+    elif event == "full":
+        print(f"{container.kind} is full! Cannot {item}.")
+    else:
+        print(f"{PAST_TENSE[event]}: {item}")
+
+
+class TraceBuffer:
+    """
+    Hook that records (container kind, event, item) in a ring buffer,
+    so only the most recent `capacity` events are kept.
+    """
+
+    def __init__(self, capacity=1000):
+        self.events = deque(maxlen=capacity)
+
+    def __call__(self, container, event, item):
+        self.events.append((container.kind, event, item))
+
+    def dump(self):
+        for kind, event, item in self.events:
+            print(f"{kind:<6} {event:<12} {item}")
+
+    def clear(self):
+        self.events.clear()
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_tracing(ops=10**6):
+    """
+    ops/sec of push+pop and enqueue+dequeue pairs with tracing off,
+    recording into a TraceBuffer, and printing (into an in-memory sink).
+    """
+    import contextlib
+    import io
+    import time
+    from queues import QueueDeque, QueueList, RingBufferQueue
+    from stacks import StackDeque, StackList
+
+    def run(container, add, remove):
+        add = getattr(container, add)
+        remove = getattr(container, remove)
+        start = time.perf_counter()
+        for i in range(ops):
+            add(i)
+            remove()
+        return 2 * ops / (time.perf_counter() - start)
+
+    cases = [
+        (StackList, "push", "pop"),
+        (StackDeque, "push", "pop"),
+        (QueueList, "enqueue", "dequeue"),
+        (QueueDeque, "enqueue", "dequeue"),
+        (RingBufferQueue, "enqueue", "dequeue"),
+    ]
+    print(f"{'container':<18}{'no trace':>14}{'TraceBuffer':>14}{'print':>14}   (ops/sec)")
+    for cls, add, remove in cases:
+        silent = run(cls(), add, remove)
+        buffered = run(cls(trace=TraceBuffer()), add, remove)
+        with contextlib.redirect_stdout(io.StringIO()):
+            printed = run(cls(trace=print_event), add, remove)
+        print(f"{cls.__name__:<18}{silent:>14,.0f}{buffered:>14,.0f}{printed:>14,.0f}")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+    from stacks import StackDeque
+
+    trace = TraceBuffer(capacity=3)
+    s = StackDeque(trace=trace)
+    for value in (1, 2, 3, 4):
+        s.push(value)
+    s.pop()
+    print("Last 3 events:")
+    trace.dump()
+
+    if "--bench" in sys.argv:
+        benchmark_tracing()
@@ -0,0 +1,218 @@
+"""
+tree_storage.py
+
+Saving and Memory-Mapping Binary Trees
+--------------------------------------
+
+Rebuilding a big BinaryTree on every start means creating every TreeNode again.
+This module writes a tree to a compact binary file once, and later opens it
+with mmap so the operating system pages nodes in only when they are visited.
+
+File layout (native byte order):
+    header   24 bytes: magic b"BTRE", version, data typecode, byte order,
+             node count, root id
+    data     node count x 8 bytes  (int64 "q" or float64 "d")
+    left     node count x 8 bytes  (int64 child id, -1 = no child)
+    right    node count x 8 bytes
+
+Nodes are numbered in level order (see ArrayBinaryTree.from_binary_tree), so
+every node record has a fixed width and a missing child is the null marker -1.
+Storing the three fields as columns lets memoryview.cast() expose each column
+straight from the mapped file, without unpacking a single record.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from array_tree import ArrayBinaryTree
+
+MAGIC = b"BTRE"
+VERSION = 1
+HEADER = struct.Struct("<4sBcc1xqq")  # magic, version, typecode, byte order, pad, count, root
+TYPECODES = ("q", "d")  # Both are 8 bytes wide
+
+
+def save_tree(tree, path, typecode="q"):
+    """
+    Write a BinaryTree or ArrayBinaryTree with numeric data to path.
+    typecode is "q" for integers or "d" for floats.
+    """
+    if typecode not in TYPECODES:
+        raise ValueError(f"typecode must be one of {TYPECODES}")
+    if not isinstance(tree, ArrayBinaryTree):
+        tree = ArrayBinaryTree.from_binary_tree(tree, typecode=typecode)
+    data = array(typecode, tree.data)  # Raises TypeError for non-numeric data
+    byte_order = b"<" if sys.byteorder == "little" else b">"
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, typecode.encode(), byte_order, len(data), tree.root))
+        f.write(data.tobytes())
+        f.write(array("q", tree.left).tobytes())
+        f.write(array("q", tree.right).tobytes())
+
+
+class MappedBinaryTree(ArrayBinaryTree):
+    """
+    Read-only ArrayBinaryTree whose columns are memoryviews of a mapped file.
+    Opening is O(1): nothing is read until a traversal touches it.
+    Use as a context manager (or call close()) to release the file.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:  # An empty file cannot be mapped
+            self._file.close()
+            raise
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"{path} is not a saved binary tree")
+            magic, version, typecode, byte_order, count, root = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION or typecode.decode() not in TYPECODES:
+                raise ValueError(f"{path} is not a saved binary tree")
+            if byte_order != (b"<" if sys.byteorder == "little" else b">"):
+                raise ValueError(f"{path} was written on a machine with a different byte order")
+            if len(self._mmap) < HEADER.size + 3 * 8 * count:
+                raise ValueError(f"{path} is truncated")
+        except Exception:
+            self._mmap.close()
+            self._file.close()
+            raise
+
+        self.typecode = typecode.decode()
+        self.root = root
+        view = memoryview(self._mmap)
+        start = HEADER.size
+        width = 8 * count
+        self.data = view[start:start + width].cast(self.typecode)
+        self.left = view[start + width:start + 2 * width].cast("q")
+        self.right = view[start + 2 * width:start + 3 * width].cast("q")
+        view.release()
+
+    def add_node(self, data):
+        raise TypeError("MappedBinaryTree is read-only; call to_binary_tree() for a mutable copy")
+
+    def close(self):
+        for column in ("data", "left", "right"):
+            view = getattr(self, column, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_tree(path):
+    """Open a file written by save_tree without deserializing it."""
+    return MappedBinaryTree(path)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_storage(n=10**6):
+    """
+    Cold-start cost of getting a usable tree back from disk:
+    pickle of TreeNode objects, JSON of nested dicts, and load_tree (mmap).
+    "load" is the time until the tree object exists, "load + inorder" adds one
+    full traversal (the mmap version only reads pages at this point).
+    """
+    import json
+    import os
+    import pickle
+    import tempfile
+    import time
+
+    from trees import BinaryTree, TreeNode
+
+    nodes = [TreeNode(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    tree = BinaryTree(None)
+    tree.root = nodes[0]
+
+    def to_dict(i):  # Built from the node ids to avoid recursion over objects
+        if i >= n:
+            return None
+        return {"data": i, "left": to_dict(2 * i + 1), "right": to_dict(2 * i + 2)}
+
+    def from_dict(d):
+        if d is None:
+            return None
+        node = TreeNode(d["data"])
+        node.left = from_dict(d["left"])
+        node.right = from_dict(d["right"])
+        return node
+
+    def load_pickle(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def load_json(path):
+        with open(path) as f:
+            loaded = BinaryTree(None)
+            loaded.root = from_dict(json.load(f))
+            return loaded
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {name: os.path.join(tmp, name) for name in ("tree.pickle", "tree.json", "tree.bin")}
+        with open(paths["tree.pickle"], "wb") as f:
+            pickle.dump(tree, f, pickle.HIGHEST_PROTOCOL)
+        with open(paths["tree.json"], "w") as f:
+            json.dump(to_dict(0), f)
+        save_tree(tree, paths["tree.bin"])
+
+        expected = n * (n - 1) // 2
+        print(f"Complete tree with {n:,} nodes:")
+        print(f"{'format':<10}{'file size':>12}{'load':>10}{'load + inorder':>17}")
+        for name, path, loader in (("pickle", paths["tree.pickle"], load_pickle),
+                                   ("json", paths["tree.json"], load_json),
+                                   ("mmap", paths["tree.bin"], load_tree)):
+            start = time.perf_counter()
+            loaded = loader(path)
+            loaded_at = time.perf_counter()
+            assert sum(loaded.traverse("inorder")) == expected
+            done = time.perf_counter()
+            if name == "mmap":
+                loaded.close()
+            size = os.path.getsize(path) / 2**20
+            print(f"{name:<10}{size:>9.1f} MB{loaded_at - start:>9.3f}s{done - start:>16.3f}s")
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from trees import BinaryTree, TreeNode
+
+    bt = BinaryTree(1)
+    bt.root.left = TreeNode(2)
+    bt.root.right = TreeNode(3)
+    bt.root.left.left = TreeNode(4)
+    bt.root.left.right = TreeNode(5)
+    bt.root.right.left = TreeNode(6)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tree.bin")
+        save_tree(bt, path)
+        print("File size:", os.path.getsize(path), "bytes")
+        with load_tree(path) as mapped:
+            print("Pre-order from the mapped file:", list(mapped.traverse("preorder")))
+            copy = mapped.to_binary_tree()
+        print("Round trip in-order:", list(copy.traverse("inorder")))
+
+    if "--bench" in sys.argv:
+        benchmark_storage()
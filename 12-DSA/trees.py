@@ -14,53 +14,456 @@ Applications:
 - Searching and sorting (BST)
 - Expression parsing
 - Pathfinding algorithms
+
+AVLTree (below BinaryTree) is a self-balancing binary search tree built on
+the same nodes: insert/delete/find in O(log n) instead of O(n).
+
+The traversals are recursive by default. Pass iterative=True to use an explicit
+stack instead (see recursion_tools.py), which works on trees of any depth.
+
+BinaryTree.traverse(order) yields the values lazily instead of printing them,
+so it can feed sum(), itertools.islice() and friends without building a list.
+With morris=True the in/pre-order walks use O(1) extra memory.
 """
+from collections import deque
+
+from recursion_tools import iter_inorder, iter_postorder, iter_preorder
 
 # Node class for binary tree
 class TreeNode:
+    __slots__ = ("data", "left", "right")  # No per-node __dict__
+
     def __init__(self, data):
         self.data = data
         self.left = None
         self.right = None
 
+# -----------------------
+# Lazy traversals
+# -----------------------
+def iter_level_order(root):
+    """Yield nodes level by level. deque.popleft is O(1), unlike list.pop(0)."""
+    queue = deque([root]) if root else deque()
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+
+def _morris_step(node, preorder):
+    """
+    One step of a Morris traversal. Returns (next node, node to visit or None).
+
+    Instead of a stack, the rightmost node of the left subtree (the in-order
+    predecessor) temporarily points back to node. The first time we meet that
+    thread we go left; the second time we remove it and go right.
+    """
+    if node.left is None:
+        return node.right, node
+    pred = node.left
+    while pred.right and pred.right is not node:
+        pred = pred.right
+    if pred.right is None:
+        pred.right = node  # Thread back to node, then walk the left subtree
+        return node.left, (node if preorder else None)
+    pred.right = None  # Left subtree done: remove the thread
+    return node.right, (None if preorder else node)
+
+
+def _morris(root, preorder):
+    node = root
+    try:
+        while node:
+            node, visit = _morris_step(node, preorder)
+            if visit is not None:
+                yield visit
+    finally:
+        # If the caller stops early, finish the walk silently so every
+        # temporary thread is removed and the tree is left unchanged
+        while node:
+            node, _ = _morris_step(node, preorder)
+
+
+def morris_inorder(root):
+    """Yield nodes Left -> Root -> Right with O(1) extra memory."""
+    return _morris(root, preorder=False)
+
+
+def morris_preorder(root):
+    """Yield nodes Root -> Left -> Right with O(1) extra memory."""
+    return _morris(root, preorder=True)
+
+
+TRAVERSALS = {
+    "preorder": iter_preorder,
+    "inorder": iter_inorder,
+    "postorder": iter_postorder,
+    "level_order": iter_level_order,
+}
+
+MORRIS_TRAVERSALS = {
+    "preorder": morris_preorder,
+    "inorder": morris_inorder,
+}
+
+
 # Binary Tree class
 class BinaryTree:
     def __init__(self, root_data):
         self.root = TreeNode(root_data)
 
     # Pre-order traversal: Root -> Left -> Right
-    def preorder(self, node):
-        if node:
+    def preorder(self, node, iterative=False):
+        if iterative:
+            for n in iter_preorder(node):
+                print(n.data, end=" ")
+        elif node:
             print(node.data, end=" ")
             self.preorder(node.left)
             self.preorder(node.right)
 
     # In-order traversal: Left -> Root -> Right
-    def inorder(self, node):
-        if node:
+    def inorder(self, node, iterative=False):
+        if iterative:
+            for n in iter_inorder(node):
+                print(n.data, end=" ")
+        elif node:
             self.inorder(node.left)
             print(node.data, end=" ")
             self.inorder(node.right)
 
     # Post-order traversal: Left -> Right -> Root
-    def postorder(self, node):
-        if node:
+    def postorder(self, node, iterative=False):
+        if iterative:
+            for n in iter_postorder(node):
+                print(n.data, end=" ")
+        elif node:
             self.postorder(node.left)
             self.postorder(node.right)
             print(node.data, end=" ")
 
     # Level-order traversal (Breadth-first)
     def level_order(self):
-        if not self.root:
-            return
-        queue = [self.root]
-        while queue:
-            node = queue.pop(0)
+        for node in iter_level_order(self.root):
             print(node.data, end=" ")
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
+
+    # Lazy traversal: yields values instead of printing them
+    def traverse(self, order="inorder", morris=False):
+        """
+        Yield node values in the given order:
+        "preorder", "inorder", "postorder" or "level_order".
+        morris=True (preorder/inorder only) walks without a stack or queue.
+        """
+        table = MORRIS_TRAVERSALS if morris else TRAVERSALS
+        if order not in table:
+            raise ValueError(f"unsupported traversal: {order!r} (morris={morris})")
+        for node in table[order](self.root):
+            yield node.data
+
+    def __iter__(self):
+        return self.traverse()
+
+
+# -----------------------
+# Balanced Binary Search Tree (AVL)
+# -----------------------
+class AVLNode(TreeNode):
+    """
+    TreeNode whose data is the key, plus:
+        value  - the value stored under the key
+        height - height of the subtree rooted here (leaf = 1)
+        size   - number of nodes in that subtree (for rank/select)
+    """
+    __slots__ = ("value", "height", "size")
+
+    def __init__(self, key, value=None):
+        super().__init__(key)
+        self.value = value
+        self.height = 1
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node else 0
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node):
+    #       node          pivot
+    #       /     \       /    \
+    #    pivot    C  ->  A    node
+    #    /   \                /   \
+    #   A     B              B     C
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Fix the AVL rule (child heights differ by at most 1) at node."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)  # Left-Right case
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)  # Right-Left case
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree(BinaryTree):
+    """
+    Ordered map: keys are kept sorted and the tree height stays O(log n).
+
+    Operations:
+        insert(key, value)   - add or replace               O(log n)
+        delete(key)          - remove, return the value     O(log n)
+        find(key)            - value for key (or default)   O(log n)
+        floor / ceiling      - nearest key <= / >= a key    O(log n)
+        rank(key)            - how many keys are < key      O(log n)
+        select(i)            - i-th smallest key            O(log n)
+        range(lo, hi)        - (key, value) for lo <= key < hi, in order
+        from_sorted(keys)    - build a perfectly balanced tree in O(n)
+
+    The BinaryTree traversals (preorder, inorder, ...) work as before.
+    """
+
+    def __init__(self):
+        self.root = None
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, key):
+        return self._find_node(key) is not None
+
+    # ---- insert / delete
+    def insert(self, key, value=None):
+        self.root = self._insert(self.root, key, value)
+
+    def _insert(self, node, key, value):
+        if node is None:
+            return AVLNode(key, value)
+        if key < node.data:
+            node.left = self._insert(node.left, key, value)
+        elif node.data < key:
+            node.right = self._insert(node.right, key, value)
+        else:
+            node.value = value  # Existing key: replace the value
+            return node
+        return _rebalance(node)
+
+    def delete(self, key):
+        """Remove key and return its value. Raises KeyError if missing."""
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        value = node.value
+        self.root = self._delete(self.root, key)
+        return value
+
+    def _delete(self, node, key):
+        if key < node.data:
+            node.left = self._delete(node.left, key)
+        elif node.data < key:
+            node.right = self._delete(node.right, key)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Two children: take over the in-order successor, then delete it
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.data, node.value = successor.data, successor.value
+            node.right = self._delete(node.right, successor.data)
+        return _rebalance(node)
+
+    # ---- lookups
+    def _find_node(self, key):
+        node = self.root
+        while node:
+            if key < node.data:
+                node = node.left
+            elif node.data < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def find(self, key, default=None):
+        node = self._find_node(key)
+        return node.value if node else default
+
+    def floor(self, key):
+        """Largest key <= key, or None."""
+        node, best = self.root, None
+        while node:
+            if key < node.data:
+                node = node.left
+            else:
+                best = node.data
+                node = node.right
+        return best
+
+    def ceiling(self, key):
+        """Smallest key >= key, or None."""
+        node, best = self.root, None
+        while node:
+            if node.data < key:
+                node = node.right
+            else:
+                best = node.data
+                node = node.left
+        return best
+
+    def rank(self, key):
+        """Number of keys smaller than key."""
+        node, smaller = self.root, 0
+        while node:
+            if key <= node.data:
+                node = node.left
+            else:
+                smaller += _size(node.left) + 1
+                node = node.right
+        return smaller
+
+    def select(self, i):
+        """The i-th smallest key (0-based). Raises IndexError if out of range."""
+        if not 0 <= i < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if i < left:
+                node = node.left
+            elif i == left:
+                return node.data
+            else:
+                i -= left + 1
+                node = node.right
+
+    def range(self, lo=None, hi=None):
+        """
+        Yield (key, value) for lo <= key < hi in sorted order.
+        None means no bound. Subtrees outside the range are never visited.
+        """
+        stack, node = [], self.root
+        while stack or node:
+            if node:
+                if lo is not None and node.data < lo:
+                    node = node.right  # Whole left subtree is below lo
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if hi is not None and not node.data < hi:
+                    return
+                yield node.data, node.value
+                node = node.right
+
+    def items(self):
+        return self.range()
+
+    # ---- bulk build
+    @classmethod
+    def from_sorted(cls, keys, values=None):
+        """
+        Build from strictly increasing keys (and optional matching values).
+        The middle key becomes the root, so the tree is perfectly balanced.
+        """
+        keys = list(keys)
+        values = list(values) if values is not None else [None] * len(keys)
+        if len(values) != len(keys):
+            raise ValueError("keys and values must have the same length")
+        for i in range(1, len(keys)):
+            if not keys[i - 1] < keys[i]:
+                raise ValueError("from_sorted needs strictly increasing keys")
+
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(keys[mid], values[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            _update(node)
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(keys))
+        return tree
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_traversals(n=10**6):
+    """
+    Sum the values of a complete tree with n nodes using every traversal.
+    The printing traversals write into an in-memory buffer for comparison.
+    """
+    import contextlib
+    import io
+    import time
+    import tracemalloc
+
+    nodes = [TreeNode(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    bt = BinaryTree(None)
+    bt.root = nodes[0]
+    del nodes
+
+    print(f"Complete tree with {n:,} nodes:")
+    cases = [(order, False) for order in TRAVERSALS] + [(order, True) for order in MORRIS_TRAVERSALS]
+    for order, morris in cases:
+        tracemalloc.start()
+        start = time.perf_counter()
+        total = sum(bt.traverse(order, morris=morris))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert total == n * (n - 1) // 2
+        name = f"traverse({order!r}{', morris' if morris else ''})"
+        print(f"  {name:<34}{elapsed:>7.3f}s   peak extra memory {peak / 1024:>8.1f} KiB")
+
+    for name in ("preorder", "inorder", "postorder"):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            getattr(bt, name)(bt.root)
+        print(f"  {name + '() printing':<34}{time.perf_counter() - start:>7.3f}s")
 
 
 # -----------------------
@@ -89,3 +492,35 @@ if __name__ == "__main__":
     bt.postorder(bt.root)
     print("\nLevel-order Traversal:")
     bt.level_order()
+
+    print("\nIn-order Traversal (iterative):")
+    bt.inorder(bt.root, iterative=True)
+    print()
+
+    # Lazy traversals plug straight into itertools
+    from itertools import islice
+    print("First 3 pre-order values:", list(islice(bt.traverse("preorder"), 3)))
+    print("Sum of level-order values:", sum(bt.traverse("level_order")))
+    print("Morris in-order:", list(bt.traverse("inorder", morris=True)))
+
+    # AVL tree: inserting sorted keys would make a plain BST a linked list,
+    # but rotations keep the height logarithmic
+    avl = AVLTree()
+    for price in [10, 20, 30, 40, 50, 60, 70]:
+        avl.insert(price, f"item-{price}")
+    print("\nAVL root after sorted inserts:", avl.root.data, "height:", avl.root.height)
+    print("find(40):", avl.find(40))
+    print("floor(45):", avl.floor(45), "ceiling(45):", avl.ceiling(45))
+    print("rank(50):", avl.rank(50), "select(0):", avl.select(0))
+    print("range(20, 50):", [key for key, _ in avl.range(20, 50)])
+    avl.delete(40)
+    print("In-order after deleting 40:")
+    avl.inorder(avl.root)
+    print()
+
+    balanced = AVLTree.from_sorted(range(1, 16))
+    print("from_sorted(1..15) root:", balanced.root.data, "height:", balanced.root.height)
+
+    import sys
+    if "--bench" in sys.argv:
+        benchmark_traversals()
@@ -0,0 +1,278 @@
+"""
+typed_array.py
+
+Typed Numeric Array in Python
+-----------------------------
+
+arrays.py keeps numbers in a list. Every list slot is a pointer to a separate
+int object (about 8 + 28 bytes per number). TypedArray stores the raw values
+in an array.array instead (8 bytes per number for typecode "q" or "d"):
+
+    list          [ptr, ptr, ptr]  ->  int objects elsewhere in memory
+    TypedArray    [10 | 20 | 30]       raw machine numbers, side by side
+
+- Same operations as arrays.py: append, insert, remove, pop, sort, reverse, in
+- arr[a:b] returns a memoryview: a window on the same memory, nothing copied
+- NumPy can use the buffer directly: numpy.asarray(arr) shares the memory
+- Bulk operations (add, multiply, sum, min, max, count) run as one
+  vectorized NumPy call when NumPy is installed, in plain Python otherwise
+
+An array.array cannot change size while a memoryview or NumPy array is still
+looking at it (BufferError). Release slices before append/insert/remove/pop:
+
+    with arr[0:100] as window:
+        ...
+"""
+
+import operator
+from array import array
+
+import numeric_backend
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class TypedArray:
+    __slots__ = ("data",)
+
+    def __init__(self, values=(), typecode="q"):
+        """
+        values   - any iterable of numbers, or a buffer (array.array, NumPy array)
+        typecode - array.array typecode, "q" (int64) and "d" (float64) are the usual ones
+        """
+        if typecode not in numeric_backend.NUMERIC_TYPECODES:
+            raise ValueError(f"typecode must be one of {numeric_backend.NUMERIC_TYPECODES!r}")
+        self.data = array(typecode)
+        self.extend(values)
+
+    @property
+    def typecode(self):
+        return self.data.typecode
+
+    # -----------------------
+    # The operations from arrays.py
+    # -----------------------
+    def append(self, value):
+        self.data.append(value)
+
+    def extend(self, values):
+        """Add many values. NumPy arrays and same-typecode arrays are copied in C."""
+        if np is not None and isinstance(values, np.ndarray):
+            self.data.frombytes(values.astype(self.typecode, copy=False).tobytes())
+        elif isinstance(values, array) and values.typecode != self.typecode:
+            self.data.extend(values.tolist())
+        else:
+            self.data.extend(values)
+
+    def insert(self, index, value):
+        self.data.insert(index, value)
+
+    def remove(self, value):
+        """Remove the first occurrence of value (ValueError if missing)."""
+        self.data.remove(value)
+
+    def pop(self, index=-1):
+        return self.data.pop(index)
+
+    def index(self, value):
+        """Position of the first occurrence of value (ValueError if missing)."""
+        position = numeric_backend.linear_search(self.data, value)
+        if position == -1:
+            raise ValueError(f"{value!r} is not in TypedArray")
+        return position
+
+    def __contains__(self, value):
+        return numeric_backend.linear_search(self.data, value) != -1
+
+    def sort(self, reverse=False):
+        numeric_backend.sort(self.data, reverse=reverse)
+
+    def reverse(self):
+        self.data.reverse()
+
+    def __getitem__(self, index):
+        """An int gives one number, a slice gives a zero-copy memoryview."""
+        if isinstance(index, slice):
+            return memoryview(self.data)[index]
+        return self.data[index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.data[index] = array(self.typecode, value)
+        else:
+            self.data[index] = value
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __eq__(self, other):
+        if isinstance(other, TypedArray):
+            return self.data == other.data
+        if isinstance(other, (list, array)):
+            return self.data.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TypedArray({self.data.tolist()}, typecode={self.typecode!r})"
+
+    def tolist(self):
+        return self.data.tolist()
+
+    def nbytes(self):
+        return len(self.data) * self.data.itemsize
+
+    # -----------------------
+    # Buffer interop
+    # -----------------------
+    def to_numpy(self):
+        """
+        NumPy array sharing this array's memory (writes go both ways).
+        Delete it before changing the size of the TypedArray.
+        """
+        if np is None:
+            raise ImportError("to_numpy() needs NumPy")
+        return np.frombuffer(self.data, dtype=self.typecode)
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        NumPy protocol: a view by default, a separate array with copy=True.
+        copy=False raises ValueError when dtype needs a conversion (a copy).
+        """
+        view = self.to_numpy()
+        if dtype is not None and np.dtype(dtype) != view.dtype:
+            if copy is False:
+                raise ValueError(f"converting to {np.dtype(dtype)} needs a copy")
+            return view.astype(dtype)
+        return view.copy() if copy else view
+
+    # -----------------------
+    # Vectorized bulk operations
+    # -----------------------
+    def _apply(self, op, other):
+        """data = op(data, other) element by element, in place."""
+        if np is not None:
+            view = self.to_numpy()
+            op(view, np.asarray(other), out=view)
+        elif isinstance(other, (int, float)):
+            self.data[:] = array(self.typecode, [op(x, other) for x in self.data])
+        else:
+            self.data[:] = array(self.typecode, map(op, self.data, other))
+
+    def add(self, other):
+        """Add a number (or same-length sequence) to every element, in place."""
+        self._apply(np.add if np is not None else operator.add, other)
+
+    def multiply(self, other):
+        """Multiply every element by a number (or same-length sequence), in place."""
+        self._apply(np.multiply if np is not None else operator.mul, other)
+
+    def sum(self):
+        if np is not None:
+            return self.to_numpy().sum().item()
+        return sum(self.data)
+
+    def min(self):
+        if np is not None:
+            return self.to_numpy().min().item()
+        return min(self.data)
+
+    def max(self):
+        if np is not None:
+            return self.to_numpy().max().item()
+        return max(self.data)
+
+    def count(self, value):
+        if np is not None:
+            return int(np.count_nonzero(self.to_numpy() == value))
+        return self.data.count(value)
+
+
+# -----------------------
+# Benchmark
+# -----------------------
+def benchmark_typed_array(n=10**7):
+    """
+    Memory and time for n integers as a list (the arrays.py way) and as a
+    TypedArray: building, "x in arr" for a missing value, sum, add 1, sort.
+    """
+    import random
+    import time
+    import tracemalloc
+
+    missing = -1
+
+    def timed(run):
+        start = time.perf_counter()
+        run()
+        return time.perf_counter() - start
+
+    def measured(build):
+        tracemalloc.start()
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, size
+
+    print(f"{n:,} integers" + ("" if np is not None else " (NumPy not installed)") + ":")
+    print(f"{'':<12}{'MB':>8}{'in':>9}{'sum':>9}{'add 1':>9}{'sort':>9}")
+
+    # Building inside tracemalloc counts the int objects the list points to
+    lst, size = measured(lambda: [random.randrange(n) for _ in range(n)])
+
+    def list_add():
+        lst[:] = [x + 1 for x in lst]
+
+    row = [timed(lambda: missing in lst), timed(lambda: sum(lst)), timed(list_add), timed(lst.sort)]
+    print(f"{'list':<12}{size / 2**20:>8.1f}" + "".join(f"{t:>8.3f}s" for t in row))
+
+    typed, size = measured(lambda: TypedArray(lst))
+    del lst
+    row = [timed(lambda: missing in typed), timed(typed.sum), timed(lambda: typed.add(1)),
+           timed(typed.sort)]
+    print(f"{'TypedArray':<12}{size / 2**20:>8.1f}" + "".join(f"{t:>8.3f}s" for t in row))
+
+
+# -----------------------
+# Example Usage
+# -----------------------
+if __name__ == "__main__":
+    import sys
+
+    # The same steps as arrays.py
+    arr = TypedArray([10, 20, 30, 40, 50])
+    print("Initial array:", arr)
+    print("First element:", arr[0])
+    print("Last element:", arr[-1])
+    arr.append(60)
+    arr.insert(2, 25)
+    arr.remove(40)
+    print("Deleted value at index 3:", arr.pop(3))
+    arr[1] = 22
+    print("After updates:", arr)
+    print("30 in array?", 30 in arr)
+    arr.sort()
+    print("Sorted array:", arr)
+    arr.reverse()
+    print("Reversed array:", arr)
+
+    with arr[1:4] as window:  # No copy: a view on the same memory
+        print("Slice [1:4] as a memoryview:", window.tolist())
+
+    arr.add(1)
+    arr.multiply(2)
+    print("After add(1) and multiply(2):", arr)
+    print("Sum / min / max:", arr.sum(), arr.min(), arr.max())
+    if np is not None:
+        view = np.asarray(arr)
+        view[0] = 0  # Writes into the TypedArray
+        print("Changed through NumPy:", arr)
+        del view
+
+    if "--bench" in sys.argv:
+        benchmark_typed_array()